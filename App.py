@@ -1,443 +1,1286 @@
 import os
-from flask import Flask, render_template, request
-import PyPDF2
-import docx
+import time
+import contextlib
+import functools
+import json
 import io
 import re # For regular expressions
-import spacy
-from spellchecker import SpellChecker # For spell checking
-import textstat # For readability
+import resource
 from datetime import datetime # For current year in footer
 
-# --- Configuration ---
+# --- Startup Timing ---
+# Wall time of every import and load step, so slow cold starts can be traced to one step.
+# Reported on /metrics and logged by gunicorn.conf.py once the preloaded app is ready.
+STARTUP_TIMINGS = {}
+_startup_started = time.perf_counter()
+
+@contextlib.contextmanager
+def startup_step(name):
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        STARTUP_TIMINGS[name] = time.perf_counter() - started
+
+def startup_report():
+    steps = ", ".join(f"{name} {seconds:.2f}s" for name, seconds in STARTUP_TIMINGS.items())
+    peak_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return f"Startup: {steps} (peak RSS {peak_rss_mb:.0f} MB, pid {os.getpid()})"
+
+with startup_step('import flask'):
+    from flask import Flask, render_template, request, jsonify, Response, stream_with_context, url_for, g, has_request_context
+with startup_step('import spacy'):
+    import spacy
+with startup_step('import spellchecker'):
+    from spellchecker import SpellChecker # For spell checking
+with startup_step('import readability'):
+    from readability import merge_readability_counts, readability_counts, readability_scores
+# PyPDF2 and python-docx are only needed for their own upload type and are imported on first use
+from keyword_matcher import PhraseScanner
+from lexical_scan import scan_lexical_features
+from worker_pool import AnalysisPool, PoolBusyError, PoolTimeoutError
+from jobs import JobStore, JobRunner
+from admission import AdmissionController, AdmissionRejected
+from result_cache import create_result_cache, section_cache_key, upload_digest_cache_key, text_cache_key
+from uploads import SpoolingRequest, open_mapped, spool_path, stream_sha256
+from jd_matching import VectorIndex, hashed_term_counts, resume_key
+from records import calculate_resume_score, examples, message, render_feedback, score_batch, score_inputs_array
+from metrics import (Histogram, RequestProfiler, call_collecting, collect_stage_timings, merge_pool_counters,
+                     merge_stage_timings, pool_counters, register_counters, render_metric, server_timing_header,
+                     stage, start_stage_timings, timed)
 try:
-    nlp = spacy.load("en_core_web_sm")
-except OSError:
-    # If the model is not found, it's a setup issue for a deployed app.
-    # The original RuntimeError is good. The print/download lines were unreachable.
+    import orjson # Optional: several times faster than json for the API payloads
+except ImportError:
+    orjson = None
+
+# --- Configuration ---
+# Pipeline profiles: the checks only read POS tags, lemmas, like_num and sentence boundaries,
+# so components nobody reads are excluded to cut model-load time and per-document CPU.
+#   full - the model as shipped
+#   fast - drops NER (nothing reads doc.ents, output is identical to 'full')
+#   lean - also swaps the dependency parser for the much cheaper statistical sentence segmenter. Not
+#          equivalent: its sentence boundaries can differ from the parser's, and quantified achievements
+#          are counted per sentence, so scores can drift from 'full' (see tests/test_pipeline_profiles.py)
+SPACY_MODEL_NAME = "en_core_web_sm"
+SPACY_PIPELINE_PROFILES = {
+    'full': {'exclude': [], 'enable': []},
+    'fast': {'exclude': ["ner"], 'enable': []},
+    'lean': {'exclude': ["ner", "parser"], 'enable': ["senter"]},
+}
+SPACY_PIPELINE_PROFILE = os.environ.get('SPACY_PIPELINE_PROFILE', 'fast')
+if SPACY_PIPELINE_PROFILE not in SPACY_PIPELINE_PROFILES:
     raise RuntimeError(
-        "spaCy model 'en_core_web_sm' not found. "
-        "Ensure it is included in your deployment environment (e.g., in build steps or requirements)."
+        f"Unknown SPACY_PIPELINE_PROFILE '{SPACY_PIPELINE_PROFILE}'. "
+        f"Choose one of: {', '.join(SPACY_PIPELINE_PROFILES)}."
     )
 
+def load_nlp(profile=SPACY_PIPELINE_PROFILE):
+    options = SPACY_PIPELINE_PROFILES[profile]
+    try:
+        pipeline = spacy.load(SPACY_MODEL_NAME, exclude=options['exclude'])
+    except OSError:
+        # If the model is not found, it's a setup issue for a deployed app.
+        raise RuntimeError(
+            f"spaCy model '{SPACY_MODEL_NAME}' not found. "
+            "Ensure it is included in your deployment environment (e.g., in build steps or requirements)."
+        )
+    for name in options['enable']:
+        pipeline.enable_pipe(name)
+    return pipeline
+
+with startup_step('load spacy model'):
+    nlp = load_nlp()
+
 app = Flask(__name__)
+# Uploads are hashed while they are received and large ones are spooled to disk (see uploads.py)
+app.request_class = SpoolingRequest
 # It's good practice to get configurations from environment variables in production
-app.config['UPLOAD_FOLDER'] = os.environ.get('UPLOAD_FOLDER', 'uploads')
+app.config['UPLOAD_FOLDER'] = os.environ.get('UPLOAD_FOLDER', 'uploads')  # spool area for large uploads
+app.config['UPLOAD_SPOOL_THRESHOLD'] = int(os.environ.get('UPLOAD_SPOOL_THRESHOLD', 512 * 1024))  # bytes kept in memory per request
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16 MB max upload size
-
-# Ensure upload folder exists (optional, consider if needed in a stateless environment)
+app.config['SPACY_PIPELINE_PROFILE'] = SPACY_PIPELINE_PROFILE
+# Batch analysis: how many docs spaCy buffers per batch and, for analyze_resumes_batch callers outside the web
+# app (e.g. benchmarks), how many processes it fans out to. /analyze/batch parses in the analysis pool instead.
+app.config['NLP_BATCH_SIZE'] = int(os.environ.get('NLP_BATCH_SIZE', 32))
+app.config['NLP_N_PROCESS'] = int(os.environ.get('NLP_N_PROCESS', os.cpu_count() or 1))
+
+# Early-exit limits for PDF extraction so pathological uploads can't monopolise a worker
+app.config['PDF_MAX_PAGES'] = int(os.environ.get('PDF_MAX_PAGES', 50))
+app.config['PDF_MAX_CHARS'] = int(os.environ.get('PDF_MAX_CHARS', 200000))
+app.config['PDF_PAGE_TIME_BUDGET'] = float(os.environ.get('PDF_PAGE_TIME_BUDGET', 5.0))  # seconds per page
+# PDFs with at least this many pages to read are split into page ranges extracted across the analysis pool
+app.config['PDF_PARALLEL_MIN_PAGES'] = int(os.environ.get('PDF_PARALLEL_MIN_PAGES', 12))
+
+# Process pool for extraction and analysis: 0 workers runs everything inline in the request thread
+app.config['ANALYSIS_POOL_WORKERS'] = int(os.environ.get('ANALYSIS_POOL_WORKERS', 2))
+app.config['ANALYSIS_POOL_QUEUE_DEPTH'] = int(os.environ.get('ANALYSIS_POOL_QUEUE_DEPTH', 8))
+app.config['ANALYSIS_JOB_TIMEOUT'] = float(os.environ.get('ANALYSIS_JOB_TIMEOUT', 30))  # seconds
+# One budget for all pool jobs of a request (PDF page ranges, extraction, analysis). gunicorn.conf.py reads
+# the same variable and sets the worker timeout above it, so a slow request gets a 504 instead of a killed worker.
+app.config['ANALYSIS_REQUEST_TIMEOUT'] = float(os.environ.get('ANALYSIS_REQUEST_TIMEOUT', 60))  # seconds
+
+# Asynchronous job queue (POST /jobs): SQLite file shared by all workers on the host
+app.config['JOB_DB_PATH'] = os.environ.get('JOB_DB_PATH', 'cache/jobs.sqlite3')
+app.config['JOB_RUNNER_THREADS'] = int(os.environ.get('JOB_RUNNER_THREADS', 1))
+app.config['JOB_RETENTION'] = int(os.environ.get('JOB_RETENTION', 24 * 3600))  # seconds finished jobs are kept
+app.config['JOB_STREAM_TIMEOUT'] = float(os.environ.get('JOB_STREAM_TIMEOUT', 300))  # seconds one /jobs/<id>/events stream stays open
+
+# Instrumentation: per-stage timings are always exported on /metrics; SERVER_TIMING=1 also returns them
+# in a Server-Timing response header. PROFILE_SAMPLE_PERCENT runs that share of requests under cProfile.
+app.config['SERVER_TIMING'] = os.environ.get('SERVER_TIMING', '0') == '1'
+app.config['PROFILE_SAMPLE_PERCENT'] = float(os.environ.get('PROFILE_SAMPLE_PERCENT', 0))
+app.config['PROFILE_DIR'] = os.environ.get('PROFILE_DIR', 'profiles')
+
+# Set by gunicorn.conf.py when preloading: the master only loads the app, each forked worker starts its own pool
+app.config['DEFER_BACKGROUND_START'] = os.environ.get('DEFER_BACKGROUND_START', '0') == '1'
+
+# Upper bound on cached word -> known/unknown spell-check verdicts
+app.config['SPELL_CACHE_SIZE'] = int(os.environ.get('SPELL_CACHE_SIZE', 50000))
+
+# Cache of analysis results keyed by upload/text hash: 'memory' (per worker), 'disk' (shared SQLite file) or 'none'
+app.config['RESULT_CACHE_BACKEND'] = os.environ.get('RESULT_CACHE_BACKEND', 'memory')
+app.config['RESULT_CACHE_MAX_ENTRIES'] = int(os.environ.get('RESULT_CACHE_MAX_ENTRIES', 512))
+app.config['RESULT_CACHE_TTL'] = int(os.environ.get('RESULT_CACHE_TTL', 3600))  # seconds
+app.config['RESULT_CACHE_PATH'] = os.environ.get('RESULT_CACHE_PATH', 'cache/results.sqlite3')
+
+# Job description matching: memory-mapped resume vector index shared by all workers
+app.config['JD_INDEX_PATH'] = os.environ.get('JD_INDEX_PATH', 'cache/jd_index')
+app.config['JD_INDEX_DIMENSIONS'] = int(os.environ.get('JD_INDEX_DIMENSIONS', 8192))  # fixed once the index exists
+app.config['JD_SKILL_WEIGHT'] = float(os.environ.get('JD_SKILL_WEIGHT', 0.4))  # share of the match score from skill overlap
+app.config['JD_MATCH_TOP_K'] = int(os.environ.get('JD_MATCH_TOP_K', 20))
+
+# Re-analyze only the sections of a resume that changed since it was last seen (needs a result cache to pay off).
+# Off by default: action verb and achievement counts are approximate on this path (see Incremental Section Analysis).
+app.config['INCREMENTAL_ANALYSIS'] = os.environ.get('INCREMENTAL_ANALYSIS', '0') == '1'
+
+# Admission control for upload endpoints: per-client token buckets and in-flight slots in a SQLite file
+# shared by all workers on the host. A request costs 1 token plus 1 per ADMISSION_BYTES_PER_TOKEN uploaded;
+# uploads of ADMISSION_SLOW_LANE_BYTES or more, and PDFs of ADMISSION_SLOW_LANE_PAGES or more, use the slow lane.
+app.config['ADMISSION_CONTROL'] = os.environ.get('ADMISSION_CONTROL', '1') == '1'
+app.config['ADMISSION_DB_PATH'] = os.environ.get('ADMISSION_DB_PATH', 'cache/admission.sqlite3')
+app.config['ADMISSION_RATE'] = float(os.environ.get('ADMISSION_RATE', 0.5))  # tokens per second per client
+app.config['ADMISSION_BURST'] = float(os.environ.get('ADMISSION_BURST', 10))
+app.config['ADMISSION_BYTES_PER_TOKEN'] = int(os.environ.get('ADMISSION_BYTES_PER_TOKEN', 1024 * 1024))
+app.config['ADMISSION_MAX_IN_FLIGHT'] = int(os.environ.get('ADMISSION_MAX_IN_FLIGHT', 8))
+app.config['ADMISSION_SLOW_LANE_SLOTS'] = int(os.environ.get('ADMISSION_SLOW_LANE_SLOTS', 1))
+app.config['ADMISSION_SLOW_LANE_BYTES'] = int(os.environ.get('ADMISSION_SLOW_LANE_BYTES', 4 * 1024 * 1024))
+app.config['ADMISSION_SLOW_LANE_PAGES'] = int(os.environ.get('ADMISSION_SLOW_LANE_PAGES', 10))
+app.config['ADMISSION_LEASE_TIMEOUT'] = float(os.environ.get('ADMISSION_LEASE_TIMEOUT', 300))  # seconds before a lost slot is reclaimed
+# Clients are told apart by address. Behind the platform's router every request comes from the router, so the
+# client is read from the header it sets instead; ADMISSION_PROXY_HOPS is the number of proxies in front of the
+# app (0 uses the peer address, e.g. when clients connect directly and could forge the header).
+app.config['ADMISSION_CLIENT_HEADER'] = os.environ.get('ADMISSION_CLIENT_HEADER', 'X-Forwarded-For')
+app.config['ADMISSION_PROXY_HOPS'] = int(os.environ.get('ADMISSION_PROXY_HOPS', 1))
+
+result_cache = create_result_cache(
+    app.config['RESULT_CACHE_BACKEND'],
+    max_entries=app.config['RESULT_CACHE_MAX_ENTRIES'],
+    ttl=app.config['RESULT_CACHE_TTL'],
+    path=app.config['RESULT_CACHE_PATH'],
+)
+
+# Ensure the upload spool folder exists
 if not os.path.exists(app.config['UPLOAD_FOLDER']):
     os.makedirs(app.config['UPLOAD_FOLDER'])
 
+# --- Shared Spell Checker ---
+# Loading the frequency dictionary is expensive, so one instance is built at startup and shared by all requests.
+# Tech terms and acronyms are merged in as known words instead of being filtered out after every check.
+COMMON_TECH_TERMS_OR_ACRONYMS = {
+    "aws", "gcp", "api", "sdk", "cicd", "devops", "sql", "nosql", "html", "css", "json", "uiux", "erp", "crm",
+    "saas", "paas", "iaas", "agile", "scrum", "kanban", "jira", "git", "github", "kubernetes", "k8s",
+    "microservices", "blockchain", "fintech", "edtech", "healthtech", "iot", "arvr", "aiops", "mlops"
+}
+with startup_step('load spell dictionary'):
+    spell_checker = SpellChecker()
+    spell_checker.word_frequency.load_words(COMMON_TECH_TERMS_OR_ACRONYMS)
+
+@functools.lru_cache(maxsize=app.config['SPELL_CACHE_SIZE'])
+def is_unknown_word(word):
+    # Resumes share most of their vocabulary, so verdicts are cached per word
+    return bool(spell_checker.unknown([word]))
+
+def spell_cache_counters():
+    info = is_unknown_word.cache_info()
+    return {'hits': info.hits, 'misses': info.misses, 'size': info.currsize}
+
+# With the analysis pool on, lookups happen in the pool processes; their counts come back with each job
+register_counters('spell_cache', spell_cache_counters)
+
+def spell_cache_stats():
+    # This process's cache plus what its pool jobs reported. 'size' adds up the entries each pool process
+    # added (less evictions), so it overcounts after the pool has been recycled.
+    local, pooled = spell_cache_counters(), pool_counters('spell_cache')
+    hits, misses = local['hits'] + pooled.get('hits', 0), local['misses'] + pooled.get('misses', 0)
+    lookups = hits + misses
+    return {
+        'hits': hits,
+        'misses': misses,
+        'size': local['size'] + pooled.get('size', 0),
+        'max_size': is_unknown_word.cache_info().maxsize,
+        'hit_ratio': hits / lookups if lookups else 0.0,
+    }
+
 # --- Helper Functions for Text Extraction ---
-def extract_text_from_pdf(file_stream):
-    text = ""
+def iter_pdf_pages(reader, start, stop):
+    # Extracts pages [start, stop) one at a time, yielding (page_text, seconds) for each
+    for index in range(start, stop):
+        started = time.perf_counter()
+        page_text = reader.pages[index].extract_text()
+        yield page_text, time.perf_counter() - started
+
+def iter_pdf_page_text(page_results, total_pages, max_pages, max_chars, page_time_budget, notices, page_timings=None):
+    # Takes (page_text, seconds) for pages 1..min(total_pages, max_pages) in order, either extracted lazily
+    # (serial) or already extracted (parallel), yields the page text and stops at the first limit hit,
+    # recording why in notices. Per-page timings are appended to page_timings as (page_number, seconds).
+    pages_to_read = min(total_pages, max_pages)
+    chars_extracted = 0
+    for page_number, (page_text, elapsed) in enumerate(page_results, start=1):
+        if page_timings is not None:
+            page_timings.append((page_number, elapsed))
+        if page_text:
+            if chars_extracted + len(page_text) > max_chars:
+                yield page_text[:max_chars - chars_extracted]
+                notices.append(f"Warning: Text extraction stopped after {max_chars} characters (page {page_number} of {total_pages}). Only that part of the document was analyzed.")
+                return
+            chars_extracted += len(page_text)
+            yield page_text
+        # Skipped pages are counted within the page limit; pages past it get their own notice below
+        if elapsed > page_time_budget and page_number < pages_to_read:
+            notices.append(f"Warning: Page {page_number} took {elapsed:.1f}s to read, so extraction stopped there ({pages_to_read - page_number} page(s) skipped). Simplify the PDF or export it again as plain text.")
+            break
+    if total_pages > max_pages:
+        notices.append(f"Warning: Only the first {max_pages} of {total_pages} pages were analyzed. Most resumes should be 1-2 pages.")
+
+def extract_text_from_pdf(file_stream, notices=None, page_timings=None):
+    import PyPDF2 # Lazy: cached in sys.modules after the first PDF
+    notices = notices if notices is not None else []
     try:
         reader = PyPDF2.PdfReader(file_stream)
-        for page in reader.pages:
-            page_text = page.extract_text()
-            if page_text:
-                text += page_text + "\n"
+        total_pages = len(reader.pages)
+        max_pages = app.config['PDF_MAX_PAGES']
+        pages = iter_pdf_page_text(iter_pdf_pages(reader, 0, min(total_pages, max_pages)),
+                                   total_pages=total_pages,
+                                   max_pages=max_pages,
+                                   max_chars=app.config['PDF_MAX_CHARS'],
+                                   page_time_budget=app.config['PDF_PAGE_TIME_BUDGET'],
+                                   notices=notices,
+                                   page_timings=page_timings)
+        text = "".join(page_text + "\n" for page_text in pages)
     except Exception as e:
         return None, f"Error reading PDF: {str(e)}"
     return text, None
 
 def extract_text_from_docx(file_stream):
-    text = ""
+    # Body, tables, text boxes, headers and footers in one streaming pass (see docx_text.py)
+    from docx_text import extract_docx_text # Lazy: lxml is only needed for DOCX uploads
     try:
-        doc = docx.Document(file_stream)
-        for para in doc.paragraphs:
-            text += para.text + "\n"
+        text = extract_docx_text(file_stream)
     except Exception as e:
         return None, f"Error reading DOCX: {str(e)}"
     return text, None
 
+@timed
+def extract_text_from_upload(filename, file_stream, notices=None, page_timings=None):
+    if filename.lower().endswith('.pdf'):
+        return extract_text_from_pdf(file_stream, notices, page_timings)
+    elif filename.lower().endswith('.docx'):
+        return extract_text_from_docx(file_stream)
+    return None, "Unsupported file type. Please upload a PDF or DOCX file."
+
+# --- Keyword Vocabularies ---
+# Built once at import: frozensets for per-token lookups, plus one PhraseScanner that finds every
+# heading and multi-word skill in a single pass, so a resume costs O(tokens) rather than O(tokens x vocabulary).
+ACTION_VERBS = frozenset([
+    "accelerated", "achieved", "acquired", "adapted", "administered", "advanced", "advised", "advocated", "aided", "allocated", "analyzed", "anticipated", "applied", "appraised", "approved", "arbitrated", "arranged", "articulated", "assembled", "assessed", "assigned", "assisted", "attained", "audited", "augmented", "authored", "authorized", "automated", "awarded",
+    "balanced", "benchmarked", "boosted", "briefed", "broadened", "budgeted", "built",
+    "calculated", "cataloged", "centralized", "chaired", "championed", "changed", "clarified", "classified", "coached", "coded", "collaborated", "collected", "combined", "comforted", "commanded", "communicated", "compared", "compiled", "completed", "composed", "computed", "conceived", "conceptualized", "condensed", "conducted", "configured", "conserved", "consolidated", "constructed", "consulted", "contacted", "contributed", "controlled", "converted", "convinced", "cooperated", "coordinated", "corrected", "corresponded", "counseled", "created", "critiqued", "cultivated", "customized", "cut",
+    "debugged", "decentralized", "decreased", "dedicated", "deduced", "defined", "delegated", "delivered", "demonstrated", "designed", "detected", "determined", "developed", "devised", "diagnosed", "differentiated", "directed", "disciplined", "discovered", "dispensed", "displayed", "disproved", "dissected", "distributed", "diversified", "documented", "doubled", "drafted", "dramatized",
+    "earned", "edited", "educated", "effected", "elicited", "eliminated", "enabled", "encouraged", "endorsed", "engineered", "enhanced", "enlarged", "enlisted", "ensured", "entertained", "established", "estimated", "evaluated", "examined", "exceeded", "executed", "exercised", "exhibited", "expanded", "expedited", "experimented", "explained", "explored", "expressed", "extended", "extracted",
+    "fabricated", "facilitated", "familiarized", "fashioned", "filed", "financed", "fixed", "focused", "forecasted", "formalized", "formed", "formulated", "fostered", "founded", "framed", "fulfilled", "functioned", "furnished",
+    "gained", "gathered", "gauged", "generated", "governed", "graded", "granted", "greeted", "grouped", "grew", "guided",
+    "halved", "handled", "harmonized", "harnessed", "headed", "helped", "hired", "hosted", "hypothesized",
+    "identified", "ignited", "illustrated", "imagined", "implemented", "improved", "improvised", "inaugurated", "incorporated", "increased", "indexed", "indicated", "individualized", "induced", "influenced", "informed", "initiated", "innovated", "inspected", "inspired", "installed", "instigated", "instituted", "instructed", "insured", "integrated", "intensified", "interacted", "interpreted", "interviewed", "introduced", "invented", "inventoried", "invested", "investigated", "involved", "isolated", "issued",
+    "joined", "judged", "justified",
+    "kept",
+    "launched", "learned", "lectured", "led", "licensed", "listened", "lobbied", "localized", "located", "logged",
+    "machined", "made", "maintained", "managed", "manipulated", "manufactured", "mapped", "marketed", "mastered", "maximized", "measured", "mediated", "mentored", "merged", "met", "minimized", "mobilized", "modeled", "moderated", "modernized", "modified", "molded", "monitored", "motivated", "moved", "multiplied",
+    "narrated", "navigated", "negotiated", "networked", "neutralized", "nominated", "normalized", "notified", "nurtured",
+    "observed", "obtained", "offered", "offset", "opened", "operated", "optimized", "orchestrated", "ordered", "organized", "oriented", "originated", "outlined", "overcame", "overhauled", "oversaw",
+    "packaged", "painted", "participated", "partnered", "patented", "perceived", "performed", "persuaded", "phased", "photographed", "piloted", "pinpointed", "pioneered", "placed", "planned", "played", "polled", "popularized", "positioned", "predicted", "prepared", "prescribed", "presented", "preserved", "presided", "prevented", "printed", "prioritized", "probed", "processed", "procured", "produced", "profiled", "programmed", "projected", "promoted", "proofread", "proposed", "protected", "proved", "provided", "publicized", "published", "pulled", "purchased", "pursued",
+    "qualified", "quantified", "queried", "questioned", "quoted",
+    "raised", "rallied", "ran", "ranked", "rated", "reached", "read", "realigned", "rebuilt", "received", "recognized", "recommended", "reconciled", "reconstructed", "recorded", "recovered", "recruited", "rectified", "redesigned", "reduced", "reengineered", "referred", "refined", "refocused", "reformed", "regulated", "rehabilitated", "reinforced", "reinstated", "related", "relayed", "released", "relieved", "remediated", "remodeled", "rendered", "renegotiated", "renovated", "reorganized", "repaired", "replaced", "replenished", "replicated", "reported", "represented", "reprogrammed", "researched", "reshaped", "resolved", "responded", "restored", "restructured", "resulted", "retained", "retooled", "retrieved", "revamped", "reversed", "reviewed", "revised", "revitalized", "rewarded", "routed", "ran",
+    "safeguarded", "salvaged", "saved", "scanned", "scheduled", "schemed", "screened", "scripted", "scrutinized", "sculpted", "searched", "secured", "segmented", "selected", "separated", "sequenced", "served", "serviced", "set", "settled", "shaped", "shared", "sharpened", "shipped", "shortened", "showcased", "shrank", "simplified", "simulated", "sketched", "sold", "solidified", "solved", "sorted", "sought", "sparked", "spearheaded", "specialized", "specified", "speculated", "spoke", "sponsored", "stabilized", "staffed", "staged", "standardized", "started", "steered", "stimulated", "stopped", "strategized", "streamlined", "strengthened", "stressed", "stretched", "structured", "studied", "submitted", "substituted", "succeeded", "suggested", "summarized", "superseded", "supervised", "supplied", "supported", "surpassed", "surveyed", "sustained", "symbolized", "synchronized", "synthesized", "systematized",
+    "tabulated", "tackled", "tailored", "targeted", "taught", "teamed", "terminated", "tested", "testified", "tightened", "timed", "traced", "tracked", "traded", "trained", "transacted", "transcribed", "transferred", "transformed", "translated", "transmitted", "transported", "traveled", "treated", "trimmed", "tripled", "troubleshot", "tutored", "typed",
+    "uncovered", "underlined", "understood", "undertook", "underwrote", "unearthed", "unified", "united", "unraveled", "updated", "upgraded", "upheld", "utilized",
+    "vacated", "validated", "valued", "verbalized", "verified", "viewed", "vindicated", "visited", "visualized", "voiced", "volunteered", "voted",
+    "waived", "walked", "weighed", "welcomed", "widened", "witnessed", "won", "worked", "wrote",
+    "yielded", "zoned"
+])
+
+ACHIEVEMENT_KEYWORDS = frozenset(["increased", "decreased", "achieved", "reduced", "grew", "improved", "optimized", "saved", "generated", "led to", "resulted in", "delivered", "completed", "exceeded", "streamlined"])
+NUMBER_MARKERS = frozenset(["%", "$", "€", "£", "k", "m", "usd", "eur"])
+
+TECHNICAL_SKILLS_KEYWORDS = frozenset([
+    "python", "java", "c++", "c#", "javascript", "typescript", "html", "css", "scss", "sass", "php", "ruby", "go", "swift", "kotlin", "rust", "scala",
+    "sql", "mysql", "postgresql", "mongodb", "nosql", "sqlite", "oracle", "sql server", "cassandra", "redis",
+    "react", "react.js", "angular", "angular.js", "vue", "vue.js", "next.js", "node.js", "express", "express.js", "django", "flask", "spring", "spring boot", ".net", "asp.net", "laravel", "ruby on rails",
+    "aws", "azure", "gcp", "google cloud", "amazon web services", "docker", "kubernetes", "k8s", "terraform", "ansible", "jenkins", "gitlab ci", "ci/cd", "devops",
+    "linux", "unix", "windows server", "macos", "bash", "powershell",
+    "machine learning", "ml", "data analysis", "data science", "artificial intelligence", "ai", "deep learning", "natural language processing", "nlp",
+    "pandas", "numpy", "scipy", "scikit-learn", "sklearn", "tensorflow", "keras", "pytorch", "matplotlib", "seaborn", "jupyter",
+    "git", "github", "gitlab", "bitbucket", "jira", "confluence", "agile", "scrum", "kanban",
+    "autocad", "solidworks", "revit", "matlab", "excel", "vba", "tableau", "power bi", "qlik", "sap", "oracle erp", "salesforce", "crm", "erp",
+    "photoshop", "illustrator", "figma", "sketch", "adobe xd", "ui/ux",
+    "cybersecurity", "penetration testing", "network security", "cryptography"
+])
+TECHNICAL_SKILL_PHRASES = frozenset(s for s in TECHNICAL_SKILLS_KEYWORDS if " " in s or "." in s or "#" in s)
+
+REQUIRED_SECTIONS_MAP = {
+    "summary": ["summary", "profile", "objective", "about me"],
+    "experience": ["experience", "work experience", "professional experience", "employment history"],
+    "education": ["education", "academic background", "qualifications"],
+    "skills": ["skills", "technical skills", "proficiencies", "expertise", "technologies"]
+}
+OPTIONAL_SECTIONS = ["projects", "awards", "publications", "volunteer", "certifications", "portfolio", "references", "languages"]
+SKILLS_SECTION_MARKERS = ["skill", "proficiencies", "expertise", "technologies", "competencies"]
+
+with startup_step('build keyword scanner'):
+    KEYWORD_SCANNER = PhraseScanner(
+        [variation for variations in REQUIRED_SECTIONS_MAP.values() for variation in variations]
+        + OPTIONAL_SECTIONS + SKILLS_SECTION_MARKERS + list(TECHNICAL_SKILL_PHRASES)
+    )
+
+@timed
+def match_keywords(text, doc):
+    # One pass over the text for phrases and one over the doc for token-level verbs, skills and
+    # quantified achievements; every keyword-based check reads its inputs from the returned dict.
+    matches = {
+        'phrases': KEYWORD_SCANNER.find_all(text.lower()),
+        'action_verb_count': 0,
+        'action_verbs_found': set(),
+        'tech_skills_found': set(),
+        'quantifiable_count': 0,
+    }
+    for sent in doc.sents:
+        has_number = False
+        has_achievement_verb = False
+        for token in sent:
+            lemma = token.lemma_.lower()
+            if lemma in ACTION_VERBS and token.pos_ == "VERB":
+                matches['action_verb_count'] += 1
+                matches['action_verbs_found'].add(lemma)
+            if lemma in TECHNICAL_SKILLS_KEYWORDS:
+                matches['tech_skills_found'].add(lemma)
+            if lemma in ACHIEVEMENT_KEYWORDS:
+                has_achievement_verb = True
+            if token.like_num or token.text.lower() in NUMBER_MARKERS:
+                has_number = True
+        if has_number and has_achievement_verb:
+            matches['quantifiable_count'] += 1
+    matches['tech_skills_found'] |= matches['phrases'] & TECHNICAL_SKILL_PHRASES
+    return matches
+
+# --- Precompiled Regex Bank ---
+# Compiled once at import. Email, phone, pronoun and date scanning lives in lexical_scan.py.
+NON_WORD_RE = re.compile(r'[^\w\s]')
+DIGITS_RE = re.compile(r'\d+')
+
 # --- Individual Analysis Functions (Using the second, more complete set from your original code) ---
 # Ensure this is the set of functions you intend to use.
 # The first set of definitions that appeared before the original line 817 should be removed.
 
-def check_contact_info(text):
+@timed
+def check_contact_info(text, lexical=None):
     feedback = []
+    if lexical is None:
+        lexical = scan_lexical_features(text)
     score_data = {'email_found': False, 'phone_found': False, 'linkedin_found': False}
-    email_pattern = r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"
-    phone_pattern = r"(\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4})" # Simple US-like
 
-    if re.search(email_pattern, text):
-        feedback.append("Good: Email address detected.")
+    if lexical['email_found']:
+        feedback.append(message('contact.email_found'))
         score_data['email_found'] = True
     else:
-        feedback.append("Suggestion (High Priority): Email address not found or in an unrecognized format. Ensure it's clearly visible.")
+        feedback.append(message('contact.email_missing'))
 
-    if re.search(phone_pattern, text):
-        feedback.append("Good: Phone number detected.")
+    if lexical['phone_found']:
+        feedback.append(message('contact.phone_found'))
         score_data['phone_found'] = True
     else:
-        feedback.append("Suggestion (High Priority): Phone number not found or in an unrecognized format. Ensure it's clearly visible.")
+        feedback.append(message('contact.phone_missing'))
 
-    if "linkedin.com/in/" in text.lower() or "linkedin.com/pub/" in text.lower():
-        feedback.append("Good: LinkedIn profile link seems to be present.")
+    if lexical['linkedin_found']:
+        feedback.append(message('contact.linkedin_found'))
         score_data['linkedin_found'] = True
     else:
-        feedback.append("Suggestion: Consider adding a link to your LinkedIn profile for networking and professional presence.")
+        feedback.append(message('contact.linkedin_missing'))
     return feedback, score_data
 
-def check_section_headings(text):
+@timed
+def check_section_headings(text, matches=None):
     feedback = []
-    text_lower = text.lower()
-    required_sections_map = {
-        "summary": ["summary", "profile", "objective", "about me"],
-        "experience": ["experience", "work experience", "professional experience", "employment history"],
-        "education": ["education", "academic background", "qualifications"],
-        "skills": ["skills", "technical skills", "proficiencies", "expertise", "technologies"]
-    }
-    optional_sections = ["projects", "awards", "publications", "volunteer", "certifications", "portfolio", "references", "languages"]
+    phrases = matches['phrases'] if matches is not None else KEYWORD_SCANNER.find_all(text.lower())
     found_required_count = 0
 
-    for key, variations in required_sections_map.items():
-        if any(variation in text_lower for variation in variations):
-            feedback.append(f"Good: Section '{key.capitalize()}' seems to be present.")
+    for key, variations in REQUIRED_SECTIONS_MAP.items():
+        if any(variation in phrases for variation in variations):
+            feedback.append(message('sections.required_found', section=key.capitalize()))
             found_required_count += 1
         else:
-            feedback.append(f"Suggestion: Missing a clear '{key.capitalize()}' section. This is a standard resume component.")
+            feedback.append(message('sections.required_missing', section=key.capitalize()))
 
-    if found_required_count < len(required_sections_map):
-        feedback.append("Warning: Some standard sections (Summary, Experience, Education, Skills) might be missing or not clearly labeled. Ensure these are easily identifiable.")
+    if found_required_count < len(REQUIRED_SECTIONS_MAP):
+        feedback.append(message('sections.some_missing'))
 
-    for section in optional_sections:
-        if section in text_lower:
-            feedback.append(f"Info: Optional section '{section.capitalize()}' detected. Ensure it adds value.")
-    score_data = {'required_sections_found': found_required_count, 'total_required_sections': len(required_sections_map)}
+    for section in OPTIONAL_SECTIONS:
+        if section in phrases:
+            feedback.append(message('sections.optional_found', section=section.capitalize()))
+    score_data = {'required_sections_found': found_required_count, 'total_required_sections': len(REQUIRED_SECTIONS_MAP)}
     return feedback, score_data
 
+@timed
 def check_resume_length(text):
     feedback = []
     word_count = len(text.split())
-    feedback.append(f"Info: Total word count is approximately {word_count}.")
+    feedback.append(message('length.word_count', word_count=word_count))
     length_ok = True
     if word_count < 250:
-        feedback.append("Suggestion: Your resume seems quite short (less than 250 words). Consider adding more detail, accomplishments, or relevant projects, especially if you have more than a year or two of experience.")
+        feedback.append(message('length.too_short'))
         length_ok = False
     elif word_count > 800: # Roughly > 2 pages for most standard formatting
-        feedback.append("Suggestion: Your resume might be too long (over 800 words). Aim for conciseness. For most professionals, 1-2 pages is ideal. Focus on the most relevant information for the jobs you're targeting.")
+        feedback.append(message('length.too_long'))
         length_ok = False
     elif word_count > 500 and word_count <= 800:
-        feedback.append("Info: Resume length seems appropriate for many roles (500-800 words). Ensure it's concise and impactful.")
+        feedback.append(message('length.appropriate'))
     else: # 250-500 words
-        feedback.append("Info: Resume length is reasonable (250-500 words), especially for early-career professionals. Ensure you've included enough detail for your experience level.")
+        feedback.append(message('length.reasonable'))
     score_data = {'word_count': word_count, 'length_ok': length_ok}
     return feedback, score_data
 
-def check_action_verbs(doc):
+@timed
+def check_action_verbs(doc, matches=None):
     feedback = []
-    # Using the more comprehensive list from your first definition
-    action_verbs_list = [
-        "accelerated", "achieved", "acquired", "adapted", "administered", "advanced", "advised", "advocated", "aided", "allocated", "analyzed", "anticipated", "applied", "appraised", "approved", "arbitrated", "arranged", "articulated", "assembled", "assessed", "assigned", "assisted", "attained", "audited", "augmented", "authored", "authorized", "automated", "awarded",
-        "balanced", "benchmarked", "boosted", "briefed", "broadened", "budgeted", "built",
-        "calculated", "cataloged", "centralized", "chaired", "championed", "changed", "clarified", "classified", "coached", "coded", "collaborated", "collected", "combined", "comforted", "commanded", "communicated", "compared", "compiled", "completed", "composed", "computed", "conceived", "conceptualized", "condensed", "conducted", "configured", "conserved", "consolidated", "constructed", "consulted", "contacted", "contributed", "controlled", "converted", "convinced", "cooperated", "coordinated", "corrected", "corresponded", "counseled", "created", "critiqued", "cultivated", "customized", "cut",
-        "debugged", "decentralized", "decreased", "dedicated", "deduced", "defined", "delegated", "delivered", "demonstrated", "designed", "detected", "determined", "developed", "devised", "diagnosed", "differentiated", "directed", "disciplined", "discovered", "dispensed", "displayed", "disproved", "dissected", "distributed", "diversified", "documented", "doubled", "drafted", "dramatized",
-        "earned", "edited", "educated", "effected", "elicited", "eliminated", "enabled", "encouraged", "endorsed", "engineered", "enhanced", "enlarged", "enlisted", "ensured", "entertained", "established", "estimated", "evaluated", "examined", "exceeded", "executed", "exercised", "exhibited", "expanded", "expedited", "experimented", "explained", "explored", "expressed", "extended", "extracted",
-        "fabricated", "facilitated", "familiarized", "fashioned", "filed", "financed", "fixed", "focused", "forecasted", "formalized", "formed", "formulated", "fostered", "founded", "framed", "fulfilled", "functioned", "furnished",
-        "gained", "gathered", "gauged", "generated", "governed", "graded", "granted", "greeted", "grouped", "grew", "guided",
-        "halved", "handled", "harmonized", "harnessed", "headed", "helped", "hired", "hosted", "hypothesized",
-        "identified", "ignited", "illustrated", "imagined", "implemented", "improved", "improvised", "inaugurated", "incorporated", "increased", "indexed", "indicated", "individualized", "induced", "influenced", "informed", "initiated", "innovated", "inspected", "inspired", "installed", "instigated", "instituted", "instructed", "insured", "integrated", "intensified", "interacted", "interpreted", "interviewed", "introduced", "invented", "inventoried", "invested", "investigated", "involved", "isolated", "issued",
-        "joined", "judged", "justified",
-        "kept",
-        "launched", "learned", "lectured", "led", "licensed", "listened", "lobbied", "localized", "located", "logged",
-        "machined", "made", "maintained", "managed", "manipulated", "manufactured", "mapped", "marketed", "mastered", "maximized", "measured", "mediated", "mentored", "merged", "met", "minimized", "mobilized", "modeled", "moderated", "modernized", "modified", "molded", "monitored", "motivated", "moved", "multiplied",
-        "narrated", "navigated", "negotiated", "networked", "neutralized", "nominated", "normalized", "notified", "nurtured",
-        "observed", "obtained", "offered", "offset", "opened", "operated", "optimized", "orchestrated", "ordered", "organized", "oriented", "originated", "outlined", "overcame", "overhauled", "oversaw",
-        "packaged", "painted", "participated", "partnered", "patented", "perceived", "performed", "persuaded", "phased", "photographed", "piloted", "pinpointed", "pioneered", "placed", "planned", "played", "polled", "popularized", "positioned", "predicted", "prepared", "prescribed", "presented", "preserved", "presided", "prevented", "printed", "prioritized", "probed", "processed", "procured", "produced", "profiled", "programmed", "projected", "promoted", "proofread", "proposed", "protected", "proved", "provided", "publicized", "published", "pulled", "purchased", "pursued",
-        "qualified", "quantified", "queried", "questioned", "quoted",
-        "raised", "rallied", "ran", "ranked", "rated", "reached", "read", "realigned", "rebuilt", "received", "recognized", "recommended", "reconciled", "reconstructed", "recorded", "recovered", "recruited", "rectified", "redesigned", "reduced", "reengineered", "referred", "refined", "refocused", "reformed", "regulated", "rehabilitated", "reinforced", "reinstated", "related", "relayed", "released", "relieved", "remediated", "remodeled", "rendered", "renegotiated", "renovated", "reorganized", "repaired", "replaced", "replenished", "replicated", "reported", "represented", "reprogrammed", "researched", "reshaped", "resolved", "responded", "restored", "restructured", "resulted", "retained", "retooled", "retrieved", "revamped", "reversed", "reviewed", "revised", "revitalized", "rewarded", "routed", "ran",
-        "safeguarded", "salvaged", "saved", "scanned", "scheduled", "schemed", "screened", "scripted", "scrutinized", "sculpted", "searched", "secured", "segmented", "selected", "separated", "sequenced", "served", "serviced", "set", "settled", "shaped", "shared", "sharpened", "shipped", "shortened", "showcased", "shrank", "simplified", "simulated", "sketched", "sold", "solidified", "solved", "sorted", "sought", "sparked", "spearheaded", "specialized", "specified", "speculated", "spoke", "sponsored", "stabilized", "staffed", "staged", "standardized", "started", "steered", "stimulated", "stopped", "strategized", "streamlined", "strengthened", "stressed", "stretched", "structured", "studied", "submitted", "substituted", "succeeded", "suggested", "summarized", "superseded", "supervised", "supplied", "supported", "surpassed", "surveyed", "sustained", "symbolized", "synchronized", "synthesized", "systematized",
-        "tabulated", "tackled", "tailored", "targeted", "taught", "teamed", "terminated", "tested", "testified", "tightened", "timed", "traced", "tracked", "traded", "trained", "transacted", "transcribed", "transferred", "transformed", "translated", "transmitted", "transported", "traveled", "treated", "trimmed", "tripled", "troubleshot", "tutored", "typed",
-        "uncovered", "underlined", "understood", "undertook", "underwrote", "unearthed", "unified", "united", "unraveled", "updated", "upgraded", "upheld", "utilized",
-        "vacated", "validated", "valued", "verbalized", "verified", "viewed", "vindicated", "visited", "visualized", "voiced", "volunteered", "voted",
-        "waived", "walked", "weighed", "welcomed", "widened", "witnessed", "won", "worked", "wrote",
-        "yielded", "zoned"
-    ]
-    action_verb_count = 0
-    verbs_found = set()
-    for token in doc:
-        if token.pos_ == "VERB" and token.lemma_.lower() in action_verbs_list:
-            action_verb_count += 1
-            verbs_found.add(token.lemma_.lower())
+    if matches is None:
+        matches = match_keywords(doc.text, doc)
+    action_verb_count = matches['action_verb_count']
+    verbs_found = matches['action_verbs_found']
 
     if action_verb_count < 10:
-         feedback.append(f"Suggestion: Found {action_verb_count} action verbs. Strong resumes often use many impactful action verbs (e.g., 15-25+) to start bullet points describing accomplishments.")
+         feedback.append(message('action_verbs.few', count=action_verb_count))
     elif action_verb_count < 20:
-        feedback.append(f"Info: Found {action_verb_count} action verbs. Good start! Consider if more can be used to strengthen accomplishment statements.")
+        feedback.append(message('action_verbs.some', count=action_verb_count))
     else:
-         feedback.append(f"Good: Detected {action_verb_count} action verbs. This helps make your accomplishments sound dynamic!")
+         feedback.append(message('action_verbs.many', count=action_verb_count))
 
     if verbs_found:
-         feedback.append(f"Info: Some action verbs used: {', '.join(list(verbs_found)[:5])}{'...' if len(verbs_found) > 5 else ''}.")
+         feedback.append(message('action_verbs.examples', **examples(verbs_found, 5)))
     score_data = {'action_verb_count': action_verb_count}
     return feedback, score_data
 
-def check_quantifiable_achievements(doc):
+@timed
+def check_quantifiable_achievements(doc, matches=None):
     feedback = []
-    quantifiable_count = 0
-    achievement_keywords = ["increased", "decreased", "achieved", "reduced", "grew", "improved", "optimized", "saved", "generated", "led to", "resulted in", "delivered", "completed", "exceeded", "streamlined"]
-    for sent in doc.sents:
-        has_number = any(token.like_num or token.text == "%" or token.text.lower() in ["$", "€", "£", "k", "m", "usd", "eur"] for token in sent)
-        has_achievement_verb = any(token.lemma_.lower() in achievement_keywords for token in sent)
-        if has_number and has_achievement_verb:
-            quantifiable_count += 1
+    if matches is None:
+        matches = match_keywords(doc.text, doc)
+    quantifiable_count = matches['quantifiable_count']
     if quantifiable_count == 0:
-        feedback.append("Suggestion (High Priority): No clear quantifiable achievements found. Use numbers, percentages, or monetary values to demonstrate the impact of your work (e.g., 'Increased sales by 15%', 'Reduced costs by $10K', 'Managed a team of 5').")
+        feedback.append(message('quantifiable.none'))
     elif quantifiable_count < 3:
-        feedback.append(f"Suggestion: Found {quantifiable_count} potential quantifiable achievement(s). Aim to include more to make your impact clear and measurable. Each key role should ideally have 1-2 quantifiable points.")
+        feedback.append(message('quantifiable.few', count=quantifiable_count))
     else:
-        feedback.append(f"Good: Detected {quantifiable_count} potential quantifiable achievements. This significantly strengthens your resume!")
+        feedback.append(message('quantifiable.good', count=quantifiable_count))
     score_data = {'quantifiable_count': quantifiable_count}
     return feedback, score_data
 
-def check_skills_section(text, doc):
+@timed
+def check_skills_section(text, doc, matches=None):
     feedback = []
-    text_lower = text.lower()
-    skills_section_present = "skill" in text_lower or "proficiencies" in text_lower or "expertise" in text_lower or "technologies" in text_lower or "competencies" in text_lower
+    if matches is None:
+        matches = match_keywords(text, doc)
+    skills_section_present = any(marker in matches['phrases'] for marker in SKILLS_SECTION_MARKERS)
     if not skills_section_present:
-        feedback.append("Suggestion: A dedicated 'Skills' section is highly recommended for listing technical and other key competencies. This makes it easy for recruiters to spot relevant abilities.")
-    
-    technical_skills_keywords = [
-        "python", "java", "c++", "c#", "javascript", "typescript", "html", "css", "scss", "sass", "php", "ruby", "go", "swift", "kotlin", "rust", "scala",
-        "sql", "mysql", "postgresql", "mongodb", "nosql", "sqlite", "oracle", "sql server", "cassandra", "redis",
-        "react", "react.js", "angular", "angular.js", "vue", "vue.js", "next.js", "node.js", "express", "express.js", "django", "flask", "spring", "spring boot", ".net", "asp.net", "laravel", "ruby on rails",
-        "aws", "azure", "gcp", "google cloud", "amazon web services", "docker", "kubernetes", "k8s", "terraform", "ansible", "jenkins", "gitlab ci", "ci/cd", "devops",
-        "linux", "unix", "windows server", "macos", "bash", "powershell",
-        "machine learning", "ml", "data analysis", "data science", "artificial intelligence", "ai", "deep learning", "natural language processing", "nlp",
-        "pandas", "numpy", "scipy", "scikit-learn", "sklearn", "tensorflow", "keras", "pytorch", "matplotlib", "seaborn", "jupyter",
-        "git", "github", "gitlab", "bitbucket", "jira", "confluence", "agile", "scrum", "kanban",
-        "autocad", "solidworks", "revit", "matlab", "excel", "vba", "tableau", "power bi", "qlik", "sap", "oracle erp", "salesforce", "crm", "erp",
-        "photoshop", "illustrator", "figma", "sketch", "adobe xd", "ui/ux",
-        "cybersecurity", "penetration testing", "network security", "cryptography"
-    ]
-    found_tech_skills = set()
-    for token in doc:
-        if token.lemma_.lower() in technical_skills_keywords:
-            found_tech_skills.add(token.lemma_.lower())
-    for skill_phrase in [s for s in technical_skills_keywords if " " in s or "." in s or "#" in s]:
-        if skill_phrase in text_lower:
-                found_tech_skills.add(skill_phrase)
+        feedback.append(message('skills.section_missing'))
     
+    found_tech_skills = matches['tech_skills_found']
     found_tech_skills_count = len(found_tech_skills)
 
     if found_tech_skills_count > 0 :
-        feedback.append(f"Good: Identified {found_tech_skills_count} potential technical skills. Example(s): {', '.join(list(found_tech_skills)[:3])}{'...' if found_tech_skills_count > 3 else ''}.")
+        feedback.append(message('skills.found', count=found_tech_skills_count, **examples(found_tech_skills, 3)))
         if found_tech_skills_count < 5:
-            feedback.append("Suggestion: If you have more technical skills, ensure they are listed clearly. Aim for 5-15 relevant technical skills depending on your field and experience.")
+            feedback.append(message('skills.few'))
     else:
         if skills_section_present:
-             feedback.append("Suggestion: Your skills section seems to be present, but few common technical skills were detected. Ensure you list specific tools, programming languages, and technologies.")
+             feedback.append(message('skills.section_without_skills'))
         else:
-            feedback.append("Suggestion: No common technical skills detected. If you have them, list them in your 'Skills' section or integrate them into your experience descriptions.")
+            feedback.append(message('skills.none'))
 
-    feedback.append("Info: Remember to also showcase soft skills (e.g., communication, teamwork, problem-solving, leadership) through your experience descriptions and summary, not just by listing them in a skills section.")
+    feedback.append(message('skills.soft_skills'))
     score_data = {'skills_section_present': skills_section_present, 'tech_skills_count': found_tech_skills_count}
     return feedback, score_data
 
-def perform_spell_check(text):
-    feedback = []
-    spell = SpellChecker()
-    clean_text = re.sub(r'[^\w\s]', ' ', text) 
-    clean_text = re.sub(r'\d+', '', clean_text)    
+def find_misspelled_words(text):
+    clean_text = NON_WORD_RE.sub(' ', text) 
+    clean_text = DIGITS_RE.sub('', clean_text)    
     words = clean_text.lower().split()
-    words_to_check = [word for word in words if len(word) > 2 and not word.isupper()]
-    misspelled = spell.unknown(words_to_check)
-    common_tech_terms_or_acronyms = {
-        "aws", "gcp", "api", "sdk", "cicd", "devops", "sql", "nosql", "html", "css", "json", "uiux", "erp", "crm",
-        "saas", "paas", "iaas", "agile", "scrum", "kanban", "jira", "git", "github", "kubernetes", "k8s",
-        "microservices", "blockchain", "fintech", "edtech", "healthtech", "iot", "arvr", "aiops", "mlops"
-    } 
-    misspelled_filtered = [word for word in misspelled if word not in common_tech_terms_or_acronyms and not any(char.isdigit() for char in word)]
+    words_to_check = {word for word in words if len(word) > 2 and not word.isupper()}
+    return [word for word in words_to_check if is_unknown_word(word) and not any(char.isdigit() for char in word)]
+
+@timed
+def perform_spell_check(text, misspelled=None):
+    feedback = []
+    misspelled_filtered = list(misspelled) if misspelled is not None else find_misspelled_words(text)
 
     if len(misspelled_filtered) > 0:
-        feedback.append(f"Warning (Spelling): Found {len(misspelled_filtered)} potential spelling errors. Please review. Examples: {', '.join(list(misspelled_filtered)[:5])}{'...' if len(misspelled_filtered) > 5 else ''}")
-        feedback.append("Suggestion: Proofread carefully or use a spell checker (like Grammarly or Word's built-in checker). Common errors include typos or domain-specific terms not in a standard dictionary. Ensure consistency in capitalization of proper nouns and acronyms.")
+        feedback.append(message('spelling.errors', count=len(misspelled_filtered), **examples(misspelled_filtered, 5)))
+        feedback.append(message('spelling.proofread'))
     else:
-        feedback.append("Good: No obvious spelling errors detected by the basic checker. Always good to double-check manually.")
+        feedback.append(message('spelling.clean'))
     score_data = {'misspelled_count': len(misspelled_filtered)}
     return feedback, score_data
 
-def check_readability(text):
+@timed
+def check_readability(doc, counts=None):
+    # Sentence, word and syllable counts come from the parsed doc once and feed every metric
     feedback = []
-    flesch_score = 0
-    try:
-        flesch_score = textstat.flesch_reading_ease(text)
-        feedback.append(f"Info (Readability): Flesch Reading Ease score: {flesch_score:.2f} (Higher is better; 60-70 is generally good for wide audiences).")
-        if flesch_score < 30:
-            feedback.append("Suggestion: Readability is very low (college graduate level or higher). Try to simplify complex sentences, break up long paragraphs, and use more common vocabulary unless highly technical language is standard for your target roles.")
-        elif flesch_score < 60:
-            feedback.append("Suggestion: Readability is fairly difficult. Consider simplifying some sentences or jargon for broader understanding, especially if applying to roles outside of a highly specialized field.")
-        else:
-            feedback.append("Good: Readability score suggests the text is understandable for a general business audience.")
-
-        grade_level = textstat.flesch_kincaid_grade(text)
-        feedback.append(f"Info (Readability): Flesch-Kincaid Grade Level: {grade_level:.1f}. Aim for a grade level around 8-12 for general business communication, unless a higher level is specific to your field and target audience.")
-
-    except Exception as e:
-        feedback.append(f"Info: Could not calculate readability score. Error: {e}")
-    score_data = {'flesch_score': flesch_score if 'flesch_score' in locals() and flesch_score != 0 else 50}
+    if counts is None:
+        counts = merge_readability_counts([readability_counts(doc)])
+    scores = readability_scores(counts)
+    flesch_score = scores['flesch_reading_ease']
+    feedback.append(message('readability.flesch', score=flesch_score))
+    if flesch_score < 30:
+        feedback.append(message('readability.very_low'))
+    elif flesch_score < 60:
+        feedback.append(message('readability.difficult'))
+    else:
+        feedback.append(message('readability.good'))
+    feedback.append(message('readability.grade', grade=scores['flesch_kincaid_grade']))
+    score_data = {
+        'flesch_score': flesch_score if flesch_score != 0 else 50,
+        'grade_level': scores['flesch_kincaid_grade'],
+        'gunning_fog': scores['gunning_fog'],
+        'smog_index': scores['smog_index'],
+    }
     return feedback, score_data
 
-def check_use_of_i(text):
+@timed
+def check_use_of_i(text, lexical=None):
     feedback = []
-    i_count = len(re.findall(r'\bI\b', text)) 
-    i_contractions_count = len(re.findall(r"\b(I'm|I've|I'd|I’ll|I’d)\b", text, re.IGNORECASE))
-    my_me_count = len(re.findall(r"\b(my|me)\b", text, re.IGNORECASE))
-    total_first_person_count = i_count + i_contractions_count + my_me_count
+    if lexical is None:
+        lexical = scan_lexical_features(text)
+    total_first_person_count = lexical['first_person_count']
 
     if total_first_person_count > 3: 
-        feedback.append(f"Suggestion: Found first-person pronouns (I, my, me, I'm, etc.) used approximately {total_first_person_count} times. Resumes are typically written in an implied first-person (e.g., 'Managed a team' instead of 'I managed a team'). Consider rephrasing to be more professional and concise.")
+        feedback.append(message('use_of_i.frequent', count=total_first_person_count))
     score_data = {'i_count': total_first_person_count}
     return feedback, score_data
 
-def check_dates_format(text):
+@timed
+def check_dates_format(text, lexical=None):
     feedback = []
-    date_patterns = [
-        r'\b(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s+\d{4}\b', 
-        r'\b\d{1,2}\/\d{4}\b', 
-        r'\b\d{1,2}\-\d{4}\b', 
-        r'\b\d{4}\s*[-–—to]+\s*\d{4}\b', 
-        r'\b\d{4}\s*[-–—to]+\s*(?:Present|Current|Ongoing|Till Date)\b', 
-        r'\b(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s+\d{4}\s*[-–—to]+\s*(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s+\d{4}\b', 
-        r'\b(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s+\d{4}\s*[-–—to]+\s*(?:Present|Current|Ongoing|Till Date)\b'
-    ]
-    dates_found_count = 0
-    for pattern in date_patterns:
-        dates_found_count += len(re.findall(pattern, text, re.IGNORECASE))
+    if lexical is None:
+        lexical = scan_lexical_features(text)
+    dates_found_count = lexical['dates_found_count']
 
     if dates_found_count < 2: 
-        feedback.append("Suggestion: Few standard date formats found for employment or education periods. Ensure your experience and education sections have clear and consistently formatted start and end dates (e.g., 'Month YYYY – Month YYYY' or 'Month YYYY – Present').")
+        feedback.append(message('dates.few'))
     else:
-        feedback.append(f"Info: Detected {dates_found_count} instances of common date formats. Consistency in formatting is key for readability.")
+        feedback.append(message('dates.found', count=dates_found_count))
     score_data = {'dates_found_count': dates_found_count}
     return feedback, score_data
 
 
-# --- Scoring Logic ---
-# Using the more detailed scoring logic from your first definition
-def calculate_resume_score(score_inputs):
-    base_score = 100
-    deductions = 0
-    bonus_points = 0 
-
-    if not score_inputs['contact_info']['email_found']: deductions += 10
-    if not score_inputs['contact_info']['phone_found']: deductions += 10
-    if not score_inputs['contact_info']['linkedin_found']: deductions += 3
-
-    sections_ratio = score_inputs['sections']['required_sections_found'] / score_inputs['sections']['total_required_sections']
-    if sections_ratio < 0.5: deductions += 15 
-    elif sections_ratio < 0.75: deductions += 10 
-    elif sections_ratio < 1.0: deductions += 5  
-    else: bonus_points += 2 
-
-    if not score_inputs['length']['length_ok']: deductions += 5
-    wc = score_inputs['length']['word_count']
-    if 400 <= wc <= 700 : bonus_points += 2
-
-    av_count = score_inputs['action_verbs']['action_verb_count']
-    if av_count < 5: deductions += 8
-    elif av_count < 10: deductions += 5
-    elif av_count < 15: deductions += 2
-    elif av_count >= 20: bonus_points += 3 
+# --- Main Analysis Orchestrator ---
+# Using the more detailed one from your first definition
+def analyze_resume_content(text):
+    if not text or not text.strip():
+        return ["Error: The extracted text is empty. Cannot analyze."], 0
+    return analyze_parsed_resume(text, parse_resume(text))
+
+def analyze_resume_report(text):
+    # Structured counterpart of analyze_resume_content for the JSON API and the result cache
+    return build_report(text, parse_resume(text))
+
+def parse_resume(text):
+    with stage('parse'):
+        return nlp(text)
+
+
+def iter_analysis_sections(text, doc, matches=None, lexical=None, misspelled=None, readability=None):
+    # Yields (title, feedback, score_inputs) one report section at a time, so callers can
+    # stream each section as soon as its checks finish. Keyword matches, lexical features,
+    # misspelled words and readability counts can be passed in precomputed, in which case
+    # doc is not needed.
+    if matches is None:
+        matches = match_keywords(text, doc)
+    if lexical is None:
+        lexical = scan_lexical_features(text)
+
+    feedback, score_inputs = [], {}
+    fb, score_inputs['contact_info'] = check_contact_info(text, lexical); feedback.extend(fb)
+    fb, score_inputs['length'] = check_resume_length(text); feedback.extend(fb)
+    yield "Overall & Contact", feedback, score_inputs
+
+    feedback, score_inputs = [], {}
+    fb, score_inputs['sections'] = check_section_headings(text, matches); feedback.extend(fb)
+    fb, score_inputs['dates'] = check_dates_format(text, lexical); feedback.extend(fb)
+    yield "Structure & Sections", feedback, score_inputs
+
+    feedback, score_inputs = [], {}
+    fb, score_inputs['action_verbs'] = check_action_verbs(doc, matches); feedback.extend(fb)
+    fb, score_inputs['quantifiable'] = check_quantifiable_achievements(doc, matches); feedback.extend(fb)
+    fb, score_inputs['skills'] = check_skills_section(text, doc, matches); feedback.extend(fb)
+    yield "Content & Impact", feedback, score_inputs
+
+    feedback, score_inputs = [], {}
+    fb, score_inputs['spelling'] = perform_spell_check(text, misspelled); feedback.extend(fb)
+    fb, score_inputs['readability'] = check_readability(doc, readability); feedback.extend(fb)
+    fb, score_inputs['use_of_i'] = check_use_of_i(text, lexical); feedback.extend(fb)
+    yield "Language & Professionalism", feedback, score_inputs
+
+def score_summary_sections(resume_score):
+    if resume_score >= 85:
+        verdict = message('summary.excellent')
+    elif resume_score >= 70:
+        verdict = message('summary.good')
+    elif resume_score >= 50:
+        verdict = message('summary.needs_improvement')
+    else:
+        verdict = message('summary.significant_improvement')
+    general_advice = [message('advice.review'), message('advice.tailor'), message('advice.grammar'), message('advice.formatting')]
+    return [(f"Overall Score: {resume_score}/100", [verdict]), ("General Advice", general_advice)]
+
+def build_check_sections(text, doc, matches=None, lexical=None, misspelled=None, readability=None):
+    # ([(title, feedback)], score_inputs) from every check, before scoring
+    sections = []
+    score_inputs = {}
+    for title, feedback, section_inputs in iter_analysis_sections(text, doc, matches, lexical, misspelled, readability):
+        sections.append((title, feedback))
+        score_inputs.update(section_inputs)
+    return sections, score_inputs
+
+def finish_report(sections, score_inputs, resume_score):
+    # {'sections': [{'title', 'messages'}], 'score_inputs': {...}, 'score': int}, all JSON-serialisable.
+    # Feedback stays as (code, params) messages; render_report_sections turns it into text.
+    sections = sections + score_summary_sections(resume_score)
+    return {
+        'sections': [{'title': title, 'messages': messages} for title, messages in sections],
+        'score_inputs': score_inputs,
+        'score': resume_score,
+    }
 
-    qa_count = score_inputs['quantifiable']['quantifiable_count']
-    if qa_count == 0: deductions += 18
-    elif qa_count < 2: deductions += 10
-    elif qa_count < 4: deductions += 5
-    elif qa_count >= 5: bonus_points += 5 
+def build_report(text, doc, matches=None, lexical=None, misspelled=None, readability=None):
+    sections, score_inputs = build_check_sections(text, doc, matches, lexical, misspelled, readability)
+    return finish_report(sections, score_inputs, calculate_resume_score(score_inputs))
+
+def report_feedback(report):
+    # The flat feedback list the HTML template renders
+    sections = [(section['title'], render_feedback(section['messages'])) for section in report['sections']]
+    return [f for f in flatten_sections(sections) if f is not None]
+
+def render_report_sections(report, include_messages=False):
+    # [{'title', 'feedback'}] with the feedback rendered to text, optionally keeping the message codes
+    sections = []
+    for section in report['sections']:
+        rendered = {'title': section['title'], 'feedback': render_feedback(section['messages'])}
+        if include_messages:
+            rendered['messages'] = section['messages']
+        sections.append(rendered)
+    return sections
+
+def flatten_sections(sections):
+    # Renders (title, feedback) pairs into the flat list the template expects, headers as "--- Title ---"
+    feedback_results = []
+    for title, feedback in sections:
+        feedback_results.append(f"\n--- {title} ---" if feedback_results else f"--- {title} ---")
+        feedback_results.extend(feedback)
+    return feedback_results
 
-    if not score_inputs['skills']['skills_section_present']: deductions += 7
-    elif score_inputs['skills']['tech_skills_count'] < 3: deductions += 4 
-    elif score_inputs['skills']['tech_skills_count'] < 5: deductions += 2
-    elif score_inputs['skills']['tech_skills_count'] >= 10: bonus_points += 2 
+def analyze_parsed_resume(text, doc):
+    # Runs every check against an already parsed doc, so single and batch analysis share one code path
+    if not text or not text.strip():
+        return ["Error: The extracted text is empty. Cannot analyze."], 0
+    report = build_report(text, doc)
+    return report_feedback(report), report['score']
+
+def build_reports_batch(items):
+    # build_report over a list of (text, doc), scored with one score_batch call for the whole list;
+    # None in place of the report for empty text
+    checked = [build_check_sections(text, doc) if text and text.strip() else None for text, doc in items]
+    scores = iter(score_batch(score_inputs_array(result[1] for result in checked if result is not None)))
+    return [finish_report(*result, int(next(scores))) if result is not None else None for result in checked]
+
+def analyze_parsed_batch(items):
+    # analyze_parsed_resume over a list of (text, doc)
+    results = []
+    for report in build_reports_batch(items):
+        if report is None:
+            results.append((["Error: The extracted text is empty. Cannot analyze."], 0))
+            continue
+        results.append((report_feedback(report), report['score']))
+    return results
+
+
+# --- Incremental Section Analysis ---
+# Users tend to edit a line and re-upload. The text is split at the heading lines check_section_headings
+# recognizes, and everything the checks take from the parse or from a scan of the text is computed per
+# section and cached by the section's hash, so a re-upload only parses the sections that changed. The
+# merged inputs are exact for phrases, contact details, pronouns, dates, word, spelling and readability
+# counts. Verb, skill and achievement counts are approximate: each section is parsed on its own, so POS
+# tags near a heading and sentences spaCy would have run across a heading line can differ from a
+# whole-text parse, and scores can differ from /analyze/batch, /jobs and the bulk CLI for the same file.
+SECTION_HEADINGS = frozenset(
+    [variation for variations in REQUIRED_SECTIONS_MAP.values() for variation in variations] + OPTIONAL_SECTIONS
+)
+
+def split_resume_sections(text):
+    # Consecutive chunks that join back into text exactly; each chunk after the first starts at a heading line
+    sections = []
+    start = position = 0
+    for line in text.splitlines(keepends=True):
+        if position > start and line.strip().rstrip(':').strip().lower() in SECTION_HEADINGS:
+            sections.append(text[start:position])
+            start = position
+        position += len(line)
+    sections.append(text[start:])
+    return sections
+
+def section_features(section, doc):
+    # Everything the checks need from one section, as a JSON-serialisable dict for the result cache
+    matches = match_keywords(section, doc)
+    return {
+        'phrases': sorted(matches['phrases']),
+        'action_verb_count': matches['action_verb_count'],
+        'action_verbs_found': sorted(matches['action_verbs_found']),
+        'tech_skills_found': sorted(matches['tech_skills_found']),
+        'quantifiable_count': matches['quantifiable_count'],
+        'lexical': scan_lexical_features(section),
+        'misspelled': sorted(find_misspelled_words(section)),
+        'readability': readability_counts(doc),
+    }
 
-    misspelled = score_inputs['spelling']['misspelled_count']
-    if misspelled > 5: deductions += 12
-    elif misspelled > 2: deductions += 7
-    elif misspelled > 0: deductions += 3
+def merge_section_features(features):
+    # Returns (matches, lexical, misspelled, readability) for the whole resume, in the shapes the checks take
+    matches = {'phrases': set(), 'action_verb_count': 0, 'action_verbs_found': set(), 'tech_skills_found': set(), 'quantifiable_count': 0}
+    lexical = {'email_found': False, 'phone_found': False, 'linkedin_found': False, 'first_person_count': 0, 'dates_found_count': 0}
+    misspelled = set()
+    for section in features:
+        for key in ('phrases', 'action_verbs_found', 'tech_skills_found'):
+            matches[key].update(section[key])
+        matches['action_verb_count'] += section['action_verb_count']
+        matches['quantifiable_count'] += section['quantifiable_count']
+        for key in ('email_found', 'phone_found', 'linkedin_found'):
+            lexical[key] = lexical[key] or section['lexical'][key]
+        lexical['first_person_count'] += section['lexical']['first_person_count']
+        lexical['dates_found_count'] += section['lexical']['dates_found_count']
+        misspelled.update(section['misspelled'])
+    readability = merge_readability_counts(section['readability'] for section in features)
+    return matches, lexical, sorted(misspelled), readability
+
+def analyze_resume_sections(text, known_features):
+    # Pool job: known_features maps section cache keys to cached features; only the remaining sections
+    # are parsed, in one nlp.pipe call. Returns (report, {key: features} for the sections computed here).
+    sections = split_resume_sections(text)
+    keys = [section_cache_key(section) for section in sections]
+    missing = {key: section for key, section in zip(keys, sections) if key not in known_features}
+    with stage('parse'):
+        docs = list(nlp.pipe(missing.values()))
+    computed = {key: section_features(section, doc) for (key, section), doc in zip(missing.items(), docs)}
+    features = [known_features[key] if key in known_features else computed[key] for key in keys]
+    return build_report(text, None, *merge_section_features(features)), computed
+
+def analyze_resume_incremental(text):
+    # Looks the sections up in the result cache here, so pool workers share whatever the cache shares
+    known_features = {}
+    for section in split_resume_sections(text):
+        key = section_cache_key(section)
+        cached = result_cache.get(key)
+        if cached is not None:
+            known_features[key] = cached
+    report, computed = run_cpu_job(analyze_resume_sections, text, known_features)
+    for key, features in computed.items():
+        result_cache.set(key, features)
+    return report
+
+
+# --- Batch Analysis ---
+def iter_analyze_resumes(texts, batch_size=None, n_process=None):
+    # Streams resumes through nlp.pipe and yields (feedback, score) in input order
+    batch_size = batch_size or app.config['NLP_BATCH_SIZE']
+    n_process = n_process or app.config['NLP_N_PROCESS']
+    if hasattr(texts, '__len__'):
+        # Forking workers only pays off when every process gets at least one full batch
+        n_process = max(1, min(n_process, len(texts) // batch_size))
+    docs = nlp.pipe(((text or "", text) for text in texts), as_tuples=True,
+                    batch_size=batch_size, n_process=n_process)
+    # Checks run per resume as docs arrive; scoring runs once per batch of docs
+    batch = []
+    for doc, text in docs:
+        batch.append((text, doc))
+        if len(batch) == batch_size:
+            yield from analyze_parsed_batch(batch)
+            batch = []
+    yield from analyze_parsed_batch(batch)
+
+def analyze_resume_file(filename, file_stream, notices=None):
+    # Returns (text, error_message, (feedback, score)); the analysis is None when extraction fails or is empty
+    text, error_message, report = analyze_resume_upload(filename, file_stream, notices)
+    if report is None:
+        return text, error_message, None
+    return text, None, (report_feedback(report), report['score'])
+
+def analyze_resume_upload(filename, file_stream, notices=None, page_timings=None):
+    # Extracts and analyzes an upload, reusing cached results for identical bytes or identical text.
+    # Returns (text, error_message, report); the report is None when extraction fails or is empty.
+    # Extraction warnings (e.g. page limits) are appended to notices, and (page_number, seconds)
+    # for every PDF page read to page_timings.
+    text, error_message, report, cache_keys = recall_resume_upload(filename, file_stream, notices, page_timings)
+    if cache_keys is not None:
+        if app.config['INCREMENTAL_ANALYSIS']:
+            report = analyze_resume_incremental(text)
+        else:
+            report = run_cpu_job(analyze_resume_report, text)
+        remember_resume_report(text, report, cache_keys)
+    return text, error_message, report
+
+def recall_resume_upload(filename, file_stream, notices=None, page_timings=None):
+    # The extraction half of analyze_resume_upload. Returns (text, error_message, report, cache_keys): the
+    # report is the cached one if there is one, and cache_keys is only set when the text still has to be
+    # analyzed, for remember_resume_report to store the result under.
+    notices = notices if notices is not None else []
+    upload_key = upload_digest_cache_key(stream_sha256(file_stream))
+    cached = result_cache.get(upload_key)
+    if cached is not None:
+        notices.extend(cached['notices'])
+        return cached['text'], None, cached['report'], None
+
+    text, error_message, extraction_notices, extraction_page_timings = extract_upload_text(filename, file_stream)
+    notices.extend(extraction_notices)
+    for _, seconds in extraction_page_timings:
+        PDF_PAGE_DURATION.observe('pdf', seconds)
+    if page_timings is not None:
+        page_timings.extend(extraction_page_timings)
+    if error_message or not text or not text.strip():
+        return text, error_message, None, None
+
+    content_key = text_cache_key(text)
+    cached = result_cache.get(content_key)
+    if cached is None:
+        return text, None, None, (upload_key, content_key, extraction_notices)
+    result_cache.set(upload_key, dict(cached, text=text, notices=extraction_notices))
+    return text, None, cached['report'], None
+
+def remember_resume_report(text, report, cache_keys):
+    upload_key, content_key, extraction_notices = cache_keys
+    cached = {'text': text, 'report': report}
+    result_cache.set(content_key, cached)
+    result_cache.set(upload_key, dict(cached, notices=extraction_notices))
+
+def analyze_resumes_batch(texts, batch_size=None, n_process=None):
+    return list(iter_analyze_resumes(texts, batch_size=batch_size, n_process=n_process))
+
+def analyze_reports_batch(texts):
+    # Pool job for /analyze/batch: one nlp.pipe pass in this process (pool workers can't fork their own)
+    # and one score_batch call, returning a report per text
+    with stage('parse'):
+        docs = list(nlp.pipe(texts, batch_size=app.config['NLP_BATCH_SIZE']))
+    return build_reports_batch(list(zip(texts, docs)))
+
+def compare_pipeline_profiles(texts, profile, reference_profile='full'):
+    # Parity check for a trimmed profile: returns (index, reference_score, profile_score) for every text whose
+    # report differs in any score input or message, not just in the total score
+    reference_nlp, profile_nlp = load_nlp(reference_profile), load_nlp(profile)
+    mismatches = []
+    for index, text in enumerate(texts):
+        reference_report = build_report(text, reference_nlp(text))
+        profile_report = build_report(text, profile_nlp(text))
+        if reference_report != profile_report:
+            mismatches.append((index, reference_report['score'], profile_report['score']))
+    return mismatches
+
+
+# --- Analysis Worker Pool ---
+# Extraction and analysis run in a warmed, bounded process pool; forked workers inherit the loaded
+# spaCy model and spell-check dictionary. See worker_pool.py for the queueing and timeout rules.
+def warm_analysis_worker():
+    # Touch the model and dictionaries once so the first real job in this worker runs at full speed
+    readability_counts(nlp("Warm up the pipeline."))
+    is_unknown_word("warm")
+
+def extract_text_from_bytes(filename, data):
+    notices, page_timings = [], []
+    text, error_message = extract_text_from_upload(filename, io.BytesIO(data), notices, page_timings)
+    return text, error_message, notices, page_timings
+
+def extract_text_from_path(filename, path):
+    notices, page_timings = [], []
+    with open_mapped(path) as mapped:
+        text, error_message = extract_text_from_upload(filename, mapped, notices, page_timings)
+    return text, error_message, notices, page_timings
+
+def extract_pdf_page_range(source, start, stop):
+    # Pool job for parallel PDF extraction; source is a spooled upload's path or the PDF bytes.
+    # A range stops early once a page blows the time budget or the range alone passes the character
+    # limit, because nothing after that point would be kept anyway.
+    import PyPDF2
+    results = []
+    chars = 0
+    with (open_mapped(source) if isinstance(source, str) else io.BytesIO(source)) as stream:
+        reader = PyPDF2.PdfReader(stream)
+        for page_text, elapsed in iter_pdf_pages(reader, start, stop):
+            results.append((page_text, elapsed))
+            chars += len(page_text or "")
+            if elapsed > app.config['PDF_PAGE_TIME_BUDGET'] or chars > app.config['PDF_MAX_CHARS']:
+                break
+    return results
+
+@timed
+def count_pdf_pages(file_stream):
+    # Reads only the page tree; None when the PDF can't be opened (the extraction path reports why)
+    import PyPDF2
+    try:
+        file_stream.seek(0)
+        return len(PyPDF2.PdfReader(file_stream).pages)
+    except Exception:
+        return None
+
+@timed
+def extract_pdf_parallel(file_stream, total_pages, notices, page_timings):
+    # Splits the pages to read into one range per pool worker and reassembles them in page order,
+    # applying the same limits as the serial path. Returns (text, error_message), or None when the
+    # PDF is below PDF_PARALLEL_MIN_PAGES or the pool has no room, and the caller extracts serially.
+    max_pages = app.config['PDF_MAX_PAGES']
+    pages_to_read = min(total_pages, max_pages)
+    if pages_to_read < app.config['PDF_PARALLEL_MIN_PAGES']:
+        return None
+
+    path = spool_path(file_stream)
+    if path is not None:
+        file_stream.flush()
+        source = path
+    else:
+        file_stream.seek(0)
+        source = file_stream.read()
+    range_size = -(-pages_to_read // analysis_pool.max_workers)
+    ranges = [(source, start, min(start + range_size, pages_to_read)) for start in range(0, pages_to_read, range_size)]
+    try:
+        range_results = run_cpu_jobs(extract_pdf_page_range, ranges)
+    except PoolBusyError:
+        return None
+    except PoolTimeoutError:
+        raise
+    except Exception as e:
+        return None, f"Error reading PDF: {str(e)}"
 
-    f_score = score_inputs['readability']['flesch_score']
-    if f_score < 30: deductions += 8
-    elif f_score < 50: deductions += 5
-    elif f_score < 60: deductions += 2
-    elif f_score >= 70: bonus_points += 2 
+    pages = iter_pdf_page_text((result for results in range_results for result in results),
+                               total_pages=total_pages,
+                               max_pages=max_pages,
+                               max_chars=app.config['PDF_MAX_CHARS'],
+                               page_time_budget=app.config['PDF_PAGE_TIME_BUDGET'],
+                               notices=notices,
+                               page_timings=page_timings)
+    return "".join(page_text + "\n" for page_text in pages), None
+
+def extract_upload_text(filename, file_stream):
+    # Returns (text, error_message, notices, page_timings) without copying the upload: inline extraction
+    # reads the stream in place, pool workers map spooled uploads by path, and only small in-memory
+    # uploads are sent over as bytes. Long PDFs are extracted in parallel page ranges. A PDF's page count
+    # is read once, here, and decides both its admission lane and whether it is split.
+    total_pages = None
+    if filename.lower().endswith('.pdf') and (analysis_pool is not None or admission_lease() is not None):
+        total_pages = count_pdf_pages(file_stream)
+        route_upload_by_pages(total_pages)
+    if analysis_pool is None:
+        notices, page_timings = [], []
+        file_stream.seek(0)
+        text, error_message = extract_text_from_upload(filename, file_stream, notices, page_timings)
+        return text, error_message, notices, page_timings
+    if total_pages is not None:
+        notices, page_timings = [], []
+        extracted = extract_pdf_parallel(file_stream, total_pages, notices, page_timings)
+        if extracted is not None:
+            return extracted + (notices, page_timings)
+    path = spool_path(file_stream)
+    if path is not None:
+        file_stream.flush()
+        return run_cpu_job(extract_text_from_path, filename, path)
+    file_stream.seek(0)
+    return run_cpu_job(extract_text_from_bytes, filename, file_stream.read())
+
+def request_deadline():
+    # None outside a request: queued jobs and the bulk CLI only have the per-job timeout
+    return g.get('analysis_deadline') if has_request_context() else None
+
+def run_cpu_job(fn, *args):
+    if analysis_pool is None:
+        return fn(*args)
+    # The child times its own stages (and profiles itself when this request was sampled);
+    # its timings and counter changes come back with the result and are merged into the caller's
+    profile_path = None
+    if has_request_context() and g.get('profile_path_prefix'):
+        profile_path = f"{g.profile_path_prefix}-{fn.__name__}.prof"
+    result, timings, counters = analysis_pool.run(call_collecting, fn, profile_path, *args, deadline=request_deadline())
+    merge_stage_timings(timings)
+    merge_pool_counters(counters)
+    return result
+
+def run_cpu_jobs(fn, args_list):
+    # Runs fn once per argument tuple in parallel on the pool and returns the results in order
+    profile_prefix = g.get('profile_path_prefix') if has_request_context() else None
+    jobs = [(fn, f"{profile_prefix}-{fn.__name__}-{index}.prof" if profile_prefix else None) + tuple(args)
+            for index, args in enumerate(args_list)]
+    results = []
+    for result, timings, counters in analysis_pool.run_many(call_collecting, jobs, deadline=request_deadline()):
+        merge_stage_timings(timings)
+        merge_pool_counters(counters)
+        results.append(result)
+    return results
+
+analysis_pool = None
+if app.config['ANALYSIS_POOL_WORKERS'] > 0:
+    analysis_pool = AnalysisPool(
+        max_workers=app.config['ANALYSIS_POOL_WORKERS'],
+        max_queue_depth=app.config['ANALYSIS_POOL_QUEUE_DEPTH'],
+        job_timeout=app.config['ANALYSIS_JOB_TIMEOUT'],
+        initializer=warm_analysis_worker,
+    )
 
-    i_usage_count = score_inputs['use_of_i']['i_count'] 
-    if i_usage_count > 5: deductions += 5
-    elif i_usage_count > 2: deductions += 2
 
-    if score_inputs['dates']['dates_found_count'] < 2: deductions += 4 
-    elif score_inputs['dates']['dates_found_count'] < 4: deductions += 2 
+# --- Asynchronous Jobs ---
+def process_job(job_id):
+    # Runs inside a pool worker when the pool is enabled; each section is persisted the moment it is ready
+    filename, data = job_store.get_payload(job_id)
+    text, error_message, notices, _ = extract_text_from_bytes(filename, data)
+    if error_message:
+        job_store.fail(job_id, f"Error during text extraction: {error_message}")
+        return
+    if not text or not text.strip():
+        job_store.fail(job_id, "Could not extract any text from the file, or the file is empty. If it's a scanned PDF, text extraction might fail.")
+        return
+    # A section that isn't written means the runner already failed the job (it timed out), so stop there
+    if not job_store.add_section(job_id, "Extraction", [f"Info: Successfully extracted text from '{filename}' ({len(text)} characters)."] + notices):
+        return
+
+    doc = parse_resume(text)
+    score_inputs = {}
+    for title, feedback, section_inputs in iter_analysis_sections(text, doc):
+        if not job_store.add_section(job_id, title, render_feedback(feedback)):
+            return
+        score_inputs.update(section_inputs)
+    resume_score = calculate_resume_score(score_inputs)
+    for title, feedback in score_summary_sections(resume_score):
+        if not job_store.add_section(job_id, title, render_feedback(feedback)):
+            return
+    job_store.finish(job_id, {'score': resume_score, 'score_inputs': score_inputs})
+
+def run_job(job_id):
+    with collect_stage_timings() as timings:
+        run_cpu_job(process_job, job_id)
+    observe_stage_timings(timings)
+
+job_store = JobStore(app.config['JOB_DB_PATH'])
+# A busy pool just leaves the job queued; it is picked up again on the next poll
+job_runner = JobRunner(job_store, run_job,
+                       threads=app.config['JOB_RUNNER_THREADS'],
+                       retention=app.config['JOB_RETENTION'],
+                       retry_on=(PoolBusyError,))
+
+
+# --- Job Description Matching ---
+def match_features(text):
+    # Parses a resume or job description once and keeps only what ranking needs: hashed term counts
+    # and the technical skills found. Resumes are parsed here exactly once; the index keeps the result.
+    doc = parse_resume(text)
+    return hashed_term_counts(text, app.config['JD_INDEX_DIMENSIONS']), sorted(match_keywords(text, doc)['tech_skills_found'])
+
+def index_resume_upload(filename, file_stream):
+    # Returns (key, error_message); text that is already indexed is not parsed again
+    text, error_message, _, _ = extract_upload_text(filename, file_stream)
+    if error_message:
+        return None, error_message
+    if not text or not text.strip():
+        return None, "Could not extract any text from the file, or the file is empty."
+    key = resume_key(text)
+    if match_index.get(key) is None:
+        term_counts, skills = run_cpu_job(match_features, text)
+        match_index.add(key, filename, term_counts, skills)
+    return key, None
 
-    final_score = max(0, min(100, base_score - deductions + bonus_points)) 
-    return int(final_score)
+match_index = VectorIndex(app.config['JD_INDEX_PATH'], app.config['JD_INDEX_DIMENSIONS'], sorted(TECHNICAL_SKILLS_KEYWORDS))
 
 
-# --- Main Analysis Orchestrator ---
-# Using the more detailed one from your first definition
-def analyze_resume_content(text):
-    feedback_results = []
-    score_inputs = {} 
+# --- Metrics ---
+REQUEST_DURATION = Histogram('resume_request_duration_seconds', 'Wall time per request by endpoint.', 'endpoint')
+PDF_PAGE_DURATION = Histogram('resume_pdf_page_duration_seconds', 'Wall time to extract text from one PDF page.', 'format')
+STAGE_DURATION = Histogram('resume_stage_duration_seconds', 'Wall time per pipeline stage (upload read, extraction, parse, each check, scoring).', 'stage')
+request_profiler = RequestProfiler(app.config['PROFILE_SAMPLE_PERCENT'], app.config['PROFILE_DIR'])
 
-    if not text or not text.strip():
-        feedback_results.append("Error: The extracted text is empty. Cannot analyze.")
-        return feedback_results, 0 
-
-    doc = nlp(text) 
-
-    feedback_results.append("--- Overall & Contact ---")
-    fb, data = check_contact_info(text)
-    feedback_results.extend(fb); score_inputs['contact_info'] = data
-    fb, data = check_resume_length(text)
-    feedback_results.extend(fb); score_inputs['length'] = data
-
-    feedback_results.append("\n--- Structure & Sections ---")
-    fb, data = check_section_headings(text)
-    feedback_results.extend(fb); score_inputs['sections'] = data
-    fb, data = check_dates_format(text)
-    feedback_results.extend(fb); score_inputs['dates'] = data
-
-    feedback_results.append("\n--- Content & Impact ---")
-    fb, data = check_action_verbs(doc)
-    feedback_results.extend(fb); score_inputs['action_verbs'] = data
-    fb, data = check_quantifiable_achievements(doc)
-    feedback_results.extend(fb); score_inputs['quantifiable'] = data
-    fb, data = check_skills_section(text, doc)
-    feedback_results.extend(fb); score_inputs['skills'] = data
-
-    feedback_results.append("\n--- Language & Professionalism ---")
-    fb, data = perform_spell_check(text)
-    feedback_results.extend(fb); score_inputs['spelling'] = data
-    fb, data = check_readability(text)
-    feedback_results.extend(fb); score_inputs['readability'] = data
-    fb, data = check_use_of_i(text)
-    feedback_results.extend(fb); score_inputs['use_of_i'] = data
+def observe_stage_timings(timings):
+    for name, seconds in timings.items():
+        STAGE_DURATION.observe(name, seconds)
 
-    resume_score = calculate_resume_score(score_inputs)
 
-    feedback_results.append(f"\n--- Overall Score: {resume_score}/100 ---")
-    if resume_score >= 85:
-        feedback_results.append("Excellent! Your resume hits most of the key marks for a strong document. It's likely to perform well with both ATS and human reviewers.")
-    elif resume_score >= 70:
-        feedback_results.append("Good foundation! Your resume has several strong points. Addressing the suggestions can elevate it further and increase its effectiveness.")
-    elif resume_score >= 50:
-        feedback_results.append("Needs improvement. Your resume has potential but requires attention to several key areas. Focus on the suggestions marked 'High Priority' or 'Warning'.")
+# --- JSON API Helpers ---
+def json_response(payload, status=200, headers=None):
+    # Serialised with orjson when installed; compact separators keep the stdlib fallback small too
+    if orjson is not None:
+        body = orjson.dumps(payload)
     else:
-        feedback_results.append("Significant improvement needed. Your resume may be missing critical elements or have issues that could hinder your job search. Systematically address the feedback provided.")
-
-    feedback_results.append("\n--- General Advice ---")
-    feedback_results.append("Info: This is an automated analysis. While it provides valuable insights, also consider having your resume reviewed by a career advisor, mentor, or trusted professional in your field.")
-    feedback_results.append("Info: Tailor your resume for each specific job application. Highlight the skills and experiences most relevant to the job description, and try to incorporate keywords from it.")
-    feedback_results.append("Info: Ensure your resume is free of grammatical errors (this tool has basic spell check, but grammar is more complex). Use tools like Grammarly or ask someone to proofread.")
-    feedback_results.append("Info: Keep your formatting clean, consistent, and professional. Avoid using tables, columns, or unusual fonts that might confuse Applicant Tracking Systems (ATS).")
+        body = json.dumps(payload, separators=(',', ':'))
+    return Response(body, status=status, headers=headers, mimetype='application/json')
+
+def is_api_request():
+    return request.path.startswith('/api/')
+
+def wants_flag(name):
+    value = request.args.get(name, request.form.get(name, ''))
+    return value.lower() in ('1', 'true', 'yes', 'on')
+
+
+# --- Admission Control ---
+# Checked in before_request, before the upload is read or parsed (see admission.py). Endpoints that
+# analyze in the request also hold an in-flight slot until the request ends; /jobs only queues work,
+# so it is rate limited without a slot.
+ADMITTED_ENDPOINTS = frozenset(['render_index_page', 'analyze', 'api_analyze', 'analyze_batch', 'api_index_resumes', 'api_match'])
+RATE_LIMITED_ENDPOINTS = ADMITTED_ENDPOINTS | {'submit_jobs'}
+HTML_UPLOAD_ENDPOINTS = frozenset(['render_index_page', 'analyze'])
+
+admission = None
+if app.config['ADMISSION_CONTROL']:
+    admission = AdmissionController(
+        app.config['ADMISSION_DB_PATH'],
+        rate=app.config['ADMISSION_RATE'],
+        burst=app.config['ADMISSION_BURST'],
+        bytes_per_token=app.config['ADMISSION_BYTES_PER_TOKEN'],
+        max_in_flight=app.config['ADMISSION_MAX_IN_FLIGHT'],
+        slow_lane_slots=app.config['ADMISSION_SLOW_LANE_SLOTS'],
+        slow_lane_bytes=app.config['ADMISSION_SLOW_LANE_BYTES'],
+        slow_lane_pages=app.config['ADMISSION_SLOW_LANE_PAGES'],
+        lease_timeout=app.config['ADMISSION_LEASE_TIMEOUT'],
+    )
 
-    return [f for f in feedback_results if f is not None], resume_score
+def admission_client():
+    # The address the outermost of our proxies saw, i.e. the X-Forwarded-For entry ADMISSION_PROXY_HOPS
+    # places from the right. Entries further left come from the client and can't be trusted. Without
+    # the header, the peer address.
+    hops = app.config['ADMISSION_PROXY_HOPS']
+    header = app.config['ADMISSION_CLIENT_HEADER']
+    forwarded = [hop.strip() for hop in request.headers.get(header, '').split(',') if hop.strip()] if hops and header else []
+    if forwarded:
+        return forwarded[-min(hops, len(forwarded))]
+    return request.remote_addr or 'unknown'
+
+def admission_lease():
+    return g.get('admission_lease') if has_request_context() else None
+
+def route_upload_by_pages(total_pages):
+    # Long PDFs move to the slow lane once the upload is in, before any page text is extracted.
+    # Outside an admitted request, or for an unreadable PDF, this does nothing.
+    lease = admission_lease()
+    if lease is None or total_pages is None:
+        return
+    admission.route_by_pages(lease, total_pages)
 
 
 # --- Flask Routes ---
+@app.before_request
+def start_request_metrics():
+    g.request_started = time.perf_counter()
+    g.analysis_deadline = time.time() + app.config['ANALYSIS_REQUEST_TIMEOUT']
+    g.stage_timings = start_stage_timings()
+    g.profile_path_prefix = request_profiler.new_path_prefix(request.endpoint)
+    g.profiler = request_profiler.start() if g.profile_path_prefix else None
+
+@app.after_request
+def finish_request_metrics(response):
+    total = time.perf_counter() - g.request_started
+    if g.profiler is not None:
+        request_profiler.stop(g.profiler, f"{g.profile_path_prefix}-web.prof")
+    REQUEST_DURATION.observe(request.endpoint or 'unknown', total)
+    observe_stage_timings(g.stage_timings)
+    if app.config['SERVER_TIMING']:
+        response.headers['Server-Timing'] = server_timing_header(g.stage_timings, total)
+    return response
+
+@app.before_request
+def start_job_runner():
+    job_runner.ensure_started()
+
+@app.before_request
+def admit_upload():
+    # Only headers have been read at this point: a rejected upload is never received or parsed
+    g.admission_lease = None
+    if admission is None or request.method != 'POST' or request.endpoint not in RATE_LIMITED_ENDPOINTS:
+        return
+    content_length = request.content_length
+    if content_length is None:
+        content_length = app.config['MAX_CONTENT_LENGTH']
+    g.admission_lease = admission.admit(admission_client(), content_length, hold_slot=request.endpoint in ADMITTED_ENDPOINTS)
+
+@app.teardown_request
+def release_admission(error=None):
+    if admission is not None:
+        admission.release(g.pop('admission_lease', None))
+
+@app.errorhandler(AdmissionRejected)
+def handle_admission_rejected(error):
+    headers = {'Retry-After': str(max(1, int(error.retry_after + 0.999)))}
+    if request.endpoint not in HTML_UPLOAD_ENDPOINTS:
+        return json_response({'error': str(error)}, error.status, headers)
+    feedback_messages = [f"Error: {error}"]
+    return render_template('index.html', feedback=feedback_messages, text="", score=None, now=datetime.now), error.status, headers
+
+@app.errorhandler(PoolBusyError)
+def handle_pool_busy(error):
+    # Rejected before any work was queued, so this is cheap; clients should retry shortly
+    if is_api_request():
+        return json_response({'error': str(error)}, 503, {'Retry-After': '5'})
+    feedback_messages = ["Error: The analyzer is busy right now. Please try again in a few seconds."]
+    return render_template('index.html', feedback=feedback_messages, text="", score=None, now=datetime.now), 503, {'Retry-After': '5'}
+
+@app.errorhandler(PoolTimeoutError)
+def handle_pool_timeout(error):
+    if is_api_request():
+        return json_response({'error': str(error)}, 504)
+    feedback_messages = [f"Error: {error} The document may be too large or complex to analyze."]
+    return render_template('index.html', feedback=feedback_messages, text="", score=None, now=datetime.now), 504
+
+@app.route('/metrics')
+def metrics_endpoint():
+    # Prometheus text exposition format
+    lines = REQUEST_DURATION.render() + STAGE_DURATION.render()
+    spell_stats = spell_cache_stats()
+    lines += render_metric('resume_spell_cache_requests_total', 'Spell-check word lookups by cache result, in this worker and its pool processes.', 'counter',
+                           [({'result': 'hit'}, spell_stats['hits']), ({'result': 'miss'}, spell_stats['misses'])])
+    lines += render_metric('resume_spell_cache_entries', 'Words in the spell-check caches of this worker and its pool processes.', 'gauge',
+                           [({}, spell_stats['size'])])
+    lines += render_metric('resume_startup_seconds', 'Wall time of each startup import and load step in this process.', 'gauge',
+                           [({'step': name}, seconds) for name, seconds in STARTUP_TIMINGS.items()])
+    if analysis_pool is not None:
+        pool = analysis_pool.stats()
+        lines += render_metric('resume_analysis_pool_jobs_total', 'Analysis pool jobs by outcome.', 'counter',
+                               [({'outcome': outcome}, pool[outcome]) for outcome in ('submitted', 'completed', 'failed', 'rejected', 'timed_out')])
+        lines += render_metric('resume_analysis_pool_recycles_total', 'Times the pool killed its workers to stop a timed-out job.', 'counter',
+                               [({}, pool['recycled'])])
+        lines += render_metric('resume_analysis_pool_queue_wait_seconds_total', 'Time jobs spent waiting for a worker.', 'counter',
+                               [({}, pool['queue_wait_seconds_total'])])
+        lines += render_metric('resume_analysis_pool_run_seconds_total', 'Time jobs spent running in a worker.', 'counter',
+                               [({}, pool['run_seconds_total'])])
+        lines += render_metric('resume_analysis_pool_workers', 'Configured analysis pool workers.', 'gauge',
+                               [({}, pool['max_workers'])])
+    if admission is not None:
+        decisions = admission.stats()
+        lines += render_metric('resume_admission_decisions_total', 'Upload requests by admission decision.', 'counter',
+                               [({'decision': decision}, decisions[decision]) for decision in ('admitted', 'rate_limited', 'busy')])
+        lines += render_metric('resume_admission_slow_lane_total', 'Admitted uploads routed to the slow lane by size or page count.', 'counter',
+                               [({}, decisions['slow_lane'])])
+    return Response("\n".join(lines) + "\n", mimetype='text/plain; version=0.0.4')
+
+@app.route('/pool/stats')
+def pool_stats():
+    if analysis_pool is None:
+        return jsonify({'enabled': False})
+    return jsonify(dict(analysis_pool.stats(), enabled=True))
+
 @app.route('/', methods=['GET', 'POST'])
 def render_index_page(): # Renamed from 'index' to avoid endpoint collision
     feedback_messages = []
@@ -458,24 +1301,20 @@ def render_index_page(): # Renamed from 'index' to avoid endpoint collision
 
         if file:
             filename = file.filename
-            file_stream = io.BytesIO()
-            file.save(file_stream) 
-            file_stream.seek(0) 
-
-            error_message = None
-            if filename.lower().endswith('.pdf'):
-                extracted_text_content, error_message = extract_text_from_pdf(file_stream)
-            elif filename.lower().endswith('.docx'):
-                extracted_text_content, error_message = extract_text_from_docx(file_stream)
-            else:
+            file_stream = file.stream
+
+            if not filename.lower().endswith(('.pdf', '.docx')):
                 feedback_messages.append("Error: Unsupported file type. Please upload a PDF or DOCX file.")
                 return render_template('index.html', feedback=feedback_messages, text=extracted_text_content, score=resume_score, now=datetime.now)
 
+            extraction_notices = []
+            extracted_text_content, error_message, analysis = analyze_resume_file(filename, file_stream, extraction_notices)
             if error_message:
                 feedback_messages.append(f"Error during text extraction: {error_message}")
             elif extracted_text_content and extracted_text_content.strip():
                 feedback_messages.append(f"Info: Successfully extracted text from '{filename}' ({len(extracted_text_content)} characters).")
-                analysis_results, resume_score_val = analyze_resume_content(extracted_text_content)
+                feedback_messages.extend(extraction_notices)
+                analysis_results, resume_score_val = analysis
                 feedback_messages.extend(analysis_results)
                 resume_score = resume_score_val 
             else:
@@ -516,26 +1355,21 @@ def analyze():
 
     if file:
         filename = file.filename
-        # The original /analyze route read the file directly, not save to BytesIO then read.
-        # For consistency with the main route, using BytesIO:
-        file_stream = io.BytesIO()
-        file.save(file_stream)
-        file_stream.seek(0)
+        # Read straight from the received upload, like the main route
+        file_stream = file.stream
 
-        error_message = None
-        if filename.lower().endswith('.pdf'): # Used .endswith in original /analyze
-            extracted_text_content, error_message = extract_text_from_pdf(file_stream)
-        elif filename.lower().endswith('.docx'): # Used .endswith in original /analyze
-            extracted_text_content, error_message = extract_text_from_docx(file_stream)
-        else:
+        if not filename.lower().endswith(('.pdf', '.docx')):
             feedback_messages.append("Error: Unsupported file type. Please upload a PDF or DOCX file.")
             return render_template('index.html', feedback=feedback_messages, text=extracted_text_content, score=resume_score)
 
+        extraction_notices = []
+        extracted_text_content, error_message, analysis = analyze_resume_file(filename, file_stream, extraction_notices)
         if error_message:
             feedback_messages.append(f"Error during text extraction: {error_message}")
         elif extracted_text_content and extracted_text_content.strip():
             feedback_messages.append(f"Info: Successfully extracted text from '{filename}' ({len(extracted_text_content)} characters).")
-            analysis_results, resume_score_val = analyze_resume_content(extracted_text_content)
+            feedback_messages.extend(extraction_notices)
+            analysis_results, resume_score_val = analysis
             feedback_messages.extend(analysis_results)
             resume_score = resume_score_val
         else:
@@ -545,6 +1379,205 @@ def analyze():
     return render_template('index.html', feedback=feedback_messages, text=extracted_text_content, score=resume_score)
 
 
+@app.route('/api/analyze', methods=['POST'])
+def api_analyze():
+    # Machine-readable analysis: score inputs, feedback grouped by section and the score.
+    # The extracted text is only echoed back when include_text=1 is passed, and the feedback's
+    # message codes and parameters only with include_messages=1.
+    file = request.files.get('resume')
+    if file is None or file.filename == '':
+        return json_response({'error': "No file uploaded. Send a PDF or DOCX file in the 'resume' field."}, 400)
+    if not file.filename.lower().endswith(('.pdf', '.docx')):
+        return json_response({'error': "Unsupported file type. Please upload a PDF or DOCX file."}, 415)
+
+    notices, page_timings = [], []
+    text, error_message, report = analyze_resume_upload(file.filename, file.stream, notices, page_timings)
+    if error_message:
+        return json_response({'error': f"Error during text extraction: {error_message}", 'notices': notices}, 422)
+    if report is None:
+        return json_response({'error': "Could not extract any text from the file, or the file is empty.", 'notices': notices}, 422)
+
+    payload = {
+        'filename': file.filename,
+        'characters': len(text),
+        'notices': notices,
+        'score': report['score'],
+        'score_inputs': report['score_inputs'],
+        'sections': render_report_sections(report, include_messages=wants_flag('include_messages')),
+        # Empty when the upload was served from the result cache
+        'page_timings': [{'page': page_number, 'ms': round(seconds * 1000, 2)} for page_number, seconds in page_timings],
+    }
+    if wants_flag('include_text'):
+        payload['text'] = text
+    return json_response(payload)
+
+
+@app.route('/api/match/resumes', methods=['POST'])
+def api_index_resumes():
+    # Adds uploaded resumes to the match index so later job descriptions can rank them without re-parsing
+    files = [f for f in request.files.getlist('resumes') if f.filename]
+    if not files:
+        return json_response({'error': "No files uploaded. Send one or more PDF/DOCX files in the 'resumes' field."}, 400)
+    indexed = []
+    for file in files:
+        if not file.filename.lower().endswith(('.pdf', '.docx')):
+            indexed.append({'filename': file.filename, 'id': None, 'error': "Unsupported file type. Please upload a PDF or DOCX file."})
+            continue
+        key, error_message = index_resume_upload(file.filename, file.stream)
+        indexed.append({'filename': file.filename, 'id': key, 'error': error_message})
+    return json_response({'indexed': indexed, 'index_size': len(match_index)})
+
+@app.route('/api/match', methods=['POST'])
+def api_match():
+    # Ranks resumes against the job description in 'job_description'. Resumes uploaded in 'resumes' are
+    # indexed first and only they are ranked; without uploads the whole index is ranked.
+    job_description = request.form.get('job_description', '')
+    if not job_description.strip():
+        return json_response({'error': "No job description. Send its text in the 'job_description' field."}, 400)
+    try:
+        top_k = int(request.form.get('top_k', request.args.get('top_k', app.config['JD_MATCH_TOP_K'])))
+    except ValueError:
+        return json_response({'error': "top_k must be an integer."}, 400)
+    if top_k < 1:
+        return json_response({'error': "top_k must be at least 1."}, 400)
+
+    indexed = []
+    for file in request.files.getlist('resumes'):
+        if not file.filename:
+            continue
+        if not file.filename.lower().endswith(('.pdf', '.docx')):
+            indexed.append({'filename': file.filename, 'id': None, 'error': "Unsupported file type. Please upload a PDF or DOCX file."})
+            continue
+        key, error_message = index_resume_upload(file.filename, file.stream)
+        indexed.append({'filename': file.filename, 'id': key, 'error': error_message})
+
+    term_counts, skills = run_cpu_job(match_features, job_description)
+    keys = [entry['id'] for entry in indexed if entry['id']] if indexed else None
+    with stage('rank'):
+        matches = match_index.rank(term_counts, skills, top_k=top_k, skill_weight=app.config['JD_SKILL_WEIGHT'], keys=keys)
+    return json_response({
+        'job_description': {'characters': len(job_description), 'skills': skills},
+        'indexed': indexed,
+        'index_size': len(match_index),
+        'matches': matches,
+    })
+
+
+@app.route('/analyze/batch', methods=['POST'])
+def analyze_batch():
+    files = [f for f in request.files.getlist('resumes') if f.filename]
+    if not files:
+        return jsonify({'error': "No files uploaded. Send one or more PDF/DOCX files in the 'resumes' field."}), 400
+
+    # Each upload goes through the result cache and pool extraction like /api/analyze; the resumes left to
+    # analyze are split into one nlp.pipe batch per pool worker, all under the request's deadline
+    results = []
+    pending = []
+    for file in files:
+        notices = []
+        text, error_message, report, cache_keys = recall_resume_upload(file.filename, file.stream, notices)
+        result = {'filename': file.filename, 'error': error_message, 'notices': notices, 'feedback': [], 'score': None}
+        results.append(result)
+        if error_message:
+            continue
+        if report is not None:
+            result['feedback'], result['score'] = report_feedback(report), report['score']
+        elif cache_keys is not None:
+            pending.append((result, text, cache_keys))
+        else:
+            result['feedback'], result['score'] = ["Error: The extracted text is empty. Cannot analyze."], 0
+
+    texts = [text for _, text, _ in pending]
+    if analysis_pool is None:
+        chunks = [analyze_reports_batch(texts)]
+    else:
+        chunk_size = max(1, -(-len(texts) // analysis_pool.max_workers))
+        chunks = run_cpu_jobs(analyze_reports_batch, [(texts[start:start + chunk_size],) for start in range(0, len(texts), chunk_size)])
+    # Results keep upload order
+    reports = [report for chunk in chunks for report in chunk]
+    for (result, text, cache_keys), report in zip(pending, reports):
+        remember_resume_report(text, report, cache_keys)
+        result['feedback'], result['score'] = report_feedback(report), report['score']
+
+    return jsonify({'results': results})
+
+
+@app.route('/jobs', methods=['POST'])
+def submit_jobs():
+    files = [f for f in request.files.getlist('resumes') + request.files.getlist('resume') if f.filename]
+    if not files:
+        return jsonify({'error': "No files uploaded. Send one or more PDF/DOCX files in the 'resumes' field."}), 400
+
+    jobs = []
+    for file in files:
+        if not file.filename.lower().endswith(('.pdf', '.docx')):
+            jobs.append({'filename': file.filename, 'error': "Unsupported file type. Please upload a PDF or DOCX file."})
+            continue
+        job_id = job_store.create(file.filename, file.read())
+        jobs.append({
+            'id': job_id,
+            'filename': file.filename,
+            'status': 'queued',
+            'status_url': url_for('get_job', job_id=job_id),
+            'events_url': url_for('stream_job_events', job_id=job_id),
+        })
+    return jsonify({'jobs': jobs}), 202
+
+@app.route('/jobs/<job_id>')
+def get_job(job_id):
+    job = job_store.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Job not found.'}), 404
+    return jsonify(job)
+
+@app.route('/jobs/<job_id>/events')
+def stream_job_events(job_id):
+    # Server-sent events: one 'section' event per finished check section, then a final 'done' or 'failed',
+    # or 'timeout' after JOB_STREAM_TIMEOUT. The stream holds a request thread while it polls, so gunicorn
+    # runs threaded workers (see gunicorn.conf.py).
+    if job_store.get(job_id) is None:
+        return jsonify({'error': 'Job not found.'}), 404
+
+    def events():
+        last_seq = -1
+        deadline = time.time() + app.config['JOB_STREAM_TIMEOUT']
+        while True:
+            job = job_store.get(job_id, sections_after=last_seq)
+            if job is None:
+                # Purged while streaming
+                yield f"event: failed\ndata: {json.dumps({'id': job_id, 'status': 'failed', 'result': None, 'error': 'Job not found.'})}\n\n"
+                return
+            for section in job['sections']:
+                last_seq = section['seq']
+                yield f"event: section\ndata: {json.dumps(section)}\n\n"
+            if job['status'] in ('done', 'failed'):
+                payload = {'id': job_id, 'status': job['status'], 'result': job['result'], 'error': job['error']}
+                yield f"event: {job['status']}\ndata: {json.dumps(payload)}\n\n"
+                return
+            if time.time() > deadline:
+                # The job carries on; the client can poll status_url or open the stream again
+                yield f"event: timeout\ndata: {json.dumps({'id': job_id, 'status': job['status'], 'last_seq': last_seq})}\n\n"
+                return
+            time.sleep(0.25)
+
+    return Response(stream_with_context(events()), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+
+# --- Startup ---
+def start_background_workers():
+    # Forks the analysis pool only once the whole module is loaded, so workers see every job function defined above
+    if analysis_pool is not None:
+        with startup_step('warm analysis pool'):
+            analysis_pool.warm()
+
+STARTUP_TIMINGS['total import'] = time.perf_counter() - _startup_started
+# Under gunicorn's preload mode the app is imported once in the master; forking the pool there would leave
+# it orphaned in the master, so gunicorn.conf.py defers it to post_fork in every web worker instead
+if not app.config['DEFER_BACKGROUND_START']:
+    start_background_workers()
+
+
 if __name__ == '__main__':
     # For development, debug=True is fine. 
     # For production (like on Render), Gunicorn will be used and this block isn't run by Gunicorn.
@@ -0,0 +1,156 @@
+import contextlib
+import os
+import sqlite3
+import threading
+import time
+import uuid
+
+# --- Admission Control ---
+# Decides whether an upload request may start before its body is read: a per-client token bucket
+# limits the request rate, and a cap on in-flight analyses keeps a burst from tying up every web
+# worker. A request's cost in tokens grows with its Content-Length. Large uploads and PDFs with many
+# pages run in a separate slow lane with its own (smaller) slot limit, so they queue behind each
+# other instead of in front of ordinary resumes. Buckets and in-flight leases live in a local SQLite
+# file so every gunicorn worker on the host sees the same counts. A lease expires on its own if the
+# process holding it dies.
+
+FAST_LANE = 'fast'
+SLOW_LANE = 'slow'
+PRUNE_EVERY = 1000  # admissions between sweeps of idle client buckets
+
+
+class AdmissionRejected(Exception):
+    def __init__(self, message, status, retry_after):
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    def __init__(self, path, rate, burst, bytes_per_token, max_in_flight, slow_lane_slots,
+                 slow_lane_bytes, slow_lane_pages, lease_timeout):
+        self.path = path
+        self.rate = rate  # tokens per second per client
+        self.burst = burst
+        self.bytes_per_token = bytes_per_token
+        self.max_in_flight = max_in_flight
+        self.slow_lane_slots = slow_lane_slots
+        self.slow_lane_bytes = slow_lane_bytes
+        self.slow_lane_pages = slow_lane_pages
+        self.lease_timeout = lease_timeout
+        self._lock = threading.Lock()
+        self._admissions = 0
+        self._stats = {'admitted': 0, 'rate_limited': 0, 'busy': 0, 'slow_lane': 0}
+        directory = os.path.dirname(os.path.abspath(path))
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS buckets (client TEXT PRIMARY KEY, tokens REAL NOT NULL, updated_at REAL NOT NULL)")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS leases ("
+                "id TEXT PRIMARY KEY, client TEXT NOT NULL, lane TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+
+    @contextlib.contextmanager
+    def _connect(self):
+        # Short-lived connections, as in jobs.py: safe across threads and forked workers
+        conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+        try:
+            conn.execute("PRAGMA synchronous=NORMAL")
+            yield conn
+        finally:
+            conn.close()
+
+    @contextlib.contextmanager
+    def _transaction(self):
+        with self._connect() as conn:
+            # BEGIN IMMEDIATE: the check and the update below can't interleave with another worker's
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def _record(self, **counts):
+        with self._lock:
+            for key, value in counts.items():
+                self._stats[key] += value
+
+    def stats(self):
+        with self._lock:
+            return dict(self._stats)
+
+    def estimate_cost(self, content_length):
+        # Returns (tokens, lane). A request without a Content-Length is charged as the largest upload;
+        # the cost is capped at the burst size so that any single allowed upload can eventually pass.
+        tokens = min(self.burst, 1.0 + content_length / self.bytes_per_token)
+        return tokens, SLOW_LANE if content_length >= self.slow_lane_bytes else FAST_LANE
+
+    def _lane_capacity(self, lane):
+        return self.slow_lane_slots if lane == SLOW_LANE else self.max_in_flight
+
+    def admit(self, client, content_length, hold_slot=True):
+        # Charges the client's bucket and, when hold_slot is set, takes an in-flight slot in the lane
+        # the request's size calls for. Returns the lease id (None without a slot); raises
+        # AdmissionRejected with 429 when the client is over its rate and 503 when the lane is full.
+        cost, lane = self.estimate_cost(content_length)
+        now = time.time()
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM leases WHERE expires_at < ?", (now,))
+            row = conn.execute("SELECT tokens, updated_at FROM buckets WHERE client = ?", (client,)).fetchone()
+            tokens = self.burst if row is None else min(self.burst, row[0] + (now - row[1]) * self.rate)
+            if tokens < cost:
+                self._record(rate_limited=1)
+                retry_after = (cost - tokens) / self.rate
+                raise AdmissionRejected(f"Too many requests. Try again in {retry_after:.0f} seconds.", 429, retry_after)
+            lease = None
+            if hold_slot:
+                in_flight = conn.execute("SELECT COUNT(*) FROM leases WHERE lane = ?", (lane,)).fetchone()[0]
+                if in_flight >= self._lane_capacity(lane):
+                    # Nothing is charged for a request turned away for lack of capacity
+                    self._record(busy=1)
+                    raise AdmissionRejected(self._busy_message(lane), 503, 5)
+                lease = uuid.uuid4().hex
+                conn.execute("INSERT INTO leases (id, client, lane, expires_at) VALUES (?, ?, ?, ?)",
+                             (lease, client, lane, now + self.lease_timeout))
+            conn.execute("INSERT OR REPLACE INTO buckets (client, tokens, updated_at) VALUES (?, ?, ?)",
+                         (client, tokens - cost, now))
+            with self._lock:
+                self._admissions += 1
+                prune = self._admissions % PRUNE_EVERY == 0
+            if prune:
+                # A bucket that has refilled completely is the same as no bucket at all
+                conn.execute("DELETE FROM buckets WHERE updated_at < ?", (now - self.burst / self.rate,))
+        self._record(admitted=1, slow_lane=int(lane == SLOW_LANE))
+        return lease
+
+    def route_by_pages(self, lease, pages):
+        # Moves an admitted request to the slow lane once its page count is known, before any text
+        # is extracted. Raises AdmissionRejected (503) when the slow lane is full.
+        if lease is None or pages < self.slow_lane_pages:
+            return
+        with self._transaction() as conn:
+            row = conn.execute("SELECT lane FROM leases WHERE id = ?", (lease,)).fetchone()
+            if row is None or row[0] == SLOW_LANE:
+                return
+            in_flight = conn.execute("SELECT COUNT(*) FROM leases WHERE lane = ? AND expires_at >= ?",
+                                     (SLOW_LANE, time.time())).fetchone()[0]
+            if in_flight >= self.slow_lane_slots:
+                self._record(busy=1)
+                raise AdmissionRejected(self._busy_message(SLOW_LANE), 503, 5)
+            conn.execute("UPDATE leases SET lane = ? WHERE id = ?", (SLOW_LANE, lease))
+        self._record(slow_lane=1)
+
+    def release(self, lease):
+        if lease is None:
+            return
+        with self._connect() as conn:
+            conn.execute("DELETE FROM leases WHERE id = ?", (lease,))
+
+    def _busy_message(self, lane):
+        if lane == SLOW_LANE:
+            return f"{self.slow_lane_slots} large documents are already being analyzed."
+        return f"{self.max_in_flight} resumes are already being analyzed."
@@ -0,0 +1,162 @@
+import datetime
+import io
+import os
+import random
+
+import docx
+
+# --- Synthetic Resume Corpus ---
+# Deterministic resumes for benchmarking: the same seed always yields the same text, and the same
+# text always yields the same PDF bytes. Documents mix the things the checks look for (headings,
+# action verbs, numbers, dates, skills, first-person phrasing and a few misspellings) so every
+# check does realistic work. Nothing here needs the network or the spaCy model.
+
+FIRST_NAMES = ["Alex", "Jordan", "Sam", "Taylor", "Morgan", "Casey", "Riley", "Jamie", "Avery", "Quinn"]
+LAST_NAMES = ["Nguyen", "Garcia", "Smith", "Okafor", "Kowalski", "Haddad", "Tanaka", "Silva", "Novak", "Reyes"]
+COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella Labs", "Stark Industries", "Wayne Analytics", "Hooli", "Vandelay Imports"]
+TITLES = ["Software Engineer", "Data Analyst", "Project Manager", "DevOps Engineer", "Product Designer", "QA Lead", "Machine Learning Engineer"]
+SCHOOLS = ["State University", "Institute of Technology", "City College", "Polytechnic University"]
+DEGREES = ["B.Sc. in Computer Science", "M.Sc. in Data Science", "B.A. in Economics", "MBA"]
+VERBS = ["Led", "Managed", "Developed", "Implemented", "Designed", "Optimized", "Automated", "Launched",
+         "Reduced", "Increased", "Coordinated", "Mentored", "Built", "Streamlined", "Analyzed", "Delivered"]
+OBJECTS = ["the billing platform", "a data pipeline", "customer onboarding", "the CI/CD workflow", "an internal dashboard",
+           "the search service", "quarterly reporting", "a mobile app", "the deployment process", "API integrations"]
+RESULTS = ["reducing costs by {n}%", "improving latency by {n}%", "serving {n},000 users", "saving {n} hours per week",
+           "increasing revenue by ${n}K", "cutting incidents by {n}%", "across {n} teams"]
+SKILLS = ["Python", "Java", "SQL", "AWS", "Docker", "Kubernetes", "React", "Node.js", "Git", "Machine Learning",
+          "Data Analysis", "Project Management", "Agile", "Scrum", "Tableau", "Excel", "Linux", "REST APIs"]
+FILLER = ["responsible for", "worked closely with", "stakeholders", "requirements", "documentation", "cross-functional",
+          "environment", "production", "deadlines", "quality", "collaboration", "architecture", "performance"]
+TYPOS = ["managment", "developement", "recieved", "acheived", "enviroment", "sucessful", "teh", "responsable"]
+MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+
+# Word counts and page counts exercised by the default corpus; (format, words, pages) with pages=None
+# meaning "as many pages as the text naturally fills"
+DEFAULT_SPECS = [
+    ('pdf', 200, None), ('docx', 200, None),
+    ('pdf', 600, None), ('docx', 600, None),
+    ('pdf', 1500, None), ('docx', 1500, None),
+    ('pdf', 5000, None), ('docx', 5000, None),
+    ('pdf', 5000, 50),
+]
+
+LINES_PER_PDF_PAGE = 50
+FIXED_TIMESTAMP = datetime.datetime(2024, 1, 1)
+
+
+def _bullet(rng):
+    line = f"{rng.choice(VERBS)} {rng.choice(OBJECTS)}, {rng.choice(RESULTS).format(n=rng.randint(5, 90))}"
+    if rng.random() < 0.3:
+        line += f" {rng.choice(FILLER)} {rng.choice(FILLER)}"
+    if rng.random() < 0.1:
+        line = "I " + line[0].lower() + line[1:]
+    if rng.random() < 0.08:
+        line += f" {rng.choice(TYPOS)}"
+    return "- " + line + "."
+
+def _date_range(rng):
+    start = rng.randint(2008, 2020)
+    end = start + rng.randint(1, 4)
+    if rng.random() < 0.5:
+        return f"{rng.choice(MONTHS)} {start} - {rng.choice(MONTHS)} {end}"
+    return f"{start} - {'Present' if end > 2023 else end}"
+
+def generate_resume_lines(rng, target_words):
+    # Returns resume lines whose total word count is close to target_words
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    handle = name.lower().replace(" ", ".")
+    lines = [
+        name,
+        f"{handle}@example.com | (555) {rng.randint(100, 999)}-{rng.randint(1000, 9999)} | linkedin.com/in/{handle.replace('.', '')}",
+        "",
+        "Summary",
+        f"{rng.choice(TITLES)} with {rng.randint(2, 15)} years of experience in {rng.choice(OBJECTS)} and {rng.choice(OBJECTS)}.",
+        "",
+        "Skills",
+        ", ".join(rng.sample(SKILLS, 8)),
+        "",
+        "Education",
+        f"{rng.choice(DEGREES)}, {rng.choice(SCHOOLS)}, {rng.randint(2004, 2018)}",
+        "",
+        "Experience",
+    ]
+    words = sum(len(line.split()) for line in lines)
+    while words < target_words:
+        role = [f"{rng.choice(TITLES)}, {rng.choice(COMPANIES)}", _date_range(rng)]
+        role += [_bullet(rng) for _ in range(rng.randint(3, 6))]
+        role.append("")
+        lines.extend(role)
+        words += sum(len(line.split()) for line in role)
+    return lines
+
+def _escape_pdf_text(line):
+    return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+def render_pdf(lines, pages=None):
+    # Minimal uncompressed PDF with one Helvetica text stream per page; pages=None fills pages
+    # LINES_PER_PDF_PAGE lines at a time, otherwise lines are spread evenly over that many pages
+    if pages is None:
+        pages = max(1, -(-len(lines) // LINES_PER_PDF_PAGE))
+    per_page = -(-len(lines) // pages) if lines else 0
+    page_lines = [lines[i * per_page:(i + 1) * per_page] for i in range(pages)]
+
+    objects = [b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>", None]  # 1: font, 2: page tree
+    kids = []
+    for chunk in page_lines:
+        content = "BT /F1 10 Tf 40 800 Td 14 TL " + " ".join(f"({_escape_pdf_text(line)}) '" for line in chunk) + " ET"
+        content = content.encode('latin-1', 'replace')
+        objects.append(b"<< /Length %d >>\nstream\n" % len(content) + content + b"\nendstream")
+        objects.append(b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] /Contents %d 0 R "
+                       b"/Resources << /Font << /F1 1 0 R >> >> >>" % len(objects))
+        kids.append(len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(b"%d 0 R" % kid for kid in kids), len(kids))
+    objects.append(b"<< /Type /Catalog /Pages 2 0 R >>")
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref_offset = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, len(objects), xref_offset)
+    return bytes(out)
+
+def render_docx(lines):
+    document = docx.Document()
+    # Fixed metadata so repeated runs produce the same document
+    document.core_properties.created = FIXED_TIMESTAMP
+    document.core_properties.modified = FIXED_TIMESTAMP
+    document.core_properties.author = "benchmark"
+    for line in lines:
+        document.add_paragraph(line)
+    stream = io.BytesIO()
+    document.save(stream)
+    return stream.getvalue()
+
+def generate_corpus(seed=0, specs=DEFAULT_SPECS, repeat=1):
+    # Returns a list of {'filename', 'size', 'format', 'words', 'pages', 'data'} dicts
+    rng = random.Random(seed)
+    corpus = []
+    for round_number in range(repeat):
+        for file_format, target_words, pages in specs:
+            lines = generate_resume_lines(rng, target_words)
+            data = render_pdf(lines, pages) if file_format == 'pdf' else render_docx(lines)
+            size = f"{target_words}w" + (f"-{pages}p" if pages else "")
+            corpus.append({
+                'filename': f"resume-{round_number:02d}-{size}.{file_format}",
+                'size': f"{file_format}-{size}",
+                'format': file_format,
+                'words': sum(len(line.split()) for line in lines),
+                'pages': pages,
+                'data': data,
+            })
+    return corpus
+
+def write_corpus(corpus, directory):
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+    for document in corpus:
+        with open(os.path.join(directory, document['filename']), 'wb') as f:
+            f.write(document['data'])
@@ -0,0 +1,237 @@
+import argparse
+import io
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.corpus import generate_corpus, write_corpus
+
+# --- Benchmark Runner ---
+# Runs the synthetic corpus through the same extraction + analysis path the web routes use and records
+# per-stage latency percentiles, throughput, peak RSS and model-load time as a JSON baseline.
+# Fully offline: the corpus is generated locally and the spaCy model must already be installed.
+#
+#   python -m benchmarks.run run --repeat 3 --output benchmarks/results/baseline.json
+#   python -m benchmarks.run run --compare benchmarks/results/baseline.json
+#   python -m benchmarks.run compare benchmarks/results/baseline.json benchmarks/results/new.json
+#   python -m benchmarks.run corpus /tmp/resumes
+
+PERCENTILES = (50, 90, 95, 99)
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+
+
+def percentile(sorted_values, q):
+    # Linear interpolation between closest ranks
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+def summarize(samples):
+    values = sorted(samples)
+    summary = {f"p{q}_ms": percentile(values, q) * 1000 for q in PERCENTILES}
+    summary['mean_ms'] = sum(values) / len(values) * 1000 if values else 0.0
+    summary['max_ms'] = values[-1] * 1000 if values else 0.0
+    summary['count'] = len(values)
+    return summary
+
+def peak_rss_mb():
+    # ru_maxrss is in kilobytes on Linux; children covers analysis pool workers when they are enabled
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024
+    return {'self': own, 'children': children}
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def load_app(args):
+    # Configure before import: no result cache (it would hide repeat work), inline analysis unless a
+    # pool is requested, no admission control, and throwaway paths for every on-disk store
+    scratch = tempfile.mkdtemp(prefix='resume-bench-')
+    os.environ['SPACY_PIPELINE_PROFILE'] = args.profile
+    os.environ['ANALYSIS_POOL_WORKERS'] = str(args.pool_workers)
+    os.environ['RESULT_CACHE_BACKEND'] = 'none'
+    os.environ['ADMISSION_CONTROL'] = '0'
+    os.environ['JOB_DB_PATH'] = os.path.join(scratch, 'jobs.sqlite3')
+    os.environ['UPLOAD_FOLDER'] = os.path.join(scratch, 'uploads')
+    os.environ['JD_INDEX_PATH'] = os.path.join(scratch, 'jd_index')
+    os.environ['ADMISSION_DB_PATH'] = os.path.join(scratch, 'admission.sqlite3')
+    started = time.perf_counter()
+    import App
+    import_seconds = time.perf_counter() - started
+    return App, import_seconds
+
+def run_benchmark(args):
+    corpus = generate_corpus(seed=args.seed, repeat=args.repeat)
+    App, import_seconds = load_app(args)
+    from metrics import collect_stage_timings
+
+    for document in corpus[:args.warmup]:
+        App.analyze_resume_file(document['filename'], io.BytesIO(document['data']))
+
+    stage_samples = {}
+    by_size = {}
+    errors = 0
+    words = 0
+    wall_started = time.perf_counter()
+    for document in corpus:
+        with collect_stage_timings() as timings:
+            started = time.perf_counter()
+            _, error_message, analysis = App.analyze_resume_file(document['filename'], io.BytesIO(document['data']))
+            elapsed = time.perf_counter() - started
+        if error_message or analysis is None:
+            errors += 1
+        words += document['words']
+        timings['total'] = elapsed
+        for name, seconds in timings.items():
+            stage_samples.setdefault(name, []).append(seconds)
+        by_size.setdefault(document['size'], []).append(elapsed)
+    wall_seconds = time.perf_counter() - wall_started
+
+    return {
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+            'git_commit': git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'spacy_profile': args.profile,
+            'pool_workers': args.pool_workers,
+            'seed': args.seed,
+            'repeat': args.repeat,
+            'documents': len(corpus),
+            'errors': errors,
+        },
+        'app_import_seconds': import_seconds,
+        # Cold model load as timed during the import above, and every other import and load step
+        'model_load_seconds': App.STARTUP_TIMINGS['load spacy model'],
+        'startup_seconds': dict(App.STARTUP_TIMINGS),
+        'peak_rss_mb': peak_rss_mb(),
+        'throughput': {
+            'documents_per_second': len(corpus) / wall_seconds if wall_seconds else 0.0,
+            'words_per_second': words / wall_seconds if wall_seconds else 0.0,
+            'wall_seconds': wall_seconds,
+        },
+        'stages': {name: summarize(samples) for name, samples in sorted(stage_samples.items())},
+        'documents_by_size': {name: summarize(samples) for name, samples in sorted(by_size.items())},
+    }
+
+def compare_results(baseline, current, threshold, min_delta_ms):
+    # Returns a list of (metric, baseline, current, change %) for everything that got worse by more than threshold %.
+    # Latencies below min_delta_ms of absolute change are treated as noise.
+    regressions = []
+
+    def check(metric, old, new, higher_is_worse=True, min_delta=0.0):
+        if old is None or new is None or old <= 0:
+            return
+        change = (new - old) / old * 100
+        worse = change > threshold if higher_is_worse else change < -threshold
+        if worse and abs(new - old) >= min_delta:
+            regressions.append((metric, old, new, change))
+
+    for name in sorted(set(baseline['stages']) & set(current['stages'])):
+        for key in ('p50_ms', 'p95_ms'):
+            check(f"stages.{name}.{key}", baseline['stages'][name][key], current['stages'][name][key], min_delta=min_delta_ms)
+    for name in sorted(set(baseline['documents_by_size']) & set(current['documents_by_size'])):
+        check(f"documents_by_size.{name}.p50_ms", baseline['documents_by_size'][name]['p50_ms'],
+              current['documents_by_size'][name]['p50_ms'], min_delta=min_delta_ms)
+    check('throughput.documents_per_second', baseline['throughput']['documents_per_second'],
+          current['throughput']['documents_per_second'], higher_is_worse=False)
+    check('peak_rss_mb.self', baseline['peak_rss_mb']['self'], current['peak_rss_mb']['self'])
+    check('model_load_seconds', baseline['model_load_seconds'], current['model_load_seconds'], min_delta=min_delta_ms / 1000)
+    baseline_startup, current_startup = baseline.get('startup_seconds', {}), current.get('startup_seconds', {})
+    for name in sorted(set(baseline_startup) & set(current_startup)):
+        check(f"startup_seconds.{name}", baseline_startup[name], current_startup[name], min_delta=min_delta_ms / 1000)
+    return regressions
+
+def print_summary(result):
+    meta = result['meta']
+    print(f"{meta['documents']} documents ({meta['errors']} errors), profile={meta['spacy_profile']}, seed={meta['seed']}")
+    print(f"app import {result['app_import_seconds']:.2f}s, model load {result['model_load_seconds']:.2f}s, "
+          f"peak RSS {result['peak_rss_mb']['self']:.0f} MB")
+    print("startup: " + ", ".join(f"{name} {seconds:.2f}s" for name, seconds in result.get('startup_seconds', {}).items()))
+    print(f"throughput {result['throughput']['documents_per_second']:.2f} docs/s, "
+          f"{result['throughput']['words_per_second']:.0f} words/s")
+    print(f"{'stage':<34}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for name, summary in result['stages'].items():
+        print(f"{name:<34}{summary['p50_ms']:>10.2f}{summary['p95_ms']:>10.2f}{summary['p99_ms']:>10.2f}{summary['max_ms']:>10.2f}")
+
+def report_regressions(regressions, threshold):
+    if not regressions:
+        print(f"No regressions above {threshold}%.")
+        return 0
+    print(f"{len(regressions)} regression(s) above {threshold}%:")
+    for metric, old, new, change in regressions:
+        print(f"  {metric}: {old:.3f} -> {new:.3f} ({change:+.1f}%)")
+    return 1
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Resume analyzer benchmarks")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help="Run the benchmark and write a JSON result")
+    run_parser.add_argument('--seed', type=int, default=0)
+    run_parser.add_argument('--repeat', type=int, default=3, help="Copies of the corpus matrix to run")
+    run_parser.add_argument('--warmup', type=int, default=2, help="Documents analyzed before timing starts")
+    run_parser.add_argument('--profile', default=os.environ.get('SPACY_PIPELINE_PROFILE', 'fast'))
+    run_parser.add_argument('--pool-workers', type=int, default=0, help="0 analyzes inline, like a single-threaded worker")
+    run_parser.add_argument('--output', help="Result path (default: benchmarks/results/<timestamp>.json)")
+    run_parser.add_argument('--compare', metavar='BASELINE', help="Compare against a baseline after running")
+    run_parser.add_argument('--threshold', type=float, default=10.0, help="Regression threshold in percent")
+    run_parser.add_argument('--min-delta-ms', type=float, default=0.5, help="Ignore latency changes smaller than this")
+
+    compare_parser = commands.add_parser('compare', help="Compare two result files")
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument('--threshold', type=float, default=10.0)
+    compare_parser.add_argument('--min-delta-ms', type=float, default=0.5)
+
+    corpus_parser = commands.add_parser('corpus', help="Write the synthetic corpus to a directory")
+    corpus_parser.add_argument('directory')
+    corpus_parser.add_argument('--seed', type=int, default=0)
+    corpus_parser.add_argument('--repeat', type=int, default=1)
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'corpus':
+        corpus = generate_corpus(seed=args.seed, repeat=args.repeat)
+        write_corpus(corpus, args.directory)
+        print(f"Wrote {len(corpus)} documents to {args.directory}")
+        return 0
+
+    if args.command == 'compare':
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        with open(args.current) as f:
+            current = json.load(f)
+        return report_regressions(compare_results(baseline, current, args.threshold, args.min_delta_ms), args.threshold)
+
+    result = run_benchmark(args)
+    output = args.output or os.path.join(RESULTS_DIR, time.strftime('%Y%m%d-%H%M%S') + '.json')
+    directory = os.path.dirname(os.path.abspath(output))
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+    with open(output, 'w') as f:
+        json.dump(result, f, indent=2)
+    print_summary(result)
+    print(f"Results written to {output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        return report_regressions(compare_results(baseline, result, args.threshold, args.min_delta_ms), args.threshold)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
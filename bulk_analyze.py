@@ -0,0 +1,222 @@
+import argparse
+import hashlib
+import io
+import json
+import os
+import sys
+import tarfile
+import tempfile
+import time
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from multiprocessing import get_context
+
+from metrics import collect_stage_timings
+
+# --- Bulk Analysis ---
+# Offline entry point for audits: analyzes every PDF/DOCX in a directory, a zip file or a tar stream and
+# writes one JSON line per resume with the score, score_inputs and per-stage timings. Archives are read
+# one member at a time and never unpacked to disk. The app (and its spaCy model) is loaded once and
+# worker processes are forked from it; at most --max-in-flight documents are held in memory at a time.
+# The output file is its own checkpoint: --resume skips every path it already has a record for.
+#
+#   python bulk_analyze.py resumes/ --output audit.jsonl --workers 4
+#   python bulk_analyze.py resumes.zip --output audit.jsonl --resume
+#   tar -cz resumes/ | python bulk_analyze.py - --output audit.jsonl
+
+SUPPORTED_EXTENSIONS = ('.pdf', '.docx')
+PROGRESS_EVERY = 100
+
+App = None
+
+
+def load_app():
+    # Configure before import: analysis runs inline in each worker process, nothing is cached between
+    # documents, there is no request admission control, and the job queue and upload spool go to a
+    # throwaway directory
+    global App
+    scratch = tempfile.mkdtemp(prefix='resume-bulk-')
+    os.environ['ANALYSIS_POOL_WORKERS'] = '0'
+    os.environ['RESULT_CACHE_BACKEND'] = 'none'
+    os.environ['INCREMENTAL_ANALYSIS'] = '0'
+    os.environ['ADMISSION_CONTROL'] = '0'
+    os.environ['JOB_DB_PATH'] = os.path.join(scratch, 'jobs.sqlite3')
+    os.environ['UPLOAD_FOLDER'] = os.path.join(scratch, 'uploads')
+    import App as app_module
+    App = app_module
+
+def is_supported(name):
+    return name.lower().endswith(SUPPORTED_EXTENSIONS)
+
+def iter_directory(root, max_bytes, done):
+    # Yields in a stable order; workers read the files themselves
+    for directory, subdirectories, filenames in os.walk(root):
+        subdirectories.sort()
+        for filename in sorted(filenames):
+            path = os.path.join(directory, filename)
+            name = os.path.relpath(path, root)
+            if not is_supported(filename) or name in done:
+                continue
+            if os.path.getsize(path) > max_bytes:
+                yield name, None, ValueError(f"File is larger than {max_bytes} bytes.")
+                continue
+            yield name, path, None
+
+def iter_zip(archive_path, max_bytes, done):
+    with zipfile.ZipFile(archive_path) as archive:
+        for member in archive.infolist():
+            if member.is_dir() or not is_supported(member.filename) or member.filename in done:
+                continue
+            if member.file_size > max_bytes:
+                yield member.filename, None, ValueError(f"File is larger than {max_bytes} bytes.")
+                continue
+            yield member.filename, None, archive.read(member)
+
+def iter_tar(fileobj, max_bytes, done):
+    # 'r|*' reads the archive strictly forwards, so a compressed tar can be piped in on stdin
+    with tarfile.open(fileobj=fileobj, mode='r|*') as archive:
+        for member in archive:
+            if not member.isfile() or not is_supported(member.name) or member.name in done:
+                continue
+            if member.size > max_bytes:
+                yield member.name, None, ValueError(f"File is larger than {max_bytes} bytes.")
+                continue
+            yield member.name, None, archive.extractfile(member).read()
+
+def iter_source(source, max_bytes, done):
+    # Yields (name, file path or None, bytes or None or an error) for every supported file in source
+    if source == '-':
+        return iter_tar(sys.stdin.buffer, max_bytes, done)
+    if os.path.isdir(source):
+        return iter_directory(source, max_bytes, done)
+    if zipfile.is_zipfile(source):
+        return iter_zip(source, max_bytes, done)
+    if tarfile.is_tarfile(source):
+        return iter_tar(open(source, 'rb'), max_bytes, done)
+    raise ValueError(f"'{source}' is not a directory, a zip file or a tar archive.")
+
+def analyze_item(name, path, data, include_feedback=False):
+    # Runs in a worker process. Returns the JSON record for one resume.
+    record = {'path': name, 'status': 'error', 'error': None}
+    started = time.perf_counter()
+    with collect_stage_timings() as timings:
+        if path is not None:
+            with open(path, 'rb') as f:
+                data = f.read()
+        record['sha256'] = hashlib.sha256(data).hexdigest()
+        notices = []
+        text, error_message = App.extract_text_from_upload(name, io.BytesIO(data), notices)
+        record['notices'] = notices
+        if error_message:
+            record['error'] = f"Error during text extraction: {error_message}"
+        elif not text or not text.strip():
+            record['error'] = "Could not extract any text from the file, or the file is empty."
+        else:
+            report = App.analyze_resume_report(text)
+            record.update(status='ok', characters=len(text), score=report['score'], score_inputs=report['score_inputs'])
+            if include_feedback:
+                record['sections'] = report['sections']
+    record['timings_ms'] = {stage_name: round(seconds * 1000, 2) for stage_name, seconds in sorted(timings.items())}
+    record['total_ms'] = round((time.perf_counter() - started) * 1000, 2)
+    return record
+
+def read_checkpoint(output):
+    # Paths already recorded in output. A line cut off by a crash is dropped from the file so that
+    # appending continues on a clean line.
+    done = set()
+    if not os.path.exists(output):
+        return done
+    good_bytes = 0
+    with open(output, 'rb') as f:
+        for line in f:
+            try:
+                done.add(json.loads(line)['path'])
+            except (ValueError, KeyError):
+                break
+            good_bytes += len(line)
+    with open(output, 'r+b') as f:
+        f.truncate(good_bytes)
+    return done
+
+def run(args):
+    done = read_checkpoint(args.output) if args.resume else set()
+    load_app()
+    max_bytes = args.max_bytes or App.app.config['MAX_CONTENT_LENGTH']
+    items = iter_source(args.source, max_bytes, done)
+
+    counts = {'ok': 0, 'error': 0}
+    started = time.perf_counter()
+
+    def write(out, record):
+        out.write(json.dumps(record) + "\n")
+        out.flush()
+        counts[record['status']] += 1
+        processed = counts['ok'] + counts['error']
+        if processed % PROGRESS_EVERY == 0:
+            report_progress(processed, counts, started)
+
+    with open(args.output, 'a' if args.resume else 'w') as out:
+        if args.workers <= 0:
+            for name, path, data in items:
+                if isinstance(data, Exception):
+                    write(out, failed(name, data))
+                    continue
+                try:
+                    write(out, analyze_item(name, path, data, args.include_feedback))
+                except Exception as e:
+                    write(out, failed(name, e))
+        else:
+            # Fork after the model is loaded so every worker shares it copy-on-write
+            with ProcessPoolExecutor(max_workers=args.workers, mp_context=get_context('fork')) as executor:
+                pending = {}
+                for name, path, data in items:
+                    if isinstance(data, Exception):
+                        write(out, failed(name, data))
+                        continue
+                    while len(pending) >= args.max_in_flight:
+                        finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in finished:
+                            write(out, collect(future, pending.pop(future)))
+                    pending[executor.submit(analyze_item, name, path, data, args.include_feedback)] = name
+                    del data
+                for future in list(pending):
+                    write(out, collect(future, pending.pop(future)))
+
+    processed = counts['ok'] + counts['error']
+    report_progress(processed, counts, started)
+    if done:
+        print(f"Skipped {len(done)} already recorded in {args.output}", file=sys.stderr)
+    return 0
+
+def failed(name, error):
+    message = str(error) if isinstance(error, ValueError) else f"{type(error).__name__}: {error}"
+    return {'path': name, 'status': 'error', 'error': message}
+
+def collect(future, name):
+    try:
+        return future.result()
+    except Exception as e:
+        return failed(name, e)
+
+def report_progress(processed, counts, started):
+    elapsed = time.perf_counter() - started
+    rate = processed / elapsed if elapsed else 0.0
+    print(f"{processed} documents ({counts['error']} errors) in {elapsed:.1f}s, {rate:.2f} docs/s", file=sys.stderr)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Analyze every resume in a directory or archive and write JSON lines")
+    parser.add_argument('source', help="Directory, zip file, tar archive (any compression), or - for a tar stream on stdin")
+    parser.add_argument('--output', '-o', required=True, help="JSONL output file, also used as the resume checkpoint")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="Worker processes; 0 analyzes inline")
+    parser.add_argument('--max-in-flight', type=int, help="Documents held in memory at once (default: 2 x workers)")
+    parser.add_argument('--max-bytes', type=int, help="Skip files larger than this (default: the app's MAX_CONTENT_LENGTH)")
+    parser.add_argument('--resume', action='store_true', help="Append to output, skipping paths it already has")
+    parser.add_argument('--include-feedback', action='store_true', help="Also write the feedback sections, as message codes (see records.render_feedback)")
+    args = parser.parse_args(argv)
+    if args.max_in_flight is None:
+        args.max_in_flight = max(1, args.workers * 2)
+    return run(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,107 @@
+import posixpath
+import re
+import zipfile
+
+from lxml import etree
+
+# --- DOCX Text Extraction ---
+# Streams the WordprocessingML parts of a .docx once with lxml iterparse instead of building the
+# python-docx object model. Covers body paragraphs, table cells, text boxes, headers and footers
+# (python-docx's doc.paragraphs only sees top-level body paragraphs). Paragraphs are emitted in
+# document order, headers before the body and footers after it, and joined once at the end.
+
+W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+W_P = W_NS + 'p'
+W_R = W_NS + 'r'
+W_T = W_NS + 't'
+W_TAB = W_NS + 'tab'
+W_BR = W_NS + 'br'
+W_CR = W_NS + 'cr'
+W_NO_BREAK_HYPHEN = W_NS + 'noBreakHyphen'
+# Text boxes are stored twice: a DrawingML version under mc:Choice and a VML copy under mc:Fallback
+MC_FALLBACK = '{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback'
+REL_NS = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+REL_TYPE_PREFIX = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/'
+
+RUN_TEXT = {W_TAB: "\t", W_BR: "\n", W_CR: "\n", W_NO_BREAK_HYPHEN: "-"}
+PART_NUMBER_RE = re.compile(r'(\d+)')
+
+
+def iter_part_paragraphs(stream):
+    # Yields the text of every paragraph in one part, in document order. Paragraphs inside text boxes
+    # nest inside an outer paragraph, so open paragraphs are kept on a stack.
+    open_paragraphs = []
+    fallback_depth = 0
+    for event, elem in etree.iterparse(stream, events=('start', 'end'), resolve_entities=False, no_network=True):
+        tag = elem.tag
+        if tag == MC_FALLBACK:
+            if event == 'start':
+                fallback_depth += 1
+            else:
+                fallback_depth -= 1
+                elem.clear()
+            continue
+        if fallback_depth:
+            continue
+        if event == 'start':
+            if tag == W_P:
+                open_paragraphs.append([])
+            continue
+        if tag == W_T:
+            if open_paragraphs and elem.text:
+                open_paragraphs[-1].append(elem.text)
+        elif tag in RUN_TEXT:
+            # w:tab also defines tab stops in paragraph properties; only tabs inside a run are text
+            parent = elem.getparent()
+            if open_paragraphs and parent is not None and parent.tag == W_R:
+                open_paragraphs[-1].append(RUN_TEXT[tag])
+        elif tag == W_P:
+            yield "".join(open_paragraphs.pop())
+            elem.clear()
+
+def _relationships(archive, rels_name):
+    # Returns [(type suffix, target part name)] for a .rels part, or [] when it doesn't exist
+    try:
+        data = archive.read(rels_name)
+    except KeyError:
+        return []
+    base = posixpath.dirname(posixpath.dirname(rels_name))
+    relationships = []
+    for rel in etree.fromstring(data).iter(REL_NS + 'Relationship'):
+        if rel.get('TargetMode') == 'External':
+            continue
+        target = rel.get('Target', '')
+        name = target.lstrip('/') if target.startswith('/') else posixpath.normpath(posixpath.join(base, target))
+        rel_type = rel.get('Type', '')
+        relationships.append((rel_type[len(REL_TYPE_PREFIX):] if rel_type.startswith(REL_TYPE_PREFIX) else rel_type, name))
+    return relationships
+
+def _part_order(name):
+    # header2.xml before header10.xml
+    return [int(piece) if piece.isdigit() else piece for piece in PART_NUMBER_RE.split(name)]
+
+def extract_docx_text(file_stream):
+    with zipfile.ZipFile(file_stream) as archive:
+        main_part = next((name for rel_type, name in _relationships(archive, '_rels/.rels') if rel_type == 'officeDocument'),
+                         'word/document.xml')
+        directory, filename = posixpath.split(main_part)
+        part_rels = _relationships(archive, posixpath.join(directory, '_rels', filename + '.rels'))
+        headers = sorted({name for rel_type, name in part_rels if rel_type == 'header'}, key=_part_order)
+        footers = sorted({name for rel_type, name in part_rels if rel_type == 'footer'}, key=_part_order)
+
+        names = set(archive.namelist())
+        paragraphs = []
+        seen_blocks = set()
+        for part in headers + [main_part] + footers:
+            if part not in names:
+                continue
+            with archive.open(part) as stream:
+                block = list(iter_part_paragraphs(stream))
+            # First-page and default headers usually repeat the same contact block
+            key = tuple(block)
+            if part != main_part:
+                if not any(block) or key in seen_blocks:
+                    continue
+                seen_blocks.add(key)
+            paragraphs.extend(block)
+    return "".join(paragraph + "\n" for paragraph in paragraphs)
@@ -0,0 +1,44 @@
+import gc
+import os
+
+# --- Gunicorn Configuration ---
+# Preload mode: the master imports App once (spaCy model, spell dictionary, keyword tables) and every
+# worker is forked from it, sharing those pages copy-on-write instead of loading its own copy.
+# Bind address and worker count keep gunicorn's defaults ($PORT, $WEB_CONCURRENCY).
+# Set GUNICORN_PRELOAD=0 to fall back to every worker importing the app on its own.
+
+preload_app = os.environ.get('GUNICORN_PRELOAD', '1') == '1'
+
+# Threaded workers: /jobs/<id>/events streams hold a request thread while they poll the job queue, and
+# a sync worker would be tied up (and killed at the timeout) for the whole job. Analysis itself runs in
+# each worker's process pool, so threads mostly wait on it.
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+
+# Worker timeout: above the analysis budget of one request (ANALYSIS_REQUEST_TIMEOUT in App.py), with room
+# for receiving the upload and rendering, so a request that runs out of budget gets its 504 before gunicorn
+# would kill the worker. Without this, gunicorn's 30s default equals one pool job's timeout.
+timeout = int(float(os.environ.get('ANALYSIS_REQUEST_TIMEOUT', 60))) + 30
+
+if preload_app:
+    # Read by App at import: the analysis pool is started per worker in post_fork, not in the master
+    os.environ['DEFER_BACKGROUND_START'] = '1'
+
+
+def when_ready(server):
+    if not preload_app:
+        return
+    import App
+    server.log.info(App.startup_report())
+    # Move everything allocated so far into the permanent generation: the garbage collector then never
+    # touches (and copies) the shared model pages in the workers
+    gc.collect()
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    if not preload_app:
+        return
+    import App
+    App.start_background_workers()
+    server.log.info(f"Worker {worker.pid} ready: analysis pool started in {App.STARTUP_TIMINGS.get('warm analysis pool', 0.0):.2f}s")
@@ -0,0 +1,231 @@
+import fcntl
+import hashlib
+import json
+import os
+import re
+import time
+import zlib
+from collections import Counter
+
+import numpy as np
+from spacy.lang.en.stop_words import STOP_WORDS
+
+# --- Job Description Matching ---
+# Ranks indexed resumes against a job description by combining TF-IDF cosine similarity with
+# skill overlap. Resume term counts are hashed into a fixed number of dimensions and stored as
+# sublinear TF rows in a memory-mapped matrix, with document frequencies alongside, so IDF always
+# reflects the current index and ranking a new job description never re-parses a resume.
+#
+# Index directory layout:
+#   header.json  - dims, committed row count and allocated capacity (replaced atomically)
+#   vectors.f32  - capacity x dims float32 sublinear term frequencies, one row per resume
+#   df.i32       - dims int32 document frequencies
+#   meta.jsonl   - one line per row: key, name, skills, added_at
+# Writers serialise on an flock; readers only ever look at the first `count` rows.
+
+TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#./-]*[a-z0-9+#]|[a-z0-9]")
+INITIAL_CAPACITY = 1024
+RANK_BLOCK_ROWS = 4096
+
+
+def hashed_term_counts(text, dims):
+    # {dimension: count} over unigrams and bigrams with stop words removed. crc32 is used rather
+    # than hash() so every process (and every restart) maps a term to the same dimension.
+    tokens = [token for token in TOKEN_RE.findall(text.lower()) if token not in STOP_WORDS]
+    terms = tokens + [f"{first} {second}" for first, second in zip(tokens, tokens[1:])]
+    return dict(Counter(zlib.crc32(term.encode('utf-8')) % dims for term in terms))
+
+def resume_key(text):
+    # Index key for a resume's text. Term counts ignore whitespace, so texts that differ only in layout share one row.
+    normalized = " ".join(text.split())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+def sublinear_tf(counts, dims):
+    vector = np.zeros(dims, dtype=np.float32)
+    if counts:
+        indices = np.fromiter(counts.keys(), dtype=np.int64, count=len(counts))
+        values = np.fromiter(counts.values(), dtype=np.float32, count=len(counts))
+        vector[indices] = 1.0 + np.log(values)
+    return vector
+
+
+class VectorIndex:
+    def __init__(self, path, dims, skill_vocabulary):
+        self.path = path
+        self.dims = dims
+        self.skill_vocabulary = list(skill_vocabulary)
+        self._skill_columns = {skill: column for column, skill in enumerate(self.skill_vocabulary)}
+        self._header_path = os.path.join(path, 'header.json')
+        self._vectors_path = os.path.join(path, 'vectors.f32')
+        self._df_path = os.path.join(path, 'df.i32')
+        self._meta_path = os.path.join(path, 'meta.jsonl')
+        self._lock_path = os.path.join(path, 'lock')
+        # Reader state, refreshed from disk whenever the committed count changes
+        self._vectors = None
+        self._df = None
+        self._capacity = 0
+        self._count = 0
+        self._meta_offset = 0
+        self._entries = []
+        self._rows_by_key = {}
+        self._skills = np.zeros((0, len(self.skill_vocabulary)), dtype=bool)
+
+    def _lock(self):
+        if not os.path.exists(self.path):
+            os.makedirs(self.path, exist_ok=True)
+        lock_file = open(self._lock_path, 'a')
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        return lock_file
+
+    def _read_header(self):
+        try:
+            with open(self._header_path) as f:
+                header = json.load(f)
+        except FileNotFoundError:
+            return None
+        if header['dims'] != self.dims:
+            raise RuntimeError(
+                f"Match index at '{self.path}' was built with {header['dims']} dimensions but {self.dims} are configured. "
+                "Set JD_INDEX_DIMENSIONS to match or rebuild the index in a new directory."
+            )
+        return header
+
+    def _write_header(self, count, capacity):
+        temp_path = self._header_path + '.tmp'
+        with open(temp_path, 'w') as f:
+            json.dump({'version': 1, 'dims': self.dims, 'count': count, 'capacity': capacity}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self._header_path)
+
+    def _map(self, capacity):
+        self._vectors = np.memmap(self._vectors_path, dtype=np.float32, mode='r+', shape=(capacity, self.dims))
+        self._df = np.memmap(self._df_path, dtype=np.int32, mode='r+', shape=(self.dims,))
+        self._capacity = capacity
+
+    def refresh(self):
+        # Picks up rows committed by other processes since the last call; returns the committed count
+        header = self._read_header()
+        if header is None or header['count'] == self._count and header['capacity'] == self._capacity:
+            return self._count
+        if header['capacity'] != self._capacity:
+            self._map(header['capacity'])
+        new_entries = []
+        with open(self._meta_path, 'rb') as f:
+            f.seek(self._meta_offset)
+            while len(self._entries) + len(new_entries) < header['count']:
+                line = f.readline()
+                if not line:
+                    break
+                new_entries.append(json.loads(line))
+                self._meta_offset = f.tell()
+        skills = np.zeros((len(new_entries), len(self.skill_vocabulary)), dtype=bool)
+        for row, entry in enumerate(new_entries):
+            self._rows_by_key[entry['key']] = len(self._entries) + row
+            for skill in entry['skills']:
+                column = self._skill_columns.get(skill)
+                if column is not None:
+                    skills[row, column] = True
+        self._entries.extend(new_entries)
+        self._skills = np.concatenate([self._skills, skills])
+        self._count = len(self._entries)
+        return self._count
+
+    def __len__(self):
+        return self.refresh()
+
+    def get(self, key):
+        self.refresh()
+        row = self._rows_by_key.get(key)
+        return None if row is None else self._entries[row]
+
+    def add(self, key, name, term_counts, skills):
+        # Appends one resume; a key (see resume_key) that is already indexed is left as is.
+        # Returns True when a row was written.
+        lock_file = self._lock()
+        try:
+            header = self._read_header()
+            if header is None:
+                header = {'count': 0, 'capacity': INITIAL_CAPACITY}
+                for file_path, size in ((self._vectors_path, INITIAL_CAPACITY * self.dims * 4), (self._df_path, self.dims * 4)):
+                    with open(file_path, 'wb') as f:
+                        f.truncate(size)
+                open(self._meta_path, 'wb').close()
+                self._write_header(0, INITIAL_CAPACITY)
+            self.refresh()
+            if key in self._rows_by_key:
+                return False
+
+            count, capacity = header['count'], header['capacity']
+            if count == capacity:
+                # Double the file; the new rows read as zeros until they are written
+                capacity *= 2
+                with open(self._vectors_path, 'r+b') as f:
+                    f.truncate(capacity * self.dims * 4)
+                self._map(capacity)
+            row = sublinear_tf(term_counts, self.dims)
+            self._vectors[count] = row
+            self._df[row > 0] += 1
+            self._vectors.flush()
+            self._df.flush()
+            with open(self._meta_path, 'a') as f:
+                f.write(json.dumps({'key': key, 'name': name, 'skills': sorted(skills), 'added_at': time.time()}) + "\n")
+            self._write_header(count + 1, capacity)
+        finally:
+            lock_file.close()
+        self.refresh()
+        return True
+
+    def rank(self, term_counts, skills, top_k=20, skill_weight=0.4, keys=None):
+        # Returns up to top_k matches, best first. keys restricts ranking to those indexed resumes.
+        count = self.refresh()
+        if count == 0 or top_k <= 0:
+            return []
+        rows = np.arange(count) if keys is None else np.array(
+            sorted({self._rows_by_key[key] for key in keys if key in self._rows_by_key}), dtype=np.int64)
+        if rows.size == 0:
+            return []
+
+        # Cosine similarity of TF-IDF vectors, computed without materialising X * idf:
+        # (X * idf) . (q * idf) = X @ (q * idf^2) and |X * idf| = sqrt((X * X) @ idf^2)
+        idf = (np.log((1.0 + count) / (1.0 + self._df.astype(np.float32))) + 1.0).astype(np.float32)
+        query = sublinear_tf(term_counts, self.dims) * idf
+        query_norm = float(np.linalg.norm(query))
+        query_weights = query * idf
+        idf_squared = idf * idf
+        similarity = np.zeros(rows.size, dtype=np.float32)
+        if query_norm > 0:
+            for start in range(0, rows.size, RANK_BLOCK_ROWS):
+                block_rows = rows[start:start + RANK_BLOCK_ROWS]
+                block = self._vectors[block_rows[0]:block_rows[-1] + 1] if keys is None else self._vectors[block_rows]
+                norms = np.sqrt((block * block) @ idf_squared)
+                dots = block @ query_weights
+                similarity[start:start + block_rows.size] = np.divide(
+                    dots, norms * query_norm, out=np.zeros_like(dots), where=norms > 0)
+
+        query_columns = [self._skill_columns[skill] for skill in sorted(set(skills)) if skill in self._skill_columns]
+        if query_columns:
+            overlap = self._skills[rows][:, query_columns].sum(axis=1) / len(query_columns)
+            scores = (1.0 - skill_weight) * similarity + skill_weight * overlap
+        else:
+            overlap = np.zeros(rows.size)
+            scores = similarity
+
+        top_k = min(top_k, rows.size)
+        best = np.argpartition(-scores, top_k - 1)[:top_k]
+        best = best[np.argsort(-scores[best], kind='stable')]
+        query_skills = [self.skill_vocabulary[column] for column in query_columns]
+        matches = []
+        for position in best:
+            entry = self._entries[rows[position]]
+            resume_skills = set(entry['skills'])
+            matches.append({
+                'id': entry['key'],
+                'name': entry['name'],
+                'score': round(float(scores[position]) * 100, 2),
+                'text_similarity': round(float(similarity[position]), 4),
+                'skill_overlap': round(float(overlap[position]), 4),
+                'matched_skills': [skill for skill in query_skills if skill in resume_skills],
+                'missing_skills': [skill for skill in query_skills if skill not in resume_skills],
+            })
+        return matches
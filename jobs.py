@@ -0,0 +1,184 @@
+import contextlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+
+# --- Job Queue ---
+# A local SQLite-backed queue for asynchronous analysis: uploads are stored as queued jobs, runner
+# threads in each web worker claim them one at a time, and every finished check section is written
+# back immediately so clients can poll or stream partial results. No external services required.
+
+
+class JobStore:
+    def __init__(self, path):
+        self.path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                "id TEXT PRIMARY KEY, status TEXT NOT NULL, filename TEXT NOT NULL, data BLOB, "
+                "created_at REAL NOT NULL, started_at REAL, finished_at REAL, result TEXT, error TEXT)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS jobs_status_created_at ON jobs (status, created_at)")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS job_sections ("
+                "job_id TEXT NOT NULL, seq INTEGER NOT NULL, title TEXT NOT NULL, feedback TEXT NOT NULL, "
+                "PRIMARY KEY (job_id, seq))"
+            )
+
+    @contextlib.contextmanager
+    def _connect(self):
+        # Short-lived connections keep the store usable from runner threads and pool processes alike.
+        # They are closed explicitly: an open connection inherited across fork gives the child a stale view.
+        conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def create(self, filename, data):
+        job_id = uuid.uuid4().hex
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO jobs (id, status, filename, data, created_at) VALUES (?, 'queued', ?, ?, ?)",
+                (job_id, filename, data, time.time()),
+            )
+        return job_id
+
+    def claim_next(self):
+        with self._connect() as conn:
+            # BEGIN IMMEDIATE takes the write lock up front so two runners can never claim the same job
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    "SELECT id FROM jobs WHERE status = 'queued' ORDER BY created_at LIMIT 1"
+                ).fetchone()
+                if row is not None:
+                    conn.execute("UPDATE jobs SET status = 'running', started_at = ? WHERE id = ?", (time.time(), row[0]))
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        return row[0] if row is not None else None
+
+    def requeue(self, job_id):
+        with self._connect() as conn:
+            conn.execute("UPDATE jobs SET status = 'queued', started_at = NULL WHERE id = ?", (job_id,))
+
+    def requeue_stale(self, older_than):
+        # Jobs left 'running' by a worker that died are handed out again
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = 'queued', started_at = NULL WHERE status = 'running' AND started_at < ?",
+                (time.time() - older_than,),
+            )
+
+    def get_payload(self, job_id):
+        with self._connect() as conn:
+            return conn.execute("SELECT filename, data FROM jobs WHERE id = ?", (job_id,)).fetchone()
+
+    # Results are only written while the job is 'running'. A job that timed out is failed by the runner
+    # while its pool worker may still be going; that worker's late sections and result are dropped, so
+    # clients that already saw the failure never see the job change again. Each returns whether it wrote.
+    def add_section(self, job_id, title, feedback):
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "INSERT INTO job_sections (job_id, seq, title, feedback) "
+                "SELECT ?, (SELECT COALESCE(MAX(seq), -1) + 1 FROM job_sections WHERE job_id = ?), ?, ? "
+                "FROM jobs WHERE id = ? AND status = 'running'",
+                (job_id, job_id, title, json.dumps(feedback), job_id),
+            )
+            return cursor.rowcount > 0
+
+    def finish(self, job_id, result):
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = 'done', finished_at = ?, result = ?, data = NULL WHERE id = ? AND status = 'running'",
+                (time.time(), json.dumps(result), job_id),
+            )
+            return cursor.rowcount > 0
+
+    def fail(self, job_id, error):
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = 'failed', finished_at = ?, error = ?, data = NULL WHERE id = ? AND status = 'running'",
+                (time.time(), error, job_id),
+            )
+            return cursor.rowcount > 0
+
+    def get(self, job_id, sections_after=-1):
+        # Returns the job with every section whose seq is greater than sections_after, or None
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT id, status, filename, created_at, started_at, finished_at, result, error FROM jobs WHERE id = ?",
+                (job_id,),
+            ).fetchone()
+            if row is None:
+                return None
+            sections = conn.execute(
+                "SELECT seq, title, feedback FROM job_sections WHERE job_id = ? AND seq > ? ORDER BY seq",
+                (job_id, sections_after),
+            ).fetchall()
+        job = dict(zip(('id', 'status', 'filename', 'created_at', 'started_at', 'finished_at', 'result', 'error'), row))
+        job['result'] = json.loads(job['result']) if job['result'] else None
+        job['sections'] = [{'seq': seq, 'title': title, 'feedback': json.loads(feedback)} for seq, title, feedback in sections]
+        return job
+
+    def purge_finished(self, older_than):
+        cutoff = time.time() - older_than
+        with self._connect() as conn:
+            conn.execute(
+                "DELETE FROM job_sections WHERE job_id IN "
+                "(SELECT id FROM jobs WHERE status IN ('done', 'failed') AND finished_at < ?)",
+                (cutoff,),
+            )
+            conn.execute("DELETE FROM jobs WHERE status IN ('done', 'failed') AND finished_at < ?", (cutoff,))
+
+
+class JobRunner:
+    # Background threads that claim queued jobs and hand each one to handler(job_id).
+    # A handler raising retry_on (e.g. a full worker pool) puts the job back in the queue.
+    def __init__(self, store, handler, threads=1, poll_interval=0.5, retention=24 * 3600, stale_after=15 * 60, retry_on=()):
+        self.store = store
+        self.handler = handler
+        self.threads = threads
+        self.poll_interval = poll_interval
+        self.retention = retention
+        self.stale_after = stale_after
+        self.retry_on = tuple(retry_on)
+        self._started_pid = None
+        self._lock = threading.Lock()
+
+    def ensure_started(self):
+        # Threads don't survive fork, so every process that serves requests starts its own runners
+        with self._lock:
+            if self._started_pid == os.getpid():
+                return
+            self._started_pid = os.getpid()
+            self.store.requeue_stale(self.stale_after)
+            for index in range(self.threads):
+                threading.Thread(target=self._run_forever, name=f"job-runner-{index}", daemon=True).start()
+
+    def _run_forever(self):
+        last_purge = 0.0
+        while True:
+            if time.time() - last_purge > 60:
+                self.store.purge_finished(self.retention)
+                last_purge = time.time()
+            job_id = self.store.claim_next()
+            if job_id is None:
+                time.sleep(self.poll_interval)
+                continue
+            try:
+                self.handler(job_id)
+            except self.retry_on:
+                self.store.requeue(job_id)
+                time.sleep(self.poll_interval)
+            except Exception as e:
+                self.store.fail(job_id, f"Analysis failed: {e}")
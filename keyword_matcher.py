@@ -0,0 +1,24 @@
+# --- Phrase Scanner ---
+# Finds every vocabulary phrase occurring as a substring of a text, with the same result as testing
+# `phrase in text` for each phrase. Phrases are checked longest first; once a phrase is found, every
+# shorter phrase it contains is known to be present too and its scan is skipped.
+# Each remaining check is a single C-level substring search. On resume-sized vocabularies (~100 phrases)
+# that measured faster than a regex trie or an Aho-Corasick automaton driven from Python, both of which
+# pay per-character or per-match interpreter overhead.
+
+
+class PhraseScanner:
+    def __init__(self, phrases):
+        self.phrases = frozenset(phrases)
+        self._ordered = sorted(self.phrases, key=len, reverse=True)
+        self._contained = {
+            phrase: frozenset(other for other in self.phrases if other in phrase)
+            for phrase in self.phrases
+        }
+
+    def find_all(self, text):
+        found = set()
+        for phrase in self._ordered:
+            if phrase not in found and phrase in text:
+                found |= self._contained[phrase]
+        return found
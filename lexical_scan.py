@@ -0,0 +1,63 @@
+import re
+
+from metrics import timed
+
+# --- Lexical Scan ---
+# Contact details, first-person pronouns and date formats, from regexes compiled once at import. Email and
+# phone are single early-exit searches; pronouns and dates come out of one fused finditer pass over the
+# text that counts exactly what a findall per pattern would (tests/test_lexical_scan.py checks this).
+EMAIL_RE = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+PHONE_RE = re.compile(r"(\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4})") # Simple US-like
+LINKEDIN_MARKERS = ("linkedin.com/in/", "linkedin.com/pub/")
+
+DATE_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in [
+    r'\b(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s+\d{4}\b', 
+    r'\b\d{1,2}\/\d{4}\b', 
+    r'\b\d{1,2}\-\d{4}\b', 
+    r'\b\d{4}\s*[-–—to]+\s*\d{4}\b', 
+    r'\b\d{4}\s*[-–—to]+\s*(?:Present|Current|Ongoing|Till Date)\b', 
+    r'\b(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s+\d{4}\s*[-–—to]+\s*(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s+\d{4}\b', 
+    r'\b(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s+\d{4}\s*[-–—to]+\s*(?:Present|Current|Ongoing|Till Date)\b'
+]]
+
+# Every date pattern starts at a word that begins with a digit or a month name, so those words are the only
+# places the date patterns need to be tried. Pronoun alternatives never overlap such words, so both share one scan.
+LEXICAL_SCAN_RE = re.compile(
+    r"\b(?:"
+    r"(?P<contraction>(?i:I'm|I've|I'd|I’ll|I’d))\b"
+    r"|(?P<my_me>(?i:my|me))\b"
+    r"|(?P<i>I)\b"
+    r"|(?P<date_anchor>\d+|(?i:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\w*)"
+    r")"
+)
+
+@timed
+def scan_lexical_features(text):
+    text_lower = text.lower()
+    features = {
+        'email_found': EMAIL_RE.search(text) is not None,
+        'phone_found': PHONE_RE.search(text) is not None,
+        'linkedin_found': any(marker in text_lower for marker in LINKEDIN_MARKERS),
+        'first_person_count': 0,
+        'dates_found_count': 0,
+    }
+    # Trying each date pattern in place at every anchor, and skipping anchors inside that pattern's
+    # previous match, reproduces exactly what a separate findall per pattern would count.
+    date_cursors = [0] * len(DATE_PATTERNS)
+    for match in LEXICAL_SCAN_RE.finditer(text):
+        kind = match.lastgroup
+        if kind == 'date_anchor':
+            start = match.start()
+            for index, pattern in enumerate(DATE_PATTERNS):
+                if start < date_cursors[index]:
+                    continue
+                date_match = pattern.match(text, start)
+                if date_match:
+                    features['dates_found_count'] += 1
+                    date_cursors[index] = date_match.end()
+        elif kind == 'contraction' and match.group()[0] == 'I':
+            # "I'm" was counted both as a contraction and as a standalone "I"
+            features['first_person_count'] += 2
+        else:
+            features['first_person_count'] += 1
+    return features
@@ -0,0 +1,197 @@
+import bisect
+import contextlib
+import contextvars
+import cProfile
+import functools
+import os
+import random
+import threading
+import time
+
+# --- Stage Metrics ---
+# Wall-clock timings for every pipeline stage (upload read, extraction, parse, each check, scoring).
+# Timings are collected per request in a context variable. Work that runs in the analysis pool collects
+# its own timings in the child and returns them with the result, so they are merged back into the
+# request that submitted it. Histograms live in the web worker process: with several gunicorn workers
+# each scrape of /metrics reports the share of the worker that served it.
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_current_timings = contextvars.ContextVar('stage_timings', default=None)
+
+
+def _escape_label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class Histogram:
+    # Prometheus-style histogram with one label dimension (e.g. stage or endpoint)
+    def __init__(self, name, help_text, label_name, buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.label_name = label_name
+        self.buckets = tuple(sorted(buckets))
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, label, value):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(label)
+            if series is None:
+                # Per-bucket counts (the last slot is +Inf), then sum and count
+                series = self._series[label] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            snapshot = {label: (list(counts), total, count) for label, (counts, total, count) in self._series.items()}
+        for label in sorted(snapshot):
+            counts, total, count = snapshot[label]
+            label_pair = f'{self.label_name}="{_escape_label(label)}"'
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + ('+Inf',), counts):
+                cumulative += bucket_count
+                lines.append(f'{self.name}_bucket{{{label_pair},le="{bound}"}} {cumulative}')
+            lines.append(f'{self.name}_sum{{{label_pair}}} {total}')
+            lines.append(f'{self.name}_count{{{label_pair}}} {count}')
+        return lines
+
+
+def render_metric(name, help_text, metric_type, samples):
+    # samples: list of (labels dict, value)
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} {metric_type}"]
+    for labels, value in samples:
+        if labels:
+            label_text = ",".join(f'{key}="{_escape_label(val)}"' for key, val in labels.items())
+            lines.append(f"{name}{{{label_text}}} {value}")
+        else:
+            lines.append(f"{name} {value}")
+    return lines
+
+
+# --- Stage Timing Collection ---
+@contextlib.contextmanager
+def collect_stage_timings():
+    # Collects {stage: seconds} for everything timed inside the block (on this thread/context)
+    token = _current_timings.set({})
+    try:
+        yield _current_timings.get()
+    finally:
+        _current_timings.reset(token)
+
+def start_stage_timings():
+    # Starts a fresh collection for the current request; returns the dict timings are recorded into
+    timings = {}
+    _current_timings.set(timings)
+    return timings
+
+def record_stage(name, seconds):
+    timings = _current_timings.get()
+    if timings is not None:
+        timings[name] = timings.get(name, 0.0) + seconds
+
+def merge_stage_timings(timings):
+    for name, seconds in timings.items():
+        record_stage(name, seconds)
+
+@contextlib.contextmanager
+def stage(name):
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_stage(name, time.perf_counter() - started)
+
+def timed(fn):
+    # Records every call of fn as a stage named after the function
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            record_stage(fn.__name__, time.perf_counter() - started)
+    return wrapper
+
+def call_collecting(fn, profile_path, *args):
+    # Pool entry point: runs fn in the child and returns (result, stage timings, counter changes).
+    # With a profile_path the call also runs under cProfile and the stats are written there.
+    before = read_counters()
+    with collect_stage_timings() as timings:
+        if profile_path is None:
+            result = fn(*args)
+        else:
+            profiler = cProfile.Profile()
+            result = profiler.runcall(fn, *args)
+            profiler.dump_stats(profile_path)
+    return result, timings, counter_changes(before, read_counters())
+
+
+# --- Pool Worker Counters ---
+# Counters kept in a process's own state (e.g. an lru_cache's hits) only move in the process that did the
+# work. Sources registered here are read before and after every pool job, and the changes come back with
+# the result like stage timings, to be added up in the web worker that submitted it.
+_counter_sources = {}
+_pool_counters = {}
+_pool_counters_lock = threading.Lock()
+
+def register_counters(name, read):
+    # read() returns this process's running totals as {counter: number}
+    _counter_sources[name] = read
+
+def read_counters():
+    return {name: read() for name, read in _counter_sources.items()}
+
+def counter_changes(before, after):
+    return {name: {key: value - before[name][key] for key, value in values.items()} for name, values in after.items()}
+
+def merge_pool_counters(changes):
+    with _pool_counters_lock:
+        for name, values in changes.items():
+            totals = _pool_counters.setdefault(name, {})
+            for key, value in values.items():
+                totals[key] = totals.get(key, 0) + value
+
+def pool_counters(name):
+    # Totals reported by this process's pool jobs so far
+    with _pool_counters_lock:
+        return dict(_pool_counters.get(name, {}))
+
+def server_timing_header(timings, total=None):
+    # Server-Timing values are in milliseconds
+    entries = [f"{name};dur={seconds * 1000:.2f}" for name, seconds in timings.items()]
+    if total is not None:
+        entries.append(f"total;dur={total * 1000:.2f}")
+    return ", ".join(entries)
+
+
+# --- Sampled Profiling ---
+class RequestProfiler:
+    # Profiles a sampled fraction of requests with cProfile and writes one .prof file per request
+    def __init__(self, sample_percent, directory):
+        self.sample_percent = sample_percent
+        self.directory = directory
+
+    def new_path_prefix(self, endpoint):
+        if self.sample_percent <= 0 or random.random() * 100 >= self.sample_percent:
+            return None
+        if not os.path.exists(self.directory):
+            os.makedirs(self.directory, exist_ok=True)
+        return os.path.join(self.directory, f"{endpoint or 'request'}-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{time.perf_counter_ns()}")
+
+    def start(self):
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Another profiler is already active in this interpreter; skip this sample
+            return None
+        return profiler
+
+    def stop(self, profiler, path):
+        profiler.disable()
+        profiler.dump_stats(path)
@@ -0,0 +1,153 @@
+import functools
+import importlib.resources
+import math
+import re
+
+import cmudict
+import pyphen
+
+# --- Readability ---
+# Flesch Reading Ease, Flesch-Kincaid grade, Gunning Fog and SMOG from one set of counts taken from the
+# spaCy doc the other checks already use, instead of textstat re-tokenizing and re-syllabifying the
+# whole text for every metric. Words, sentences and syllables follow textstat's rules (punctuation
+# stripped except in contractions; a sentence ends at . ! or ? and fragments of two words or fewer are
+# ignored; CMU dictionary syllables with a Pyphen fallback), so scores match textstat's. Syllable counts
+# are memoized per word: resumes share most of their vocabulary. Counts taken per resume section merge
+# into exactly the whole resume's, including sentences that run across a section boundary.
+
+SENTENCE_END_RE = re.compile(r"[.!?]+")
+NON_CONTRACTION_APOSTROPHE_RE = re.compile(r"'(?!(?:[tsd]|ve|ll|re))")
+PUNCTUATION_RE = re.compile(r"[^\w\s']")
+WORD_CHAR_RE = re.compile(r"\w")
+
+# textstat's English constants
+FRE_BASE, FRE_SENTENCE_LENGTH, FRE_SYLLABLES_PER_WORD = 206.835, 1.015, 84.6
+DIFFICULT_WORD_SYLLABLES = 3
+
+HYPHENATOR = pyphen.Pyphen(lang='en_US')
+with importlib.resources.files('textstat').joinpath('resources/en/easy_words.txt').open() as f:
+    EASY_WORDS = frozenset(line.strip() for line in f)
+
+
+@functools.lru_cache(maxsize=None)
+def cmu_dictionary():
+    # Parsed on first use rather than at import: it takes about a second, which App import shouldn't pay
+    return cmudict.dict()
+
+def strip_punctuation(chunk):
+    return PUNCTUATION_RE.sub('', NON_CONTRACTION_APOSTROPHE_RE.sub('', chunk))
+
+@functools.lru_cache(maxsize=100000)
+def word_stats(word):
+    # (syllables, is_difficult) for one punctuation-stripped word
+    lower = word.lower()
+    pronunciations = cmu_dictionary().get(lower)
+    if pronunciations:
+        syllables = sum(1 for phone in pronunciations[0] if phone[-1].isdigit())
+    else:
+        syllables = len(HYPHENATOR.positions(lower)) + 1
+    return syllables, lower not in EASY_WORDS and syllables >= DIFFICULT_WORD_SYLLABLES
+
+@functools.lru_cache(maxsize=100000)
+def chunk_stats(chunk):
+    # (is_word, syllables, is_difficult, has_word_char, sentence pieces) for one whitespace-separated chunk.
+    # Sentence boundaries can fall inside a chunk ("e.g.", "node.js"), as they do for textstat; for chunks
+    # containing . ! or ? pieces lists (has_word_char, counts_as_word) for each part between them.
+    word = strip_punctuation(chunk)
+    syllables, difficult = word_stats(word) if word else (0, False)
+    pieces = None
+    if '.' in chunk or '!' in chunk or '?' in chunk:
+        pieces = tuple((WORD_CHAR_RE.search(piece) is not None, bool(strip_punctuation(piece)))
+                       for piece in SENTENCE_END_RE.split(chunk))
+    return bool(word), syllables, difficult, WORD_CHAR_RE.search(chunk) is not None, pieces
+
+def iter_chunks(doc):
+    # Whitespace-separated chunks of the text, rebuilt from the tokens (spaCy splits "don't" and
+    # "e-mail", which count as one word each)
+    pieces = []
+    for token in doc:
+        if token.is_space:
+            if pieces:
+                yield "".join(pieces)
+                pieces = []
+            continue
+        pieces.append(token.text)
+        if token.whitespace_:
+            yield "".join(pieces)
+            pieces = []
+    if pieces:
+        yield "".join(pieces)
+
+def readability_counts(doc):
+    # Counts for one span of text. A sentence can run across spans (incremental analysis counts each
+    # resume section on its own), so the text before the first sentence end ('head') and after the last
+    # ('tail') are kept as [words, has_word_char] fragments, and only sentences wholly inside the span are
+    # counted. head is None when the span has no sentence end; the whole span is then its tail.
+    # merge_readability_counts joins spans in text order into the whole text's counts.
+    counts = {'sentences': 0, 'short_sentences': 0, 'words': 0, 'syllables': 0, 'polysyllables': 0, 'difficult_words': 0,
+              'head': None}
+    sentence_words = 0
+    sentence_started = False
+    for chunk in iter_chunks(doc):
+        is_word, syllables, difficult, has_word_char, pieces = chunk_stats(chunk)
+        if is_word:
+            counts['words'] += 1
+            counts['syllables'] += syllables
+            counts['polysyllables'] += syllables >= 3
+            counts['difficult_words'] += difficult
+        if pieces is None:
+            sentence_started = sentence_started or has_word_char
+            sentence_words += is_word
+            continue
+        for index, (starts_sentence, counts_as_word) in enumerate(pieces):
+            if index:
+                # A sentence ended inside or at the end of this chunk
+                if counts['head'] is None:
+                    counts['head'] = [sentence_words, sentence_started]
+                elif sentence_started:
+                    counts['sentences'] += 1
+                    counts['short_sentences'] += sentence_words <= 2
+                sentence_words, sentence_started = 0, False
+            sentence_started = sentence_started or starts_sentence
+            sentence_words += counts_as_word
+    counts['tail'] = [sentence_words, sentence_started]
+    return counts
+
+def merge_readability_counts(counts_list):
+    # Whole-text counts (no head or tail) from span counts in text order
+    merged = dict.fromkeys(('sentences', 'short_sentences', 'words', 'syllables', 'polysyllables', 'difficult_words'), 0)
+    open_words, open_started = 0, False
+    for counts in counts_list:
+        for key in merged:
+            merged[key] += counts[key]
+        if counts['head'] is not None:
+            head_words, head_started = counts['head']
+            if open_started or head_started:
+                merged['sentences'] += 1
+                merged['short_sentences'] += open_words + head_words <= 2
+            open_words, open_started = 0, False
+        tail_words, tail_started = counts['tail']
+        open_words += tail_words
+        open_started = open_started or tail_started
+    if open_started:
+        merged['sentences'] += 1
+        merged['short_sentences'] += open_words <= 2
+    return merged
+
+def readability_scores(counts):
+    # {'flesch_reading_ease', 'flesch_kincaid_grade', 'gunning_fog', 'smog_index'}; 0.0 where textstat gives 0.0
+    words = counts['words']
+    sentences = max(1, counts['sentences'] - counts['short_sentences']) if words else 0
+    words_per_sentence = words / sentences if sentences else 0.0
+    syllables_per_word = counts['syllables'] / words if words else 0.0
+    if words_per_sentence and syllables_per_word:
+        flesch_reading_ease = FRE_BASE - FRE_SENTENCE_LENGTH * words_per_sentence - FRE_SYLLABLES_PER_WORD * syllables_per_word
+        flesch_kincaid_grade = 0.39 * words_per_sentence + 11.8 * syllables_per_word - 15.59
+    else:
+        flesch_reading_ease = flesch_kincaid_grade = 0.0
+    return {
+        'flesch_reading_ease': flesch_reading_ease,
+        'flesch_kincaid_grade': flesch_kincaid_grade,
+        'gunning_fog': 0.4 * (words_per_sentence + 100 * counts['difficult_words'] / words) if words else 0.0,
+        'smog_index': 1.043 * math.sqrt(30 * counts['polysyllables'] / sentences) + 3.1291 if sentences else 0.0,
+    }
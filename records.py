@@ -0,0 +1,249 @@
+import numpy as np
+
+from metrics import timed
+
+# --- Compact Analysis Records ---
+# Analyses stored or post-processed in bulk are kept small: feedback is a list of (code, params) pairs
+# that render to English only when shown, and score inputs fit a fixed typed layout: a __slots__ record
+# for one resume, or a NumPy structured array for a batch. score_batch applies the calculate_resume_score
+# thresholds to a whole batch as array operations and gives the same scores as the scalar version.
+
+MESSAGES = {
+    # Contact details
+    'contact.email_found': "Good: Email address detected.",
+    'contact.email_missing': "Suggestion (High Priority): Email address not found or in an unrecognized format. Ensure it's clearly visible.",
+    'contact.phone_found': "Good: Phone number detected.",
+    'contact.phone_missing': "Suggestion (High Priority): Phone number not found or in an unrecognized format. Ensure it's clearly visible.",
+    'contact.linkedin_found': "Good: LinkedIn profile link seems to be present.",
+    'contact.linkedin_missing': "Suggestion: Consider adding a link to your LinkedIn profile for networking and professional presence.",
+    # Section headings
+    'sections.required_found': "Good: Section '{section}' seems to be present.",
+    'sections.required_missing': "Suggestion: Missing a clear '{section}' section. This is a standard resume component.",
+    'sections.some_missing': "Warning: Some standard sections (Summary, Experience, Education, Skills) might be missing or not clearly labeled. Ensure these are easily identifiable.",
+    'sections.optional_found': "Info: Optional section '{section}' detected. Ensure it adds value.",
+    # Length
+    'length.word_count': "Info: Total word count is approximately {word_count}.",
+    'length.too_short': "Suggestion: Your resume seems quite short (less than 250 words). Consider adding more detail, accomplishments, or relevant projects, especially if you have more than a year or two of experience.",
+    'length.too_long': "Suggestion: Your resume might be too long (over 800 words). Aim for conciseness. For most professionals, 1-2 pages is ideal. Focus on the most relevant information for the jobs you're targeting.",
+    'length.appropriate': "Info: Resume length seems appropriate for many roles (500-800 words). Ensure it's concise and impactful.",
+    'length.reasonable': "Info: Resume length is reasonable (250-500 words), especially for early-career professionals. Ensure you've included enough detail for your experience level.",
+    # Action verbs
+    'action_verbs.few': "Suggestion: Found {count} action verbs. Strong resumes often use many impactful action verbs (e.g., 15-25+) to start bullet points describing accomplishments.",
+    'action_verbs.some': "Info: Found {count} action verbs. Good start! Consider if more can be used to strengthen accomplishment statements.",
+    'action_verbs.many': "Good: Detected {count} action verbs. This helps make your accomplishments sound dynamic!",
+    'action_verbs.examples': "Info: Some action verbs used: {examples}{more}.",
+    # Quantifiable achievements
+    'quantifiable.none': "Suggestion (High Priority): No clear quantifiable achievements found. Use numbers, percentages, or monetary values to demonstrate the impact of your work (e.g., 'Increased sales by 15%', 'Reduced costs by $10K', 'Managed a team of 5').",
+    'quantifiable.few': "Suggestion: Found {count} potential quantifiable achievement(s). Aim to include more to make your impact clear and measurable. Each key role should ideally have 1-2 quantifiable points.",
+    'quantifiable.good': "Good: Detected {count} potential quantifiable achievements. This significantly strengthens your resume!",
+    # Skills
+    'skills.section_missing': "Suggestion: A dedicated 'Skills' section is highly recommended for listing technical and other key competencies. This makes it easy for recruiters to spot relevant abilities.",
+    'skills.found': "Good: Identified {count} potential technical skills. Example(s): {examples}{more}.",
+    'skills.few': "Suggestion: If you have more technical skills, ensure they are listed clearly. Aim for 5-15 relevant technical skills depending on your field and experience.",
+    'skills.section_without_skills': "Suggestion: Your skills section seems to be present, but few common technical skills were detected. Ensure you list specific tools, programming languages, and technologies.",
+    'skills.none': "Suggestion: No common technical skills detected. If you have them, list them in your 'Skills' section or integrate them into your experience descriptions.",
+    'skills.soft_skills': "Info: Remember to also showcase soft skills (e.g., communication, teamwork, problem-solving, leadership) through your experience descriptions and summary, not just by listing them in a skills section.",
+    # Spelling
+    'spelling.errors': "Warning (Spelling): Found {count} potential spelling errors. Please review. Examples: {examples}{more}",
+    'spelling.proofread': "Suggestion: Proofread carefully or use a spell checker (like Grammarly or Word's built-in checker). Common errors include typos or domain-specific terms not in a standard dictionary. Ensure consistency in capitalization of proper nouns and acronyms.",
+    'spelling.clean': "Good: No obvious spelling errors detected by the basic checker. Always good to double-check manually.",
+    # Readability
+    'readability.flesch': "Info (Readability): Flesch Reading Ease score: {score:.2f} (Higher is better; 60-70 is generally good for wide audiences).",
+    'readability.very_low': "Suggestion: Readability is very low (college graduate level or higher). Try to simplify complex sentences, break up long paragraphs, and use more common vocabulary unless highly technical language is standard for your target roles.",
+    'readability.difficult': "Suggestion: Readability is fairly difficult. Consider simplifying some sentences or jargon for broader understanding, especially if applying to roles outside of a highly specialized field.",
+    'readability.good': "Good: Readability score suggests the text is understandable for a general business audience.",
+    'readability.grade': "Info (Readability): Flesch-Kincaid Grade Level: {grade:.1f}. Aim for a grade level around 8-12 for general business communication, unless a higher level is specific to your field and target audience.",
+    # First person and dates
+    'use_of_i.frequent': "Suggestion: Found first-person pronouns (I, my, me, I'm, etc.) used approximately {count} times. Resumes are typically written in an implied first-person (e.g., 'Managed a team' instead of 'I managed a team'). Consider rephrasing to be more professional and concise.",
+    'dates.few': "Suggestion: Few standard date formats found for employment or education periods. Ensure your experience and education sections have clear and consistently formatted start and end dates (e.g., 'Month YYYY – Month YYYY' or 'Month YYYY – Present').",
+    'dates.found': "Info: Detected {count} instances of common date formats. Consistency in formatting is key for readability.",
+    # Overall verdict and general advice
+    'summary.excellent': "Excellent! Your resume hits most of the key marks for a strong document. It's likely to perform well with both ATS and human reviewers.",
+    'summary.good': "Good foundation! Your resume has several strong points. Addressing the suggestions can elevate it further and increase its effectiveness.",
+    'summary.needs_improvement': "Needs improvement. Your resume has potential but requires attention to several key areas. Focus on the suggestions marked 'High Priority' or 'Warning'.",
+    'summary.significant_improvement': "Significant improvement needed. Your resume may be missing critical elements or have issues that could hinder your job search. Systematically address the feedback provided.",
+    'advice.review': "Info: This is an automated analysis. While it provides valuable insights, also consider having your resume reviewed by a career advisor, mentor, or trusted professional in your field.",
+    'advice.tailor': "Info: Tailor your resume for each specific job application. Highlight the skills and experiences most relevant to the job description, and try to incorporate keywords from it.",
+    'advice.grammar': "Info: Ensure your resume is free of grammatical errors (this tool has basic spell check, but grammar is more complex). Use tools like Grammarly or ask someone to proofread.",
+    'advice.formatting': "Info: Keep your formatting clean, consistent, and professional. Avoid using tables, columns, or unusual fonts that might confuse Applicant Tracking Systems (ATS).",
+}
+
+
+def message(code, **params):
+    # Params must be JSON-serialisable; list params render comma-separated
+    return (code, params)
+
+def examples(values, limit):
+    # The 'examples' and 'more' params of messages that show the first few of a collection
+    values = list(values)
+    return {'examples': values[:limit], 'more': '...' if len(values) > limit else ''}
+
+def render_message(code, params):
+    params = {name: ", ".join(value) if isinstance(value, list) else value for name, value in params.items()}
+    return MESSAGES[code].format(**params)
+
+def render_feedback(messages):
+    return [render_message(code, params) for code, params in messages]
+
+
+# --- Score Inputs ---
+# (group, field, dtype): the nested score_inputs dict the checks produce, flattened
+SCORE_FIELDS = (
+    ('contact_info', 'email_found', '?'),
+    ('contact_info', 'phone_found', '?'),
+    ('contact_info', 'linkedin_found', '?'),
+    ('sections', 'required_sections_found', 'i4'),
+    ('sections', 'total_required_sections', 'i4'),
+    ('length', 'word_count', 'i4'),
+    ('length', 'length_ok', '?'),
+    ('action_verbs', 'action_verb_count', 'i4'),
+    ('quantifiable', 'quantifiable_count', 'i4'),
+    ('skills', 'skills_section_present', '?'),
+    ('skills', 'tech_skills_count', 'i4'),
+    ('spelling', 'misspelled_count', 'i4'),
+    ('readability', 'flesch_score', 'f8'),
+    ('use_of_i', 'i_count', 'i4'),
+    ('dates', 'dates_found_count', 'i4'),
+)
+SCORE_DTYPE = np.dtype([(field, dtype) for _, field, dtype in SCORE_FIELDS])
+
+
+class ScoreInputs:
+    __slots__ = tuple(field for _, field, _ in SCORE_FIELDS)
+
+    def __init__(self, **values):
+        for field in self.__slots__:
+            setattr(self, field, values[field])
+
+    @classmethod
+    def from_dict(cls, score_inputs):
+        return cls(**{field: score_inputs[group][field] for group, field, _ in SCORE_FIELDS})
+
+    def to_dict(self):
+        # The nested form calculate_resume_score and the JSON API use
+        score_inputs = {}
+        for group, field, _ in SCORE_FIELDS:
+            score_inputs.setdefault(group, {})[field] = getattr(self, field)
+        return score_inputs
+
+    def as_tuple(self):
+        return tuple(getattr(self, field) for field in self.__slots__)
+
+    def __eq__(self, other):
+        return isinstance(other, ScoreInputs) and self.as_tuple() == other.as_tuple()
+
+    def __repr__(self):
+        return f"ScoreInputs({', '.join(f'{field}={getattr(self, field)!r}' for field in self.__slots__)})"
+
+
+# --- Scoring ---
+# One resume's score from its nested score_inputs. score_batch below applies the same thresholds to a
+# whole batch (tests/test_records.py checks the two agree).
+@timed
+def calculate_resume_score(score_inputs):
+    base_score = 100
+    deductions = 0
+    bonus_points = 0 
+
+    if not score_inputs['contact_info']['email_found']: deductions += 10
+    if not score_inputs['contact_info']['phone_found']: deductions += 10
+    if not score_inputs['contact_info']['linkedin_found']: deductions += 3
+
+    sections_ratio = score_inputs['sections']['required_sections_found'] / score_inputs['sections']['total_required_sections']
+    if sections_ratio < 0.5: deductions += 15 
+    elif sections_ratio < 0.75: deductions += 10 
+    elif sections_ratio < 1.0: deductions += 5  
+    else: bonus_points += 2 
+
+    if not score_inputs['length']['length_ok']: deductions += 5
+    wc = score_inputs['length']['word_count']
+    if 400 <= wc <= 700 : bonus_points += 2
+
+    av_count = score_inputs['action_verbs']['action_verb_count']
+    if av_count < 5: deductions += 8
+    elif av_count < 10: deductions += 5
+    elif av_count < 15: deductions += 2
+    elif av_count >= 20: bonus_points += 3 
+
+    qa_count = score_inputs['quantifiable']['quantifiable_count']
+    if qa_count == 0: deductions += 18
+    elif qa_count < 2: deductions += 10
+    elif qa_count < 4: deductions += 5
+    elif qa_count >= 5: bonus_points += 5 
+
+    if not score_inputs['skills']['skills_section_present']: deductions += 7
+    elif score_inputs['skills']['tech_skills_count'] < 3: deductions += 4 
+    elif score_inputs['skills']['tech_skills_count'] < 5: deductions += 2
+    elif score_inputs['skills']['tech_skills_count'] >= 10: bonus_points += 2 
+
+    misspelled = score_inputs['spelling']['misspelled_count']
+    if misspelled > 5: deductions += 12
+    elif misspelled > 2: deductions += 7
+    elif misspelled > 0: deductions += 3
+
+    f_score = score_inputs['readability']['flesch_score']
+    if f_score < 30: deductions += 8
+    elif f_score < 50: deductions += 5
+    elif f_score < 60: deductions += 2
+    elif f_score >= 70: bonus_points += 2 
+
+    i_usage_count = score_inputs['use_of_i']['i_count'] 
+    if i_usage_count > 5: deductions += 5
+    elif i_usage_count > 2: deductions += 2
+
+    if score_inputs['dates']['dates_found_count'] < 2: deductions += 4 
+    elif score_inputs['dates']['dates_found_count'] < 4: deductions += 2 
+
+    final_score = max(0, min(100, base_score - deductions + bonus_points)) 
+    return int(final_score)
+
+def score_inputs_array(items):
+    # Structured array from ScoreInputs records or nested score_inputs dicts
+    rows = [(item if isinstance(item, ScoreInputs) else ScoreInputs.from_dict(item)).as_tuple() for item in items]
+    return np.array(rows, dtype=SCORE_DTYPE)
+
+def score_batch(inputs):
+    # calculate_resume_score over a SCORE_DTYPE array, one int score per row. Each np.select lists the
+    # scalar version's if/elif branches in the same order, so the first matching threshold wins as there.
+    deductions = np.zeros(len(inputs), dtype=np.int64)
+    bonus_points = np.zeros(len(inputs), dtype=np.int64)
+
+    deductions += np.where(inputs['email_found'], 0, 10)
+    deductions += np.where(inputs['phone_found'], 0, 10)
+    deductions += np.where(inputs['linkedin_found'], 0, 3)
+
+    sections_ratio = inputs['required_sections_found'] / inputs['total_required_sections']
+    deductions += np.select([sections_ratio < 0.5, sections_ratio < 0.75, sections_ratio < 1.0], [15, 10, 5], 0)
+    bonus_points += np.where(sections_ratio >= 1.0, 2, 0)
+
+    deductions += np.where(inputs['length_ok'], 0, 5)
+    word_count = inputs['word_count']
+    bonus_points += np.where((word_count >= 400) & (word_count <= 700), 2, 0)
+
+    av_count = inputs['action_verb_count']
+    deductions += np.select([av_count < 5, av_count < 10, av_count < 15], [8, 5, 2], 0)
+    bonus_points += np.where(av_count >= 20, 3, 0)
+
+    qa_count = inputs['quantifiable_count']
+    deductions += np.select([qa_count == 0, qa_count < 2, qa_count < 4], [18, 10, 5], 0)
+    bonus_points += np.where(qa_count >= 5, 5, 0)
+
+    skills_present = inputs['skills_section_present']
+    tech_skills = inputs['tech_skills_count']
+    deductions += np.select([~skills_present, tech_skills < 3, tech_skills < 5], [7, 4, 2], 0)
+    bonus_points += np.where(skills_present & (tech_skills >= 10), 2, 0)
+
+    misspelled = inputs['misspelled_count']
+    deductions += np.select([misspelled > 5, misspelled > 2, misspelled > 0], [12, 7, 3], 0)
+
+    f_score = inputs['flesch_score']
+    deductions += np.select([f_score < 30, f_score < 50, f_score < 60], [8, 5, 2], 0)
+    bonus_points += np.where(f_score >= 70, 2, 0)
+
+    i_count = inputs['i_count']
+    deductions += np.select([i_count > 5, i_count > 2], [5, 2], 0)
+
+    dates_count = inputs['dates_found_count']
+    deductions += np.select([dates_count < 2, dates_count < 4], [4, 2], 0)
+
+    return np.clip(100 - deductions + bonus_points, 0, 100)
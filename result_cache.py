@@ -0,0 +1,134 @@
+import contextlib
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+# --- Result Cache ---
+# Analysis results keyed by a content hash, so re-uploading the same resume skips extraction,
+# the spaCy parse, spell check and readability entirely. Values are plain JSON-serialisable dicts.
+# Sections of a resume are cached too, so an edited re-upload only re-parses the sections that changed.
+
+# Bumped whenever the shape of cached values changes, so a shared disk cache never serves an old shape
+KEY_VERSION = "v5"
+
+
+def upload_digest_cache_key(hexdigest):
+    # For uploads hashed while they were received (see uploads.py)
+    return f"{KEY_VERSION}:upload:{hexdigest}"
+
+def text_digest(text):
+    # Hashed exactly: section headings and phrases are matched line by line, so text that differs only in
+    # whitespace can get a different report. Different files that extract to the same text still share a digest.
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+def text_cache_key(text):
+    return f"{KEY_VERSION}:text:{text_digest(text)}"
+
+def section_cache_key(section):
+    # Per-section analysis inputs (see App.analyze_resume_incremental); hashed as-is, since the
+    # section regexes are sensitive to exact whitespace
+    return f"{KEY_VERSION}:section:{hashlib.sha256(section.encode('utf-8')).hexdigest()}"
+
+
+class NullResultCache:
+    def get(self, key):
+        return None
+
+    def set(self, key, value):
+        pass
+
+
+class MemoryResultCache:
+    # In-process LRU with a per-entry TTL; private to one gunicorn worker
+    def __init__(self, max_entries=512, ttl=3600):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if time.time() - stored_at > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.time(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class DiskResultCache:
+    # SQLite-backed store so every gunicorn worker on the host shares the same entries
+    def __init__(self, path, max_entries=5000, ttl=24 * 3600):
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl = ttl
+        directory = os.path.dirname(os.path.abspath(path))
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, stored_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS results_accessed_at ON results (accessed_at)")
+
+    @contextlib.contextmanager
+    def _connect(self):
+        # A short-lived connection per call keeps the cache safe to use across forked workers.
+        # It is closed explicitly: sqlite3 connections otherwise linger until garbage collection.
+        conn = sqlite3.connect(self.path, timeout=5)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, key):
+        now = time.time()
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT value FROM results WHERE key = ? AND stored_at > ?", (key, now - self.ttl)
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute("UPDATE results SET accessed_at = ? WHERE key = ?", (now, key))
+        return json.loads(row[0])
+
+    def set(self, key, value):
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO results (key, value, stored_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value), now, now),
+            )
+            conn.execute("DELETE FROM results WHERE stored_at <= ?", (now - self.ttl,))
+            conn.execute(
+                "DELETE FROM results WHERE key IN ("
+                "SELECT key FROM results ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+
+def create_result_cache(backend, max_entries, ttl, path=None):
+    if backend == 'memory':
+        return MemoryResultCache(max_entries=max_entries, ttl=ttl)
+    if backend == 'disk':
+        return DiskResultCache(path, max_entries=max_entries, ttl=ttl)
+    if backend == 'none':
+        return NullResultCache()
+    raise ValueError(f"Unknown result cache backend '{backend}'. Choose one of: memory, disk, none.")
@@ -0,0 +1,31 @@
+import os
+import sys
+
+import pytest
+
+# Modules live at the top of the repository
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture(scope='session')
+def app_module(tmp_path_factory):
+    # The App module, configured before import like bulk_analyze.py does: analysis inline, no result cache,
+    # no admission control and every on-disk store in a throwaway directory. Tests that need it are skipped
+    # when the spaCy model isn't installed, unless REQUIRE_SPACY_MODEL=1 (set it wherever requirements.txt
+    # is installed, so the model-dependent parity tests can't be skipped silently).
+    if os.environ.get('REQUIRE_SPACY_MODEL', '0') == '1':
+        import en_core_web_sm  # noqa: F401
+    else:
+        pytest.importorskip('en_core_web_sm')
+    scratch = tmp_path_factory.mktemp('app')
+    os.environ.update({
+        'ANALYSIS_POOL_WORKERS': '0',
+        'RESULT_CACHE_BACKEND': 'none',
+        'ADMISSION_CONTROL': '0',
+        'JOB_DB_PATH': str(scratch / 'jobs.sqlite3'),
+        'UPLOAD_FOLDER': str(scratch / 'uploads'),
+        'JD_INDEX_PATH': str(scratch / 'jd_index'),
+        'ADMISSION_DB_PATH': str(scratch / 'admission.sqlite3'),
+    })
+    import App
+    return App
@@ -0,0 +1,78 @@
+import random
+import re
+
+import pytest
+
+from lexical_scan import scan_lexical_features
+
+# The per-pattern findall/search implementations scan_lexical_features replaced, kept as the oracle
+MONTH = r'(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)'
+BASELINE_DATE_PATTERNS = [
+    r'\b' + MONTH + r'\s+\d{4}\b',
+    r'\b\d{1,2}\/\d{4}\b',
+    r'\b\d{1,2}\-\d{4}\b',
+    r'\b\d{4}\s*[-–—to]+\s*\d{4}\b',
+    r'\b\d{4}\s*[-–—to]+\s*(?:Present|Current|Ongoing|Till Date)\b',
+    r'\b' + MONTH + r'\s+\d{4}\s*[-–—to]+\s*' + MONTH + r'\s+\d{4}\b',
+    r'\b' + MONTH + r'\s+\d{4}\s*[-–—to]+\s*(?:Present|Current|Ongoing|Till Date)\b',
+]
+
+
+def baseline_features(text):
+    return {
+        'email_found': re.search(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}", text) is not None,
+        'phone_found': re.search(r"(\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4})", text) is not None,
+        'linkedin_found': "linkedin.com/in/" in text.lower() or "linkedin.com/pub/" in text.lower(),
+        'first_person_count': (len(re.findall(r'\bI\b', text))
+                               + len(re.findall(r"\b(I'm|I've|I'd|I’ll|I’d)\b", text, re.IGNORECASE))
+                               + len(re.findall(r"\b(my|me)\b", text, re.IGNORECASE))),
+        'dates_found_count': sum(len(re.findall(pattern, text, re.IGNORECASE)) for pattern in BASELINE_DATE_PATTERNS),
+    }
+
+
+EDGE_CASES = [
+    "",
+    "I",
+    "I'm I've I'd I’ll I’d i'm I'M",
+    "Me, my, MY, me. Mine? Myself, meme, Ime",
+    "Jan 2020 - Present",
+    "January 2019 – March 2021",
+    "Sept 2020 to Oct 2021",
+    "2018-2020 2018 - Present 2018 to 2019 2018to2019 2018 — Current",
+    "05/2020 12-2019 123/2020 5/20201",
+    "Mayor 2020 May2020 may 2020 MAY 2020 Dec 20201",
+    "Jan 2020 - Feb 2021 - Mar 2022 - Present",
+    "2019 - 2020 - 2021 - Till Date",
+    "I managed my team; they told me I'd lead. (555) 123-4567 me@example.com linkedin.com/in/me",
+    "In 2010-2012 I worked at Acme; in Nov 2013 – Present I lead teams.",
+    "ID I.D. I-9 AI I/O 1I I1 _I I_",
+]
+
+FRAGMENTS = [
+    "I", "i", "I'm", "i've", "I'd", "I’ll", "I’d", "I'll", "my", "My", "me", "ME", "mine", "meme", "Ime",
+    "Jan", "January", "Feb", "Sep", "Sept", "September", "May", "mayor", "Dec", "Decem", "Present", "present",
+    "Current", "Ongoing", "Till Date", "to", "-", "–", "—", "/", "2019", "2020", "2021", "1999", "12", "5",
+    "123", "20201", "05/2020", "3-2021", "2018-2020", "2018to2020", "(555)", "123-4567", "555.123.4567",
+    "a@b.co", "linkedin.com/in/", "LinkedIn.com/pub/", "managed", "team", ",", ".", ";", "(", ")",
+]
+SEPARATORS = [" ", " ", " ", "", "\n", "\t", "  ", " - ", "/", "-", ", "]
+
+
+def random_text(rng):
+    pieces = []
+    for _ in range(rng.randint(1, 40)):
+        pieces.append(rng.choice(FRAGMENTS))
+        pieces.append(rng.choice(SEPARATORS))
+    return "".join(pieces)
+
+
+@pytest.mark.parametrize('text', EDGE_CASES)
+def test_edge_cases_match_baseline(text):
+    assert scan_lexical_features(text) == baseline_features(text)
+
+
+def test_random_texts_match_baseline():
+    rng = random.Random(0)
+    for _ in range(5000):
+        text = random_text(rng)
+        assert scan_lexical_features(text) == baseline_features(text), text
@@ -0,0 +1,35 @@
+import functools
+
+from metrics import call_collecting, merge_pool_counters, pool_counters, register_counters, stage
+
+
+@functools.lru_cache(maxsize=None)
+def square(number):
+    return number * number
+
+def square_all(numbers):
+    with stage('square'):
+        return [square(number) for number in numbers]
+
+def square_cache_counters():
+    info = square.cache_info()
+    return {'hits': info.hits, 'misses': info.misses}
+
+register_counters('square_cache', square_cache_counters)
+
+
+def test_call_collecting_returns_timings_and_counter_changes():
+    square(2)
+    result, timings, counters = call_collecting(square_all, None, [2, 3, 3, 4])
+    assert result == [4, 9, 9, 16]
+    assert set(timings) == {'square'}
+    # square(2) was cached before the call, so only the lookups made during it count
+    assert counters['square_cache'] == {'hits': 2, 'misses': 2}
+
+def test_counter_changes_add_up_across_jobs():
+    before = pool_counters('square_cache')
+    for numbers in ([5, 6], [5, 7]):
+        merge_pool_counters(call_collecting(square_all, None, numbers)[2])
+    after = pool_counters('square_cache')
+    assert after['hits'] - before.get('hits', 0) == 1
+    assert after['misses'] - before.get('misses', 0) == 3
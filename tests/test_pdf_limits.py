@@ -0,0 +1,38 @@
+import pytest
+
+
+def read_pages(app_module, timings, total_pages, max_pages=50, max_chars=200000, page_time_budget=5.0):
+    # Feeds iter_pdf_page_text one page of text per entry in timings (seconds each page took)
+    notices = []
+    pages = list(app_module.iter_pdf_page_text(((f"page {number}", seconds) for number, seconds in enumerate(timings, start=1)),
+                                               total_pages=total_pages, max_pages=max_pages, max_chars=max_chars,
+                                               page_time_budget=page_time_budget, notices=notices))
+    return pages, notices
+
+
+def test_short_document_has_no_notices(app_module):
+    pages, notices = read_pages(app_module, [0.1, 0.1], total_pages=2)
+    assert pages == ["page 1", "page 2"]
+    assert notices == []
+
+
+def test_slow_page_counts_skipped_pages_within_the_page_limit(app_module):
+    pages, notices = read_pages(app_module, [0.1, 6.0, 0.1], total_pages=300, max_pages=3)
+    assert pages == ["page 1", "page 2"]
+    assert len(notices) == 2
+    assert "Page 2 took 6.0s" in notices[0] and "(1 page(s) skipped)" in notices[0]
+    assert "Only the first 3 of 300 pages" in notices[1]
+
+
+@pytest.mark.parametrize('total_pages', [3, 300])
+def test_slow_last_page_still_reports_the_page_limit(app_module, total_pages):
+    pages, notices = read_pages(app_module, [0.1, 0.1, 6.0], total_pages=total_pages, max_pages=3)
+    assert pages == ["page 1", "page 2", "page 3"]
+    # Nothing within the limit was skipped, so only the page limit is reported
+    assert notices == ([] if total_pages == 3 else ["Warning: Only the first 3 of 300 pages were analyzed. Most resumes should be 1-2 pages."])
+
+
+def test_character_limit_stops_extraction(app_module):
+    pages, notices = read_pages(app_module, [0.1, 0.1, 0.1], total_pages=3, max_chars=10)
+    assert pages == ["page 1", "page"]
+    assert notices == ["Warning: Text extraction stopped after 10 characters (page 2 of 3). Only that part of the document was analyzed."]
@@ -0,0 +1,25 @@
+import io
+
+import pytest
+
+from benchmarks.corpus import generate_corpus
+
+
+@pytest.fixture(scope='module')
+def corpus_texts(app_module):
+    texts = []
+    for document in generate_corpus(seed=0):
+        text, error_message = app_module.extract_text_from_upload(document['filename'], io.BytesIO(document['data']))
+        assert error_message is None, document['filename']
+        texts.append(text)
+    return texts
+
+
+@pytest.mark.parametrize('profile', [
+    'fast',
+    pytest.param('lean', marks=pytest.mark.xfail(
+        reason="senter's sentence boundaries can differ from the parser's, which shifts quantified-achievement counts",
+        strict=False)),
+])
+def test_profile_scores_match_full(app_module, corpus_texts, profile):
+    assert app_module.compare_pipeline_profiles(corpus_texts, profile) == []
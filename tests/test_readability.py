@@ -0,0 +1,82 @@
+import random
+
+import pytest
+import spacy
+import textstat
+
+from readability import cmu_dictionary, merge_readability_counts, readability_counts, readability_scores
+
+# readability only reads tokens and their trailing whitespace, which the tokenizer alone provides
+nlp = spacy.blank("en")
+
+WORDS = ["Managed", "a", "team", "of", "engineers", "delivering", "infrastructure", "I", "don't", "e-mail",
+         "node.js", "e.g.", "U.S.", "2019", "$5,000", "—", "-", "(Python)", "results", "approximately", "simplify"]
+ENDINGS = ["", "", "", ".", "!", "?", "...", ":", ";", ","]
+SEPARATORS = [" ", " ", " ", "\n", "\n\n", "\t", "  "]
+
+
+def random_text(rng):
+    pieces = []
+    for _ in range(rng.randint(1, 60)):
+        pieces.append(rng.choice(WORDS) + rng.choice(ENDINGS))
+        pieces.append(rng.choice(SEPARATORS))
+    return "".join(pieces)
+
+def split_at_lines(rng, text):
+    # Splits at line boundaries, as App.split_resume_sections does
+    lines = text.splitlines(keepends=True)
+    cuts = sorted(rng.sample(range(1, len(lines)), min(len(lines) - 1, rng.randint(0, 4)))) if len(lines) > 1 else []
+    bounds = [0] + cuts + [len(lines)]
+    return ["".join(lines[start:stop]) for start, stop in zip(bounds, bounds[1:])]
+
+
+@pytest.mark.parametrize('sections', [
+    ["One sentence runs\n", "across a heading. Then another\n", "one ends here.\n"],
+    ["No sentence end\n", "anywhere at all\n"],
+    ["Ends here.\n", "Starts here.\n"],
+    ["", "Only. Short. Ones.\n", ""],
+])
+def test_section_counts_merge_into_whole_text_counts(sections):
+    whole = merge_readability_counts([readability_counts(nlp("".join(sections)))])
+    assert merge_readability_counts([readability_counts(doc) for doc in nlp.pipe(sections)]) == whole
+
+def test_random_section_splits_merge_into_whole_text_counts():
+    rng = random.Random(0)
+    for _ in range(500):
+        text = random_text(rng)
+        sections = split_at_lines(rng, text)
+        whole = merge_readability_counts([readability_counts(nlp(text))])
+        assert merge_readability_counts([readability_counts(doc) for doc in nlp.pipe(sections)]) == whole, sections
+
+
+# --- Parity with textstat ---
+# textstat 0.7.7 raises KeyError for words missing from the CMU dictionary (readability falls back to
+# Pyphen there), so the comparison only uses words the dictionary has.
+VOCABULARY = ["managed", "led", "developed", "the", "a", "team", "of", "engineers", "customer", "platform",
+              "improving", "performance", "by", "percent", "and", "reduced", "costs", "I", "my", "experience",
+              "university", "communication", "responsibility", "organization", "analysis", "data", "internal",
+              "we", "delivered", "new", "features", "every", "week", "to", "our", "users", "quickly", "company",
+              "environment", "development", "information", "technology", "opportunity", "international"]
+TEXTSTAT_METRICS = {
+    'flesch_reading_ease': textstat.flesch_reading_ease,
+    'flesch_kincaid_grade': textstat.flesch_kincaid_grade,
+    'gunning_fog': textstat.gunning_fog,
+    'smog_index': textstat.smog_index,
+}
+
+
+def dictionary_text(rng, words):
+    sentences = []
+    for _ in range(rng.randint(1, 12)):
+        sentence = " ".join(rng.choice(words) for _ in range(rng.randint(1, 25)))
+        sentences.append(sentence[0].upper() + sentence[1:] + rng.choice([".", ".", "!", "?", ""]))
+    return rng.choice([" ", "\n"]).join(sentences)
+
+def test_scores_match_textstat_on_dictionary_words():
+    words = [word for word in VOCABULARY if word.lower() in cmu_dictionary()]
+    rng = random.Random(0)
+    for _ in range(300):
+        text = dictionary_text(rng, words)
+        scores = readability_scores(merge_readability_counts([readability_counts(nlp(text))]))
+        for name, metric in TEXTSTAT_METRICS.items():
+            assert scores[name] == pytest.approx(metric(text), abs=0.01), (name, text)
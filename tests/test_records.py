@@ -0,0 +1,48 @@
+import random
+
+import numpy as np
+
+from records import ScoreInputs, calculate_resume_score, score_batch, score_inputs_array
+
+# Values on and around every threshold calculate_resume_score tests
+EDGE_VALUES = {
+    'required_sections_found': [0, 1, 2, 3, 4, 5],
+    'total_required_sections': [4, 5],
+    'word_count': [0, 150, 399, 400, 401, 699, 700, 701, 1500],
+    'action_verb_count': [0, 4, 5, 9, 10, 14, 15, 19, 20, 21],
+    'quantifiable_count': [0, 1, 2, 3, 4, 5, 6],
+    'tech_skills_count': [0, 2, 3, 4, 5, 9, 10, 11],
+    'misspelled_count': [0, 1, 2, 3, 5, 6],
+    'flesch_score': [-20.0, 0.0, 29.99, 30.0, 49.99, 50.0, 59.99, 60.0, 69.99, 70.0, 100.0],
+    'i_count': [0, 2, 3, 5, 6],
+    'dates_found_count': [0, 1, 2, 3, 4, 5],
+}
+
+
+def random_inputs(rng):
+    values = {field: rng.choice(choices) for field, choices in EDGE_VALUES.items()}
+    values['required_sections_found'] = min(values['required_sections_found'], values['total_required_sections'])
+    if rng.random() < 0.3:
+        values['flesch_score'] = rng.uniform(-50, 120)
+        values['word_count'] = rng.randint(0, 3000)
+        values['action_verb_count'] = rng.randint(0, 40)
+    for field in ('email_found', 'phone_found', 'linkedin_found', 'length_ok', 'skills_section_present'):
+        values[field] = rng.random() < 0.5
+    return ScoreInputs(**values)
+
+
+def test_score_batch_matches_scalar_scores():
+    rng = random.Random(0)
+    records = [random_inputs(rng) for _ in range(50000)]
+    batch_scores = score_batch(score_inputs_array(records))
+    scalar_scores = np.array([calculate_resume_score(record.to_dict()) for record in records])
+    mismatches = np.flatnonzero(batch_scores != scalar_scores)
+    assert mismatches.size == 0, records[mismatches[0]]
+
+def test_score_inputs_round_trip():
+    record = random_inputs(random.Random(1))
+    assert ScoreInputs.from_dict(record.to_dict()) == record
+    assert score_batch(score_inputs_array([record.to_dict()]))[0] == calculate_resume_score(record.to_dict())
+
+def test_score_batch_of_nothing():
+    assert score_batch(score_inputs_array([])).shape == (0,)
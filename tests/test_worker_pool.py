@@ -0,0 +1,57 @@
+import os
+import threading
+import time
+
+import pytest
+
+from worker_pool import AnalysisPool, PoolBusyError, PoolTimeoutError
+
+
+@pytest.fixture
+def pool():
+    pool = AnalysisPool(max_workers=2, max_queue_depth=0, job_timeout=1)
+    yield pool
+    executor = pool._executor
+    if executor is not None:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def test_jobs_run_in_order(pool):
+    assert pool.run_many(pow, [(2, 3), (3, 2)]) == [8, 9]
+
+
+def test_hung_jobs_free_their_workers_after_timing_out(pool):
+    with pytest.raises(PoolTimeoutError):
+        pool.run_many(time.sleep, [(30,), (30,)])
+    started = time.time()
+    assert pool.run(os.getpid) != os.getpid()
+    assert time.time() - started < 10
+    assert pool.stats()['timed_out'] == 1
+    assert pool.stats()['recycled'] == 1
+
+
+def test_jobs_killed_by_a_recycle_are_rejected_as_busy(pool):
+    errors = []
+
+    def bystander():
+        try:
+            pool.run(time.sleep, 0.8)
+        except Exception as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=bystander)
+    thread.start()
+    time.sleep(0.2)
+    with pytest.raises(PoolTimeoutError):
+        pool.run(time.sleep, 30, deadline=time.time() + 0.1)
+    thread.join()
+    assert len(errors) == 1 and isinstance(errors[0], PoolBusyError)
+    assert pool.run(pow, 2, 2) == 4
+
+
+def test_full_pool_rejects_without_submitting(pool):
+    pool.run(os.getpid)
+    submitted = pool.stats()['submitted']
+    with pytest.raises(PoolBusyError):
+        pool.run_many(pow, [(2, 2)] * 3)
+    assert pool.stats()['submitted'] == submitted
@@ -0,0 +1,95 @@
+import hashlib
+import io
+import mmap
+import os
+import tempfile
+
+from flask import Request, current_app
+
+from metrics import stage
+
+# --- Upload Spooling ---
+# Werkzeug writes each uploaded file into the stream returned by the request's stream factory; these
+# streams hash the bytes as they are written, so the content hash costs no second pass. Small uploads
+# stay in memory and are read in place. Anything larger than UPLOAD_SPOOL_THRESHOLD is spooled to a
+# named file in UPLOAD_FOLDER that extraction memory-maps by path (also from a pool worker), so memory
+# per in-flight upload stays bounded by the threshold. Spool files are deleted when the request closes.
+
+
+class HashingBytesIO(io.BytesIO):
+    def __init__(self):
+        super().__init__()
+        self.hasher = hashlib.sha256()
+
+    def write(self, data):
+        self.hasher.update(data)
+        return super().write(data)
+
+
+class HashingSpoolFile:
+    # Wraps a NamedTemporaryFile; everything except write() is passed straight through
+    def __init__(self, directory):
+        self._file = tempfile.NamedTemporaryFile('wb+', dir=directory, prefix='upload-')
+        self.hasher = hashlib.sha256()
+        self.spool_path = self._file.name
+
+    def write(self, data):
+        self.hasher.update(data)
+        return self._file.write(data)
+
+    def __getattr__(self, name):
+        return getattr(self._file, name)
+
+    def __iter__(self):
+        return iter(self._file)
+
+
+class SpoolingRequest(Request):
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        if total_content_length is not None and total_content_length <= current_app.config['UPLOAD_SPOOL_THRESHOLD']:
+            return HashingBytesIO()
+        return HashingSpoolFile(current_app.config['UPLOAD_FOLDER'])
+
+    def _load_form_data(self):
+        # Parsing the multipart body is where the upload is actually received
+        if "form" in self.__dict__:
+            return
+        with stage('upload_read'):
+            super()._load_form_data()
+
+
+def stream_sha256(stream):
+    # Hex digest of an upload stream: free for streams filled by SpoolingRequest, otherwise one read
+    hasher = getattr(stream, 'hasher', None)
+    if hasher is not None:
+        return hasher.hexdigest()
+    if isinstance(stream, io.BytesIO):
+        return hashlib.sha256(stream.getbuffer()).hexdigest()
+    hasher = hashlib.sha256()
+    position = stream.tell()
+    stream.seek(0)
+    for chunk in iter(lambda: stream.read(1024 * 1024), b""):
+        hasher.update(chunk)
+    stream.seek(position)
+    return hasher.hexdigest()
+
+def spool_path(stream):
+    # Path of the file backing an upload stream, or None for in-memory uploads
+    return getattr(stream, 'spool_path', None)
+
+
+class MappedFile(mmap.mmap):
+    # mmap already reads and seeks like a file; zipfile (python-docx) also asks whether it can seek
+    def seekable(self):
+        return True
+
+    def readable(self):
+        return True
+
+
+def open_mapped(path):
+    # Read-only memory map of a spooled upload; empty files can't be mapped and get an empty buffer
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return io.BytesIO()
+        return MappedFile(f.fileno(), 0, access=mmap.ACCESS_READ)
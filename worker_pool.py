@@ -0,0 +1,164 @@
+import concurrent.futures
+import concurrent.futures.process
+import os
+import threading
+import time
+import weakref
+
+# --- Analysis Worker Pool ---
+# A bounded process pool for CPU-heavy work (PDF parsing, spaCy, spell check) so a slow document
+# never ties up the web worker's request thread. Jobs past the queue-depth limit are rejected
+# immediately instead of piling up. A job that times out can't be interrupted, so its workers are
+# killed and the pool is rebuilt; jobs of other requests caught in that are rejected as busy.
+
+
+class PoolBusyError(Exception):
+    pass
+
+
+class PoolTimeoutError(Exception):
+    pass
+
+
+def _timed_call(fn, args):
+    # Runs in the child; the timestamps let the parent split latency into queue wait and run time
+    started = time.time()
+    result = fn(*args)
+    return result, started, time.time()
+
+
+class AnalysisPool:
+    def __init__(self, max_workers, max_queue_depth, job_timeout, initializer=None):
+        self.max_workers = max_workers
+        self.max_queue_depth = max_queue_depth
+        self.job_timeout = job_timeout
+        self.initializer = initializer
+        self._executor = None
+        self._owner_pid = None
+        self._lock = threading.Lock()
+        # One slot per running or queued job; a slot is only freed once its job really finishes
+        # or its worker is killed, so a timed-out job counts against the limit until the pool is recycled.
+        self._slots = threading.BoundedSemaphore(max_workers + max_queue_depth)
+        # Executors shut down by _recycle, to tell their casualties apart from a worker that crashed
+        self._recycled = weakref.WeakSet()
+        self._stats = {
+            'submitted': 0, 'completed': 0, 'failed': 0, 'rejected': 0, 'timed_out': 0, 'recycled': 0,
+            'queue_wait_seconds_total': 0.0, 'queue_wait_seconds_max': 0.0,
+            'run_seconds_total': 0.0, 'run_seconds_max': 0.0,
+        }
+
+    def _get_executor(self):
+        with self._lock:
+            # A pool inherited across fork has no live management thread, so each process builds its own
+            if self._executor is None or self._owner_pid != os.getpid():
+                self._executor = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=self.max_workers, initializer=self.initializer)
+                self._owner_pid = os.getpid()
+            return self._executor
+
+    def warm(self):
+        # Starts every worker up front so the first requests don't pay for process start and initializer
+        executor = self._get_executor()
+        for future in [executor.submit(os.getpid) for _ in range(self.max_workers)]:
+            future.result()
+
+    def run(self, fn, *args, deadline=None):
+        return self.run_many(fn, [args], deadline=deadline)[0]
+
+    def run_many(self, fn, args_list, deadline=None):
+        # Runs fn(*args) for every tuple in args_list in parallel and returns the results in order.
+        # All or nothing: if the pool can't take every job, PoolBusyError is raised before any is submitted.
+        # deadline (a time.time() value) caps the wait below job_timeout, so several jobs made by one
+        # request can share that request's time budget.
+        acquired = 0
+        while acquired < len(args_list) and self._slots.acquire(blocking=False):
+            acquired += 1
+        if acquired < len(args_list):
+            for _ in range(acquired):
+                self._slots.release()
+            self._record(rejected=1)
+            raise PoolBusyError(f"All {self.max_workers} analysis workers are busy and {self.max_queue_depth} jobs are already queued.")
+
+        submitted = time.time()
+        futures = []
+        try:
+            executor = self._get_executor()
+            for args in args_list:
+                futures.append(executor.submit(_timed_call, fn, args))
+                futures[-1].add_done_callback(lambda _: self._slots.release())
+        except Exception:
+            for _ in range(len(args_list) - len(futures)):
+                self._slots.release()
+            for future in futures:
+                future.cancel()
+            raise
+        self._record(submitted=len(futures))
+
+        timeout = self.job_timeout if deadline is None else max(0.0, min(self.job_timeout, deadline - submitted))
+        deadline = submitted + timeout
+        results = []
+        try:
+            for future in futures:
+                try:
+                    result, started, finished = future.result(timeout=max(0.0, deadline - time.time()))
+                except concurrent.futures.TimeoutError:
+                    self._record(timed_out=1)
+                    self._recycle(executor, futures)
+                    raise PoolTimeoutError(f"Analysis did not finish within {timeout:.0f} seconds.")
+                except concurrent.futures.process.BrokenProcessPool:
+                    # A worker died (e.g. killed for memory); start a fresh pool for the next job
+                    with self._lock:
+                        if self._executor is executor:
+                            self._executor = None
+                    self._record(failed=1)
+                    if executor in self._recycled:
+                        raise PoolBusyError("The analysis workers were restarted after another job timed out. Please try again.")
+                    raise
+                except Exception:
+                    self._record(failed=1)
+                    raise
+                self._record(completed=1, queue_wait=max(0.0, started - submitted), run=finished - started)
+                results.append(result)
+        except Exception:
+            # Jobs that haven't started yet are dropped; running ones keep their slot until they finish
+            for future in futures:
+                future.cancel()
+            raise
+        return results
+
+    def _recycle(self, executor, futures):
+        # Kills every worker of executor, since that's the only way to stop a job that is still running,
+        # and lets the next job start a fresh pool. Killed jobs fail, which frees their slots; the timed-out
+        # futures are waited for so their slots are free again by the time the caller sees the timeout.
+        with self._lock:
+            recycled = executor in self._recycled
+            self._recycled.add(executor)
+            if self._executor is executor:
+                self._executor = None
+        if not recycled:
+            self._record(recycled=1)
+            for process in list((executor._processes or {}).values()):
+                process.kill()
+            executor.shutdown(wait=False, cancel_futures=True)
+        concurrent.futures.wait(futures, timeout=5)
+
+    def _record(self, queue_wait=None, run=None, **counters):
+        with self._lock:
+            for name, value in counters.items():
+                self._stats[name] += value
+            if queue_wait is not None:
+                self._stats['queue_wait_seconds_total'] += queue_wait
+                self._stats['queue_wait_seconds_max'] = max(self._stats['queue_wait_seconds_max'], queue_wait)
+            if run is not None:
+                self._stats['run_seconds_total'] += run
+                self._stats['run_seconds_max'] = max(self._stats['run_seconds_max'], run)
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+        completed = stats['completed']
+        stats['queue_wait_seconds_avg'] = stats['queue_wait_seconds_total'] / completed if completed else 0.0
+        stats['run_seconds_avg'] = stats['run_seconds_total'] / completed if completed else 0.0
+        stats['max_workers'] = self.max_workers
+        stats['max_queue_depth'] = self.max_queue_depth
+        return stats